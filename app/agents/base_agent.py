@@ -6,14 +6,24 @@ Provides:
 - BaseAgent: Abstract base class for all agents with common functionality
 """
 
+import asyncio
+import inspect
+import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
 from loguru import logger
 
+# Retry policy for Claude rate limit (HTTP 429) responses
+RATE_LIMIT_MAX_RETRIES = 3
+RATE_LIMIT_BASE_DELAY_SECONDS = 1.0
 
-@dataclass
+# Default number of jobs processed concurrently by process_many()
+DEFAULT_PROCESS_CONCURRENCY = 16
+
+
+@dataclass(slots=True)
 class AgentResult:
     """
     Result from an agent execution.
@@ -135,16 +145,63 @@ class BaseAgent(ABC):
         """
         pass
 
-    async def _call_claude(self, prompt: str, system: str, model: str | None = None) -> str:
+    async def process_many(self, job_ids: list[str], concurrency: int = DEFAULT_PROCESS_CONCURRENCY) -> list[AgentResult | BaseException]:
+        """
+        Process several jobs with bounded concurrency.
+
+        Overlaps up to `concurrency` process() calls so Claude latency is not
+        paid one job at a time.
+
+        Args:
+            job_ids: UUIDs of the jobs to process
+            concurrency: Maximum number of jobs in flight (default: 16)
+
+        Returns:
+            Results in job_ids order; unexpected exceptions are returned in place
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def process_one(job_id: str) -> AgentResult:
+            async with semaphore:
+                return await self.process(job_id)
+
+        return await asyncio.gather(*(process_one(job_id) for job_id in job_ids), return_exceptions=True)
+
+    async def _create_message(self, **kwargs: Any) -> Any:
+        """
+        Send a Messages API request, retrying rate limit errors.
+
+        Retries HTTP 429 responses with jittered exponential backoff; all other
+        errors are raised immediately.
+
+        Args:
+            **kwargs: Arguments for messages.create
+
+        Returns:
+            Claude API response
+        """
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            try:
+                return await self._claude.messages.create(**kwargs)
+            except Exception as e:
+                if getattr(e, "status_code", None) != 429 or attempt == RATE_LIMIT_MAX_RETRIES:
+                    raise
+                delay = RATE_LIMIT_BASE_DELAY_SECONDS * (2**attempt) * (0.5 + random.random())
+                logger.warning(f"[{self.agent_name}] Claude rate limited, retrying in {delay:.1f}s (attempt {attempt + 1}/{RATE_LIMIT_MAX_RETRIES})")
+                await asyncio.sleep(delay)
+
+    async def _call_claude(self, prompt: str | list[dict[str, Any]], system: str | list[dict[str, Any]], model: str | None = None, max_tokens: int = 4096) -> str:
         """
         Call Claude API with error handling.
 
         Wraps the Anthropic API call with logging and error handling.
 
         Args:
-            prompt: User prompt to send to Claude
-            system: System prompt with instructions
+            prompt: User prompt to send to Claude, or a list of content blocks
+                (e.g. to mark a static prefix with cache_control)
+            system: System prompt with instructions, or a list of text blocks
             model: Claude model to use (defaults to self.model)
+            max_tokens: Maximum output tokens (default: 4096)
 
         Returns:
             Claude's text response
@@ -158,7 +215,7 @@ class BaseAgent(ABC):
         try:
             logger.debug(f"[{agent_name}] Calling Claude API with model: {model}")
 
-            response = await self._claude.messages.create(model=model, system=system, messages=[{"role": "user", "content": prompt}], max_tokens=4096)
+            response = await self._create_message(model=model, system=system, messages=[{"role": "user", "content": prompt}], max_tokens=max_tokens)
 
             text_response = response.content[0].text
             logger.debug(f"[{agent_name}] Claude API call successful")
@@ -169,6 +226,54 @@ class BaseAgent(ABC):
             logger.error(f"[{agent_name}] Claude API error: {e}")
             raise
 
+    async def _call_claude_tool(self, prompt: str | list[dict[str, Any]], system: str | list[dict[str, Any]], tool: dict[str, Any], model: str | None = None, max_tokens: int = 1024) -> dict[str, Any] | str:
+        """
+        Call Claude API forcing structured output through a single tool.
+
+        The tool's input_schema defines the expected output, so the response
+        needs no JSON extraction and cannot include prose wrappers.
+
+        Args:
+            prompt: User prompt to send to Claude, or a list of content blocks
+            system: System prompt with instructions, or a list of text blocks
+            tool: Tool definition with name, description and input_schema
+            model: Claude model to use (defaults to self.model)
+            max_tokens: Maximum output tokens (default: 1024)
+
+        Returns:
+            Tool input dictionary, Claude's text response if it answered without the tool,
+            or an empty string if the output was cut off at max_tokens
+
+        Raises:
+            Exception: If Claude API call fails (rate limit, network error, etc.)
+        """
+        model = model or self.model
+        agent_name = self.agent_name
+
+        try:
+            logger.debug(f"[{agent_name}] Calling Claude API with model: {model} (tool: {tool['name']})")
+
+            response = await self._create_message(
+                model=model, system=system, messages=[{"role": "user", "content": prompt}], max_tokens=max_tokens, tools=[tool], tool_choice={"type": "tool", "name": tool["name"]}
+            )
+
+            # A tool input cut off at max_tokens may be missing required fields, so callers treat it as unparseable
+            if getattr(response, "stop_reason", None) == "max_tokens":
+                logger.warning(f"[{agent_name}] Claude output reached max_tokens ({max_tokens}), discarding truncated tool input")
+                return ""
+
+            for block in response.content:
+                if getattr(block, "type", None) == "tool_use":
+                    logger.debug(f"[{agent_name}] Claude API call successful")
+                    return dict(block.input)
+
+            logger.warning(f"[{agent_name}] Claude did not use tool {tool['name']}, falling back to text response")
+            return str(response.content[0].text)
+
+        except Exception as e:
+            logger.error(f"[{agent_name}] Claude API error: {e}")
+            raise
+
     async def _update_current_stage(self, application_id: str, stage: str) -> None:
         """
         Update current processing stage in database.
@@ -199,6 +304,29 @@ class BaseAgent(ABC):
         except Exception as e:
             logger.error(f"Failed to add completed stage: {e}")
 
+    async def _apply_stage_result(self, application_id: str, stage: str, output: dict[str, Any], status: str | None = None) -> None:
+        """
+        Record a finished stage in a single database write.
+
+        Sets current_stage, appends the stage to completed_stages with its
+        output and, when given, updates status - replacing separate
+        _update_current_stage, _add_completed_stage and _update_status calls.
+
+        Args:
+            application_id: UUID of application tracking record
+            stage: Agent/stage name to mark complete
+            output: Agent output data to store
+            status: New status, or None to leave it unchanged
+        """
+        try:
+            # ApplicationRepository writes synchronously; async repositories return an awaitable
+            result = self._app_repo.apply_stage_result(application_id, stage, output, status)
+            if inspect.isawaitable(result):
+                await result
+            logger.debug(f"Applied stage result: {stage}")
+        except Exception as e:
+            logger.error(f"Failed to apply stage result: {e}")
+
     async def _store_stage_output(self, application_id: str, agent_name: str, output: dict[str, Any]) -> None:
         """
         Store agent output in stage_outputs.
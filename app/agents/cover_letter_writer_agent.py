@@ -103,7 +103,7 @@ class CoverLetterWriterAgent(BaseAgent):
 
             # Save cover letter
             output_path = output_dir / "Linus_McManamey_CL.docx"
-            self._create_cover_letter_docx(cl_text, output_path)
+            cl_document_text = self._create_cover_letter_docx(cl_text, output_path)
 
             # Validate output
             if not self._validate_output_file(output_path):
@@ -114,7 +114,7 @@ class CoverLetterWriterAgent(BaseAgent):
             file_size = output_path.stat().st_size
 
             # Build output
-            output = {"cl_file_path": str(output_path), "contact_person_name": contact_person, "extraction_method": extraction_method, "file_size_bytes": file_size}
+            output = {"cl_file_path": str(output_path), "cl_text": cl_document_text, "contact_person_name": contact_person, "extraction_method": extraction_method, "file_size_bytes": file_size}
 
             # Update database
             if hasattr(self._app_repo, "update_cl_file_path"):
@@ -271,15 +271,17 @@ OUTPUT FORMAT (plain text only, no JSON):
             logger.error(f"[cover_letter_writer] Claude API error: {e}")
             raise
 
-    def _create_cover_letter_docx(self, cl_text: str, output_path: Path) -> None:
-        """Create cover letter DOCX from text."""
+    def _create_cover_letter_docx(self, cl_text: str, output_path: Path) -> str:
+        """Create cover letter DOCX from text and return the document text as QA will read it."""
         try:
             doc = Document()
+            paragraphs = []
 
             # Add paragraphs from text
             for paragraph_text in cl_text.split("\n\n"):
                 if paragraph_text.strip():
-                    p = doc.add_paragraph(paragraph_text.strip())
+                    paragraphs.append(paragraph_text.strip())
+                    p = doc.add_paragraph(paragraphs[-1])
                     # Set font
                     for run in p.runs:
                         run.font.name = "Calibri"
@@ -287,6 +289,7 @@ OUTPUT FORMAT (plain text only, no JSON):
 
             doc.save(output_path)
             logger.info(f"[cover_letter_writer] Saved CL: {output_path}")
+            return "\n".join(paragraphs)
 
         except Exception as e:
             logger.error(f"[cover_letter_writer] Failed to create CL DOCX: {e}")
@@ -127,6 +127,7 @@ class CVTailorAgent(BaseAgent):
             # Build output
             output = {
                 "cv_file_path": str(output_path),
+                "cv_text": cv_content,
                 "customization_notes": customizations.get("customization_notes", ""),
                 "sections_reordered": customizations.get("section_order", []),
                 "keywords_incorporated": customizations.get("keywords_to_add", []),
@@ -11,15 +11,99 @@ Uses Claude AI for intelligent matching with weighted scoring across:
 """
 
 import json
+import re
 import time
-from pathlib import Path
+from functools import lru_cache
 from typing import Any
 
-import yaml
 from rapidfuzz import fuzz
 from loguru import logger
 
 from app.agents.base_agent import AgentResult, BaseAgent
+from app.config import get_config
+
+# Bound once to skip attribute lookups inside the O(N*M) matching loops
+_fuzz_ratio = fuzz.ratio
+_json_loads = json.loads
+
+# Vendor prefixes stripped before comparing technology names
+_PREFIXES = ("apache ", "aws ", "azure ", "google ")
+
+
+@lru_cache(maxsize=32)
+def _compile_tech_pattern(technologies: tuple[str, ...]) -> re.Pattern[str] | None:
+    """
+    Compile a single alternation pattern matching any of the given technologies.
+
+    Longer names are tried first so "Azure Data Factory" wins over "Azure".
+    Compiled once per criteria set and reused across jobs.
+
+    Args:
+        technologies: Technology names from search criteria
+
+    Returns:
+        Compiled pattern for lowercased text, or None if there is nothing to match
+    """
+    names = sorted({tech.strip().lower() for tech in technologies if tech and tech.strip()}, key=len, reverse=True)
+    if not names:
+        return None
+    alternation = "|".join(re.escape(name) for name in names)
+    return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)")
+
+
+def scan_technologies(job_text_lower: str, technologies: list[str]) -> list[str]:
+    """
+    Find technologies mentioned verbatim in lowercased job text.
+
+    Performs a single scan over the text with a precompiled alternation
+    instead of one search per technology.
+
+    Args:
+        job_text_lower: Lowercased job title and description
+        technologies: Technology names to look for (original casing)
+
+    Returns:
+        Technologies found, in criteria order and original casing
+    """
+    pattern = _compile_tech_pattern(tuple(technologies))
+    if pattern is None:
+        return []
+
+    hits = set(pattern.findall(job_text_lower))
+    return [tech for tech in technologies if tech.strip().lower() in hits]
+
+
+_SCORE_JOB_TOOL: dict[str, Any] = {
+    "name": "score_job",
+    "description": "Record which candidate technologies the job mentions and how its location matches.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "must_have_found": {"type": "array", "items": {"type": "string"}, "description": "Must-have technologies mentioned"},
+            "must_have_missing": {"type": "array", "items": {"type": "string"}, "description": "Must-have technologies not mentioned"},
+            "strong_pref_found": {"type": "array", "items": {"type": "string"}, "description": "Strong preference technologies mentioned"},
+            "nice_to_have_found": {"type": "array", "items": {"type": "string"}, "description": "Nice-to-have technologies mentioned"},
+            "location_assessment": {"type": "string", "enum": ["primary", "acceptable", "no_match"]},
+            "reasoning": {"type": "string", "description": "Brief explanation (30 words or fewer)"},
+        },
+        "required": ["must_have_found", "must_have_missing", "strong_pref_found", "nice_to_have_found", "location_assessment", "reasoning"],
+    },
+}
+
+# Output budget for the score_job tool call: keys, location and reasoning, plus room for every
+# criteria technology to be listed once (must-haves go in either found or missing)
+_BASE_OUTPUT_TOKENS = 256
+_OUTPUT_TOKENS_PER_TECHNOLOGY = 4
+
+
+def _empty_match() -> dict[str, Any]:
+    """Return the score_job result used when Claude's output can't be used."""
+    return {"must_have_found": [], "must_have_missing": [], "strong_pref_found": [], "nice_to_have_found": [], "location_assessment": "no_match", "reasoning": "Failed to parse matching results"}
+
+
+# Matching is structured extraction, so a fast tier handles it; ambiguous results escalate
+_DEFAULT_MODEL = "claude-haiku-4-5"
+_DEFAULT_ESCALATION_MODEL = "claude-sonnet-4"
 
 
 class JobMatcherAgent(BaseAgent):
@@ -34,6 +118,7 @@ class JobMatcherAgent(BaseAgent):
         _search_criteria: Cached search criteria from search.yaml
         _scoring_weights: Scoring weights from agents.yaml
         _match_threshold: Minimum score to approve job (default: 0.70)
+        _escalation_model: Larger model used to re-check ambiguous results
     """
 
     def __init__(self, config: dict[str, Any], claude_client: Any, app_repository: Any):
@@ -49,12 +134,25 @@ class JobMatcherAgent(BaseAgent):
         self._search_criteria: dict[str, Any] | None = None
         self._scoring_weights = config.get("scoring_weights", {"must_have_present": 0.50, "strong_preference_present": 0.30, "nice_to_have_present": 0.10, "location_match": 0.10})
         self._match_threshold = config.get("match_threshold", 0.70)
+        self._escalation_model = config.get("escalation_model", _DEFAULT_ESCALATION_MODEL)
 
     @property
     def agent_name(self) -> str:
         """Return agent name."""
         return "job_matcher"
 
+    @property
+    def model(self) -> str:
+        """
+        Return Claude model to use for this agent.
+
+        Reads from configuration, defaults to claude-haiku-4-5 if not specified.
+
+        Returns:
+            Claude model name
+        """
+        return str(self._config.get("model", _DEFAULT_MODEL))
+
     async def process(self, job_id: str) -> AgentResult:
         """
         Process a job through the matching agent.
@@ -84,18 +182,28 @@ class JobMatcherAgent(BaseAgent):
                 logger.error(f"[job_matcher] Job not found: {job_id}")
                 return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=f"Job not found: {job_id}", execution_time_ms=int((time.time() - start_time) * 1000))
 
+            # Lowercase the searchable job text once for all local matching
+            job_text_lower = f"{job_data.get('title') or ''}\n{job_data.get('description') or ''}".lower()
+
             # Load search criteria
             criteria = self._load_search_criteria()
 
-            # Update current stage
-            await self._update_current_stage(job_id, self.agent_name)
+            # Local verbatim scan (cheap, deterministic evidence for Claude's findings)
+            local_matches = self._prematch_technologies(job_text_lower, criteria)
 
             # Call Claude to analyze job
             claude_response = await self._analyze_job_with_claude(job_data, criteria)
 
-            # Parse Claude response
+            # Parse Claude response (tool output is already structured)
             parsed_response = self._parse_claude_response(claude_response)
 
+            # Re-check with the larger model when the fast tier looks wrong
+            if self._should_escalate(parsed_response, job_text_lower, criteria):
+                logger.info(f"[job_matcher] Escalating job {job_id} to {self._escalation_model}")
+                claude_response = await self._analyze_job_with_claude(job_data, criteria, model=self._escalation_model)
+                parsed_response = self._parse_claude_response(claude_response)
+            parsed_response = self._merge_local_matches(parsed_response, local_matches)
+
             # Calculate scores
             must_have_score = self._calculate_must_have_score(criteria["must_have"], parsed_response["must_have_found"])
 
@@ -111,23 +219,32 @@ class JobMatcherAgent(BaseAgent):
             # Make approval decision
             approved = final_score >= self._match_threshold
 
-            # Build output
+            # Build output (float scores for API compatibility, integer milli-scores for storage and ranking)
             output = {
                 "match_score": round(final_score, 3),
+                "match_score_milli": self._to_milli(final_score),
                 "approved": approved,
                 "must_have_found": parsed_response["must_have_found"],
                 "must_have_missing": parsed_response.get("must_have_missing", []),
                 "strong_pref_found": parsed_response["strong_pref_found"],
                 "nice_to_have_found": parsed_response["nice_to_have_found"],
                 "location_matched": parsed_response["location_assessment"],
-                "scoring_breakdown": {"must_have_score": round(must_have_score, 3), "strong_pref_score": round(strong_pref_score, 3), "nice_to_have_score": round(nice_to_have_score, 3), "location_score": round(location_score, 3)},
+                "scoring_breakdown": {
+                    "must_have_score": round(must_have_score, 3),
+                    "strong_pref_score": round(strong_pref_score, 3),
+                    "nice_to_have_score": round(nice_to_have_score, 3),
+                    "location_score": round(location_score, 3),
+                    "must_have_score_milli": self._to_milli(must_have_score),
+                    "strong_pref_score_milli": self._to_milli(strong_pref_score),
+                    "nice_to_have_score_milli": self._to_milli(nice_to_have_score),
+                    "location_score_milli": self._to_milli(location_score),
+                },
                 "reasoning": parsed_response.get("reasoning", ""),
             }
 
-            # Update database
+            # Update database (current stage, status and completed stage in one write)
             new_status = "matched" if approved else "rejected"
-            await self._update_status(job_id, new_status)
-            await self._add_completed_stage(job_id, self.agent_name, output)
+            await self._apply_stage_result(job_id, self.agent_name, output, status=new_status)
 
             # Log decision
             logger.info(f"[job_matcher] Job {job_id}: score={final_score:.3f}, approved={approved}, status={new_status}")
@@ -153,11 +270,9 @@ class JobMatcherAgent(BaseAgent):
         if self._search_criteria is not None:
             return self._search_criteria
 
-        config_path = Path("config/search.yaml")
-
         try:
-            with open(config_path) as f:
-                search_config = yaml.safe_load(f)
+            # Parsed once per process by the Config singleton
+            search_config = get_config().search
 
             technologies = search_config.get("technologies", {})
             locations = search_config.get("locations", {})
@@ -177,16 +292,81 @@ class JobMatcherAgent(BaseAgent):
             logger.error(f"[job_matcher] Failed to load search.yaml: {e}")
             raise
 
-    async def _analyze_job_with_claude(self, job_data: dict[str, Any], criteria: dict[str, Any]) -> str:
+    def _prematch_technologies(self, job_text_lower: str, criteria: dict[str, Any]) -> dict[str, list[str]]:
+        """
+        Scan the job text for technologies mentioned verbatim.
+
+        Args:
+            job_text_lower: Lowercased job title and description
+            criteria: Search criteria with technology lists
+
+        Returns:
+            Dictionary with must_have_found, strong_pref_found, nice_to_have_found
+        """
+        return {
+            "must_have_found": scan_technologies(job_text_lower, criteria["must_have"]),
+            "strong_pref_found": scan_technologies(job_text_lower, criteria["strong_preference"]),
+            "nice_to_have_found": scan_technologies(job_text_lower, criteria["nice_to_have"]),
+        }
+
+    def _merge_local_matches(self, parsed_response: dict[str, Any], local_matches: dict[str, list[str]]) -> dict[str, Any]:
+        """
+        Add verbatim local matches that Claude did not report.
+
+        Args:
+            parsed_response: Parsed Claude response
+            local_matches: Output of _prematch_technologies
+
+        Returns:
+            Parsed response with found lists extended by local matches
+        """
+        for key, local_found in local_matches.items():
+            found = list(parsed_response.get(key) or [])
+            for tech in local_found:
+                if not any(self._is_fuzzy_match(tech, found_tech) for found_tech in found):
+                    found.append(tech)
+            parsed_response[key] = found
+
+        if local_matches.get("must_have_found") and parsed_response.get("must_have_missing"):
+            parsed_response["must_have_missing"] = [tech for tech in parsed_response["must_have_missing"] if not any(self._is_fuzzy_match(tech, found_tech) for found_tech in local_matches["must_have_found"])]
+
+        return parsed_response
+
+    def _should_escalate(self, parsed_response: dict[str, Any], job_text_lower: str, criteria: dict[str, Any]) -> bool:
+        """
+        Decide whether a result should be re-checked with the escalation model.
+
+        Escalates when Claude reported no location match although the primary
+        location appears verbatim in the job text.
+
+        Args:
+            parsed_response: Parsed Claude response
+            job_text_lower: Lowercased job title and description
+            criteria: Search criteria
+
+        Returns:
+            True if the job should be re-analyzed with the escalation model
+        """
+        if not self._escalation_model or self._escalation_model == self.model:
+            return False
+
+        if parsed_response.get("location_assessment") != "no_match":
+            return False
+
+        primary_location = (criteria.get("primary_location") or "").lower()
+        return bool(primary_location) and primary_location in job_text_lower
+
+    async def _analyze_job_with_claude(self, job_data: dict[str, Any], criteria: dict[str, Any], model: str | None = None) -> dict[str, Any] | str:
         """
         Call Claude to analyze job against criteria.
 
         Args:
             job_data: Job information from database
             criteria: Search criteria with technology and location preferences
+            model: Claude model to use (defaults to self.model)
 
         Returns:
-            Claude's JSON response as string
+            Structured score_job tool output, or Claude's text response if the tool was not used
         """
         prompt = self._build_matching_prompt(job_data, criteria)
 
@@ -194,11 +374,25 @@ class JobMatcherAgent(BaseAgent):
 Analyze the job description and identify which technologies are mentioned.
 Consider variations and related technologies (e.g., "Spark", "PySpark", "Apache Spark").
 Be case-insensitive in matching.
-Return your analysis as valid JSON only, no additional text."""
+Report your analysis with the score_job tool only."""
 
-        response = await self._call_claude(prompt, system_prompt)
+        response = await self._call_claude_tool(prompt, system_prompt, _SCORE_JOB_TOOL, model=model, max_tokens=self._output_token_budget(criteria))
         return response
 
+    def _output_token_budget(self, criteria: dict[str, Any]) -> int:
+        """
+        Size the score_job output budget from the search criteria.
+
+        Args:
+            criteria: Search criteria with technology lists
+
+        Returns:
+            Maximum output tokens for the tool call
+        """
+        technologies = (*criteria["must_have"], *criteria["strong_preference"], *criteria["nice_to_have"])
+        # Roughly two characters per token keeps unusual names and quoting overhead inside the budget
+        return _BASE_OUTPUT_TOKENS + sum(len(tech) // 2 + _OUTPUT_TOKENS_PER_TECHNOLOGY for tech in technologies)
+
     def _build_matching_prompt(self, job_data: dict[str, Any], criteria: dict[str, Any]) -> str:
         """
         Build prompt for Claude to analyze job matching.
@@ -234,29 +428,26 @@ TASK:
 Analyze the job description and identify which technologies are mentioned.
 For each technology category, list the technologies you found.
 For location, determine if it matches "primary", "acceptable", or "no_match".
-
-OUTPUT FORMAT (JSON only):
-{{
-  "must_have_found": ["Technology1", "Technology2"],
-  "must_have_missing": ["MissingTech"],
-  "strong_pref_found": ["Technology3"],
-  "nice_to_have_found": ["Technology4"],
-  "location_assessment": "primary|acceptable|no_match",
-  "reasoning": "Brief explanation of the match assessment"
-}}"""
+Keep the reasoning to 30 words or fewer."""
 
         return prompt
 
-    def _parse_claude_response(self, response: str) -> dict[str, Any]:
+    def _parse_claude_response(self, response: dict[str, Any] | str) -> dict[str, Any]:
         """
-        Parse Claude's JSON response.
+        Parse Claude's score_job output or JSON response.
+
+        Fields missing from a partial result are filled with the empty-match
+        defaults, so scoring never fails on a missing key.
 
         Args:
-            response: JSON string from Claude
+            response: score_job tool input, or JSON string from Claude
 
         Returns:
             Parsed dictionary with match data
         """
+        if isinstance(response, dict):
+            return self._fill_missing_fields(response)
+
         try:
             # Extract JSON from response (Claude sometimes adds markdown)
             if "```json" in response:
@@ -268,13 +459,27 @@ OUTPUT FORMAT (JSON only):
                 end = response.find("```", start)
                 response = response[start:end].strip()
 
-            parsed = json.loads(response)
-            return parsed
+            parsed = _json_loads(response)
+            if not isinstance(parsed, dict):
+                raise json.JSONDecodeError("Expected a JSON object", response, 0)
+            return self._fill_missing_fields(parsed)
 
         except json.JSONDecodeError as e:
             logger.error(f"[job_matcher] Failed to parse Claude response: {e}")
             # Return empty match if parsing fails
-            return {"must_have_found": [], "must_have_missing": [], "strong_pref_found": [], "nice_to_have_found": [], "location_assessment": "no_match", "reasoning": "Failed to parse matching results"}
+            return _empty_match()
+
+    def _fill_missing_fields(self, parsed: dict[str, Any]) -> dict[str, Any]:
+        """
+        Fill fields that are missing or null with the empty-match defaults.
+
+        Args:
+            parsed: Tool input or parsed JSON from Claude
+
+        Returns:
+            Match data with every score_job field present
+        """
+        return {**_empty_match(), **{key: value for key, value in parsed.items() if value is not None}}
 
     def _calculate_must_have_score(self, must_have_list: list[str], found: list[str]) -> float:
         """
@@ -371,6 +576,19 @@ OUTPUT FORMAT (JSON only):
 
         return final_score
 
+    @staticmethod
+    def _to_milli(score: float) -> int:
+        """
+        Quantize a 0.0-1.0 score to an integer in thousandths.
+
+        Args:
+            score: Score between 0.0 and 1.0
+
+        Returns:
+            Integer score between 0 and 1000
+        """
+        return int(round(score * 1000))
+
     def _normalize_tech_name(self, tech: str) -> str:
         """
         Normalize technology name for matching.
@@ -385,11 +603,11 @@ OUTPUT FORMAT (JSON only):
         """
         tech = tech.lower().strip()
 
-        # Remove common prefixes
-        prefixes = ["apache ", "aws ", "azure ", "google "]
-        for prefix in prefixes:
-            if tech.startswith(prefix):
-                tech = tech[len(prefix) :]
+        # Remove the first matching vendor prefix (most names have none)
+        for prefix in _PREFIXES:
+            stripped = tech.removeprefix(prefix)
+            if stripped is not tech:
+                return stripped
 
         return tech
 
@@ -419,5 +637,5 @@ OUTPUT FORMAT (JSON only):
             return True
 
         # Fuzzy similarity match (threshold: 85%)
-        similarity = fuzz.ratio(norm1, norm2)
+        similarity = _fuzz_ratio(norm1, norm2)
         return similarity >= 85
@@ -8,22 +8,275 @@ CoverLetterWriter, QA) and makes decisions about job applications:
 - auto_reject: Skip application
 """
 
+import asyncio
+import hashlib
+import importlib.util
 import json
+import os
 import time
+from collections import Counter, OrderedDict
+from collections.abc import Coroutine, Mapping
+from types import MappingProxyType
 from typing import Any
 
+from anthropic import DEFAULT_CONNECTION_LIMITS, AsyncAnthropic, DefaultAsyncHttpxClient
 from loguru import logger
 
 from app.agents.base_agent import AgentResult, BaseAgent
+from app.serialization import json_loads
+
+# Keep-alive pool for an orchestrator-owned Claude client; HTTP/2 multiplexes batched calls when h2 is installed
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 120
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 # Required stages that must be completed before orchestrator
 REQUIRED_STAGES = ["job_matcher", "salary_validator", "cv_tailor", "cover_letter_writer", "qa"]
+_REQUIRED_STAGES: frozenset[str] = frozenset(REQUIRED_STAGES)
 
 # Decision rules
 AUTO_APPROVE_THRESHOLD = 85  # Match score >= 85% for auto-approve
 NEEDS_APPROVAL_THRESHOLD = 60  # Match score >= 60% needs human approval
 LOW_CONFIDENCE_THRESHOLD = 0.70  # Claude confidence < 70% needs human approval
 
+# Scores so extreme that Claude adds no signal; the rule decision is used directly
+CERTAIN_APPROVE_THRESHOLD = float(os.getenv("ORCHESTRATOR_CERTAIN_APPROVE", "95"))  # auto_approve with match score >= this
+CERTAIN_REJECT_THRESHOLD = float(os.getenv("ORCHESTRATOR_CERTAIN_REJECT", "30"))  # auto_reject with match score < this
+
+
+def _build_decision_table() -> tuple[str, ...]:
+    """
+    Precompute rule-based decisions for every combination of inputs.
+
+    Index bits: 0-1 match tier (0: < NEEDS_APPROVAL_THRESHOLD, 1: below
+    AUTO_APPROVE_THRESHOLD, 2: at or above it), 2 salary passed, 3 QA passed,
+    4 has warnings.
+
+    Returns:
+        Tuple of 32 decisions indexed by the encoded inputs
+    """
+    table = []
+    for key in range(32):
+        tier, salary_passed, qa_passed, has_warnings = key & 0b11, key & 0b100, key & 0b1000, key & 0b10000
+        if tier == 0 or not salary_passed or not qa_passed:
+            table.append("auto_reject")
+        elif tier >= 2 and not has_warnings:
+            table.append("auto_approve")
+        else:
+            table.append("needs_human_approval")
+    return tuple(table)
+
+
+_DECISION_TABLE = _build_decision_table()
+
+
+def _stages_complete(stage_outputs: Mapping[str, Any]) -> bool:
+    """
+    Check every required stage is present and non-empty, logging what is not.
+
+    Args:
+        stage_outputs: Dictionary of stage outputs from previous agents
+
+    Returns:
+        True if all required stages completed, False otherwise
+    """
+    missing = _REQUIRED_STAGES - stage_outputs.keys()
+    if missing:
+        logger.warning(f"[orchestrator] Missing required stages: {sorted(missing)}")
+        return False
+
+    empty = [stage for stage in REQUIRED_STAGES if not stage_outputs[stage]]
+    if empty:
+        logger.warning(f"[orchestrator] Empty required stages: {empty}")
+        return False
+
+    return True
+
+
+def _stage_metrics(match_output: Mapping[str, Any], salary_output: Mapping[str, Any], qa_output: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Collect the decision metrics from the matcher, salary and QA outputs.
+
+    Args:
+        match_output: job_matcher stage output
+        salary_output: salary_validator stage output
+        qa_output: qa stage output
+
+    Returns:
+        Dictionary of metrics; warning flags are only present when set
+    """
+    metrics = {"match_score": match_output.get("match_score", 0.0), "salary_passed": salary_output.get("passed", False), "qa_passed": qa_output.get("pass", False)}
+    if salary_output.get("warnings"):
+        metrics["salary_has_warnings"] = True
+    if any(i.get("severity") == "warning" for i in qa_output.get("issues") or ()):
+        metrics["qa_has_warnings"] = True
+    return metrics
+
+
+def _rule_decision(metrics: Mapping[str, Any]) -> str:
+    """
+    Look up the rule-based decision for a set of metrics in _DECISION_TABLE.
+
+    Args:
+        metrics: Metrics from _stage_metrics
+
+    Returns:
+        Decision string: auto_approve, needs_human_approval, or auto_reject
+    """
+    match_score = metrics["match_score"]
+    tier = 0 if match_score < NEEDS_APPROVAL_THRESHOLD else (1 if match_score < AUTO_APPROVE_THRESHOLD else 2)
+    has_warnings = bool(metrics.get("salary_has_warnings")) or bool(metrics.get("qa_has_warnings"))
+    key = tier | (bool(metrics["salary_passed"]) << 2) | (bool(metrics["qa_passed"]) << 3) | (has_warnings << 4)
+    return _DECISION_TABLE[key]
+
+
+# Decision lookup tables
+_STATUS_MAP: Mapping[str, str] = MappingProxyType({"auto_approve": "approved", "needs_human_approval": "pending_approval", "auto_reject": "rejected"})
+_ACTION_MAP: Mapping[str, str] = MappingProxyType({"auto_approve": "apply", "needs_human_approval": "review", "auto_reject": "skip"})
+
+# Safe defaults when Claude cannot provide a recommendation
+_FALLBACK_JSON_DECODE_ERROR: Mapping[str, Any] = MappingProxyType(
+    {"recommended_decision": "needs_human_approval", "reasoning": "Unable to get AI recommendation, defaulting to human review", "confidence": 0.50, "flagged_concerns": ("AI recommendation unavailable",)}
+)
+_FALLBACK_API_ERROR: Mapping[str, Any] = MappingProxyType(
+    {"recommended_decision": "needs_human_approval", "reasoning": "Error getting AI recommendation, defaulting to human review", "confidence": 0.50, "flagged_concerns": ("API error occurred",)}
+)
+_HARD_REJECT_RECOMMENDATION: Mapping[str, Any] = MappingProxyType({"recommended_decision": "auto_reject", "reasoning": "Skipped LLM: rule-based hard reject", "confidence": 1.0, "flagged_concerns": ()})
+_CERTAIN_APPROVE_RECOMMENDATION: Mapping[str, Any] = MappingProxyType({"recommended_decision": "auto_approve", "reasoning": "Skipped LLM: match score above certain-approve threshold", "confidence": 0.99, "flagged_concerns": ()})
+_CERTAIN_REJECT_RECOMMENDATION: Mapping[str, Any] = MappingProxyType({"recommended_decision": "auto_reject", "reasoning": "Skipped LLM: match score below certain-reject threshold", "confidence": 0.99, "flagged_concerns": ()})
+
+# Decision reasoning templates
+_AUTO_APPROVE_TEMPLATE = "Auto-approved: High match score ({}%), salary validation passed, QA passed with no critical issues."
+_LOW_MATCH_REJECT_TEMPLATE = "Auto-rejected: Low match score ({}% < {}% threshold)."
+_SALARY_REJECT_REASONING = "Auto-rejected: Salary validation failed."
+_QA_REJECT_REASONING = "Auto-rejected: Quality assurance failed."
+_CRITERIA_REJECT_REASONING = "Auto-rejected: Failed validation criteria."
+_HUMAN_REVIEW_TEMPLATE = "Human review required: Match score {}% (moderate fit)"
+
+
+def _parse_recommendation(data: Any) -> dict[str, Any]:
+    """
+    Validate a decoded Claude recommendation and fill in defaults in one pass.
+
+    Downstream code indexes the returned keys directly instead of repeating
+    .get() defaults.
+
+    Args:
+        data: Decoded JSON value from Claude
+
+    Returns:
+        Dictionary with recommended_decision, reasoning, confidence and a tuple of flagged_concerns
+
+    Raises:
+        ValueError: If data is not a JSON object
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+
+    decision = data.get("recommended_decision")
+    confidence = data.get("confidence")
+    reasoning = data.get("reasoning")
+    concerns = data.get("flagged_concerns")
+    return {
+        "recommended_decision": decision if decision in _STATUS_MAP else "needs_human_approval",
+        "reasoning": reasoning if isinstance(reasoning, str) else "",
+        "confidence": float(confidence) if isinstance(confidence, (int, float)) and not isinstance(confidence, bool) else 0.50,
+        "flagged_concerns": tuple(str(concern) for concern in concerns) if isinstance(concerns, (list, tuple)) else (),
+    }
+
+
+# Claude recommendation cache (bump PROMPT_VERSION whenever the prompt changes)
+PROMPT_VERSION = "v3"
+RECOMMENDATION_CACHE_SIZE = 1024
+
+# Rule-based auto_reject cannot be overridden by Claude, so skip the call. When disabled, Claude still
+# reviews auto_reject jobs unless their match score is below CERTAIN_REJECT_THRESHOLD
+SKIP_CLAUDE_ON_HARD_REJECT = os.getenv("ORCHESTRATOR_SKIP_CLAUDE_ON_HARD_REJECT", "true").lower() == "true"
+
+# Claude prompt templates, built once at import
+SYSTEM_PROMPT = "You are an expert orchestrator making data-driven decisions about job applications. Analyze all available data and provide a well-reasoned recommendation. Output valid JSON only."
+
+_PROMPT_INTRO = "You are an Orchestrator Agent making decisions about job applications. Analyze the job application data below and recommend whether to approve, request human review, or reject."
+
+_BATCH_PROMPT_INTRO = "You are an Orchestrator Agent making decisions about job applications. Analyze each of the job applications below independently and recommend whether to approve, request human review, or reject each one."
+
+# Placeholder values carry no signal for Claude, so their lines are left out of the prompt
+_PLACEHOLDER_VALUES = frozenset({"", "Unknown", "Not specified", "No reasoning provided", "No analysis"})
+
+
+def _present(value: Any) -> bool:
+    """Return True if a prompt field holds real data rather than a placeholder."""
+    return value is not None and not (isinstance(value, str) and value in _PLACEHOLDER_VALUES)
+
+
+def _render_job_section(job_title: Any, company_name: Any, location: Any, salary_range: Any, match_score: Any, match_reasoning: Any, salary_status: str, salary_analysis: Any, qa_status: str, qa_issue_count: int) -> str:
+    """
+    Render the per-job block of the Claude prompt.
+
+    Lines whose value is missing or a placeholder (see _PLACEHOLDER_VALUES)
+    are omitted; the JOB DETAILS heading is dropped when no detail is known.
+
+    Returns:
+        Prompt section for one job
+    """
+    details = [f"{label}: {value}" for label, value in (("Title", job_title), ("Company", company_name), ("Location", location), ("Salary", salary_range)) if _present(value)]
+    parts = ["JOB DETAILS:\n" + "\n".join(details) + "\n\n"] if details else []
+
+    parts.append(f"MATCH ANALYSIS (JobMatcher):\nMatch Score: {match_score}%\n")
+    if _present(match_reasoning):
+        parts.append(f"Reasoning: {match_reasoning}\n")
+
+    parts.append(f"\nSALARY ANALYSIS (SalaryValidator):\nStatus: {salary_status}\n")
+    if _present(salary_analysis):
+        parts.append(f"Analysis: {salary_analysis}\n")
+
+    parts.append(f"\nQUALITY ASSURANCE (QA):\nStatus: {qa_status}\nIssues Found: {qa_issue_count}")
+    return "".join(parts)
+
+
+_DECISION_CRITERIA = """DECISION CRITERIA:
+- Auto-Approve: Match ≥85%, Salary passed, QA passed, no warnings
+- Human Review: Match 60-84%, OR has warnings, OR unique characteristics
+- Auto-Reject: Match <60%, OR Salary failed, OR QA failed
+
+TASK:
+Recommend a decision and provide clear reasoning. Consider:
+1. Job quality and fit for candidate
+2. Validation results from previous agents
+3. Any red flags or concerns
+4. Likelihood of application success"""
+
+_OUTPUT_FORMAT = """OUTPUT FORMAT (JSON only):
+{
+  "recommended_decision": "auto_approve|needs_human_approval|auto_reject",
+  "reasoning": "Clear explanation of recommendation",
+  "confidence": 0.85,
+  "flagged_concerns": ["concern 1", "concern 2"]
+}"""
+
+_BATCH_OUTPUT_FORMAT = """OUTPUT FORMAT (JSON only):
+A JSON array with exactly one object per job, in the same order as the jobs above:
+[
+  {
+    "job": 1,
+    "recommended_decision": "auto_approve|needs_human_approval|auto_reject",
+    "reasoning": "Clear explanation of recommendation",
+    "confidence": 0.85,
+    "flagged_concerns": ["concern 1", "concern 2"]
+  }
+]"""
+
+# Prompt caching: the system prompt and the static instructions form a cacheable prefix,
+# so only the per-job data is processed as fresh input on repeat calls.
+# At roughly 250 tokens the prefix is below Claude's minimum cacheable length (1024+ tokens),
+# so the markers are inert until the instructions grow past it; they cost nothing meanwhile
+_SYSTEM_BLOCKS: list[dict[str, Any]] = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+_STATIC_PROMPT_BLOCK: dict[str, Any] = {"type": "text", "text": "\n\n".join((_PROMPT_INTRO, _DECISION_CRITERIA, _OUTPUT_FORMAT)), "cache_control": {"type": "ephemeral"}}
+_STATIC_BATCH_PROMPT_BLOCK: dict[str, Any] = {"type": "text", "text": "\n\n".join((_BATCH_PROMPT_INTRO, _DECISION_CRITERIA, _BATCH_OUTPUT_FORMAT)), "cache_control": {"type": "ephemeral"}}
+
+# Maximum jobs per batched Claude call (keeps the prompt well within context limits)
+BATCH_MAX_SIZE = 8
+
 
 class OrchestratorAgent(BaseAgent):
     """
@@ -37,8 +290,36 @@ class OrchestratorAgent(BaseAgent):
     - Combines decisions for final recommendation
     - Updates application status appropriately
     - Implements human-in-the-loop pattern
+    - Caches Claude recommendations by prompt content
     """
 
+    # Shared across instances: the pipeline creates a fresh agent per job
+    _recommendation_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+    # Recommendation cache hit/miss counts, shared like the cache itself
+    _cache_stats: Counter[str] = Counter()
+
+    def __init__(self, config: dict[str, Any], claude_client: Any | None, app_repository: Any):
+        """
+        Initialize Orchestrator Agent.
+
+        If no client is given, the agent creates its own AsyncAnthropic client
+        with a long-lived keep-alive pool so every Claude call reuses the same
+        TLS connections. Call close() on shutdown to release it.
+
+        Args:
+            config: Agent-specific configuration from agents.yaml
+            claude_client: Anthropic Claude API client (None to create a pooled one)
+            app_repository: ApplicationRepository for database access
+        """
+        self._owns_claude_client = claude_client is None
+        if claude_client is None:
+            # Built from the SDK's own Limits type so it matches the httpx flavour the SDK uses
+            limits = type(DEFAULT_CONNECTION_LIMITS)(max_connections=DEFAULT_CONNECTION_LIMITS.max_connections, max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS, keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS)
+            claude_client = AsyncAnthropic(http_client=DefaultAsyncHttpxClient(http2=_HTTP2_AVAILABLE, limits=limits))
+
+        super().__init__(config, claude_client, app_repository)
+        self._pending_writes: set[asyncio.Task] = set()
+
     @property
     def agent_name(self) -> str:
         """Return agent name."""
@@ -54,78 +335,255 @@ class OrchestratorAgent(BaseAgent):
         Returns:
             AgentResult with success status, decision, reasoning
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Validate job_id
             if not job_id:
                 logger.error("[orchestrator] Missing job_id parameter")
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Missing job_id parameter", execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Missing job_id parameter", execution_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000)
 
-            # Load job data
+            # Load job data and stage outputs concurrently
             logger.info(f"[orchestrator] Processing job: {job_id}")
-            job_data = await self._app_repo.get_job_by_id(job_id)
+            job_data, stage_outputs = await asyncio.gather(self._app_repo.get_job_by_id(job_id), self._app_repo.get_stage_outputs(job_id))
 
             if not job_data:
                 logger.error(f"[orchestrator] Job not found: {job_id}")
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=f"Job not found: {job_id}", execution_time_ms=int((time.time() - start_time) * 1000))
-
-            # Update current stage
-            await self._update_current_stage(job_id, self.agent_name)
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=f"Job not found: {job_id}", execution_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000)
 
-            # Load stage outputs
-            stage_outputs = await self._app_repo.get_stage_outputs(job_id)
+            # Update current stage (background write, not needed for the decision)
+            self._schedule_write(self._update_current_stage(job_id, self.agent_name))
 
-            # Verify all required stages completed
-            if not self._verify_required_stages(stage_outputs):
+            # Verify stages, extract metrics and apply rule-based decision logic in one pass
+            stages_ok, metrics, rule_decision = self._evaluate(stage_outputs)
+            if not stages_ok:
                 logger.error(f"[orchestrator] Job {job_id}: Not all required stages completed")
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Not all required stages completed. Cannot make decision.", execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Not all required stages completed. Cannot make decision.", execution_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000)
+
+            logger.opt(lazy=True).debug("[orchestrator] Rule-based decision: {} (metrics={})", lambda: rule_decision, lambda: metrics)
+
+            # Get Claude recommendation (not needed for a hard rule-based reject)
+            claude_rec = self._rule_based_recommendation(rule_decision, metrics)
+            if claude_rec is None:
+                claude_rec = await self._get_claude_recommendation(job_data, stage_outputs)
+
+            return self._finalize_decision(job_id, metrics, rule_decision, claude_rec, start_ns)
+
+        except Exception as e:
+            logger.error(f"[orchestrator] Error processing job {job_id}: {e}")
+            execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+            return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=str(e), execution_time_ms=execution_time_ms)
 
-            # Extract key metrics
-            metrics = self._extract_metrics(stage_outputs)
+    async def process_batch(self, job_ids: list[str]) -> list[AgentResult]:
+        """
+        Process several jobs, sharing one Claude call per batch.
 
-            # Apply rule-based decision logic
-            rule_decision = self._apply_decision_rules(metrics)
-            logger.debug(f"[orchestrator] Rule-based decision: {rule_decision} (metrics={metrics})")
+        Jobs are grouped into batches of up to BATCH_MAX_SIZE. Jobs that need a
+        Claude recommendation within a batch are sent in a single request; if
+        the batched response cannot be used, each job falls back to its own call.
 
-            # Get Claude recommendation
-            claude_rec = await self._get_claude_recommendation(job_data, stage_outputs)
-            logger.debug(f"[orchestrator] Claude recommendation: {claude_rec}")
+        Args:
+            job_ids: UUIDs of the jobs to process
 
-            # Combine decisions
-            final_decision = self._combine_decisions(rule_decision, claude_rec)
-            logger.info(f"[orchestrator] Final decision for job {job_id}: {final_decision}")
+        Returns:
+            AgentResult per job, in job_ids order
+        """
+        results: list[AgentResult] = []
+        for offset in range(0, len(job_ids), BATCH_MAX_SIZE):
+            results.extend(await self._process_batch_chunk(job_ids[offset : offset + BATCH_MAX_SIZE]))
+        return results
 
-            # Generate reasoning
-            reasoning = self._generate_reasoning(final_decision, metrics, claude_rec)
+    async def _process_batch_chunk(self, job_ids: list[str]) -> list[AgentResult]:
+        """
+        Process up to BATCH_MAX_SIZE jobs with at most one batched Claude call.
 
-            # Build output
-            output = {
-                "decision": final_decision,
-                "reasoning": reasoning,
-                "confidence": claude_rec.get("confidence", 0.80),
-                "match_score": metrics["match_score"],
-                "salary_passed": metrics["salary_passed"],
-                "qa_passed": metrics["qa_passed"],
-                "flagged_concerns": claude_rec.get("flagged_concerns", []),
-                "recommended_action": self._decision_to_action(final_decision),
-            }
+        Args:
+            job_ids: UUIDs of the jobs to process
 
-            # Update database
-            await self._update_database(job_id, output)
-            await self._add_completed_stage(job_id, self.agent_name, output)
+        Returns:
+            AgentResult per job, in job_ids order
+        """
+        # Each job's time covers the shared load, its own evaluation and, if it waited on it, the batched Claude call
+        load_start_ns = time.perf_counter_ns()
+        results: dict[int, AgentResult] = {}
+        pending: list[tuple[int, dict[str, Any], str, dict[str, Any], str, int]] = []
+
+        loaded = await asyncio.gather(*(asyncio.gather(self._app_repo.get_job_by_id(job_id), self._app_repo.get_stage_outputs(job_id)) for job_id in job_ids), return_exceptions=True)
+        load_ns = time.perf_counter_ns() - load_start_ns
+
+        for index, (job_id, job_load) in enumerate(zip(job_ids, loaded)):
+            start_ns = time.perf_counter_ns() - load_ns
+            job_data: Any = None
+            stage_outputs: dict[str, Any] = {}
+            if not isinstance(job_load, BaseException) and isinstance(job_load[1], dict):
+                job_data, stage_outputs = job_load
+            stages_ok, metrics, rule_decision = self._evaluate(stage_outputs) if stage_outputs else (False, {}, "")
+            if not stages_ok or not job_id or not job_data:
+                # process() reports missing ids, missing jobs and incomplete stages consistently
+                results[index] = await self.process(job_id)
+                continue
+
+            self._schedule_write(self._update_current_stage(job_id, self.agent_name))
+
+            claude_rec = self._rule_based_recommendation(rule_decision, metrics)
+            if claude_rec is None:
+                fields = self._prompt_fields(job_data, stage_outputs)
+                claude_rec = self._cached_recommendation(self._recommendation_cache_key(fields))
+            if claude_rec is not None:
+                results[index] = self._finalize_decision(job_id, metrics, rule_decision, claude_rec, start_ns)
+                continue
+
+            pending.append((index, metrics, rule_decision, fields, job_id, time.perf_counter_ns() - start_ns))
+
+        batch_start_ns = time.perf_counter_ns()
+        recommendations = await self._get_batch_recommendations([fields for _, _, _, fields, _, _ in pending])
+        for (index, metrics, rule_decision, _, job_id, elapsed_ns), claude_rec in zip(pending, recommendations):
+            # Shift the start so the time other jobs spent in the loop above is not counted
+            results[index] = self._finalize_decision(job_id, metrics, rule_decision, claude_rec, batch_start_ns - elapsed_ns)
+
+        return [results[index] for index in range(len(job_ids))]
+
+    def _rule_based_recommendation(self, rule_decision: str, metrics: dict[str, Any]) -> Mapping[str, Any] | None:
+        """
+        Return a recommendation that makes the Claude call unnecessary, if any.
 
-            logger.info(f"[orchestrator] Job {job_id}: Decision={final_decision}, Action={output['recommended_action']}")
+        Claude is skipped for hard rejects and for match scores at the
+        extremes (see CERTAIN_APPROVE_THRESHOLD / CERTAIN_REJECT_THRESHOLD).
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
+        Args:
+            rule_decision: Decision from rule-based logic
+            metrics: Extracted metrics
 
-            return AgentResult(success=True, agent_name=self.agent_name, output=output, error_message=None, execution_time_ms=execution_time_ms)
+        Returns:
+            Synthetic recommendation, or None if Claude should be asked
+        """
+        if rule_decision == "auto_reject":
+            if SKIP_CLAUDE_ON_HARD_REJECT:
+                return _HARD_REJECT_RECOMMENDATION
+            if metrics["match_score"] < CERTAIN_REJECT_THRESHOLD:
+                return _CERTAIN_REJECT_RECOMMENDATION
+        elif rule_decision == "auto_approve" and metrics["match_score"] >= CERTAIN_APPROVE_THRESHOLD:
+            # auto_approve already implies salary and QA passed with no warnings
+            return _CERTAIN_APPROVE_RECOMMENDATION
+        return None
+
+    def _finalize_decision(self, job_id: str, metrics: dict[str, Any], rule_decision: str, claude_rec: Mapping[str, Any], start_ns: int) -> AgentResult:
+        """
+        Combine decisions, schedule database writes and build the result.
 
-        except Exception as e:
-            logger.error(f"[orchestrator] Error processing job {job_id}: {e}")
-            execution_time_ms = int((time.time() - start_time) * 1000)
+        Args:
+            job_id: Job ID
+            metrics: Extracted metrics
+            rule_decision: Decision from rule-based logic
+            claude_rec: Claude (or synthetic) recommendation
+            start_ns: Processing start time from time.perf_counter_ns()
 
-            return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=str(e), execution_time_ms=execution_time_ms)
+        Returns:
+            Successful AgentResult with the decision output
+        """
+        logger.opt(lazy=True).debug("[orchestrator] Claude recommendation: {}", lambda: dict(claude_rec))
+
+        # Combine decisions
+        final_decision = self._combine_decisions(rule_decision, claude_rec)
+        logger.info(f"[orchestrator] Final decision for job {job_id}: {final_decision}")
+
+        # Generate reasoning
+        reasoning = self._generate_reasoning(final_decision, metrics, claude_rec)
+
+        output = self._build_output(final_decision, reasoning, claude_rec, metrics)
+
+        # Update database in the background; flush() awaits outstanding writes
+        self._schedule_write(self._update_database(job_id, output))
+        self._schedule_write(self._add_completed_stage(job_id, self.agent_name, output))
+
+        logger.info(f"[orchestrator] Job {job_id}: Decision={final_decision}, Action={output['recommended_action']}")
+
+        execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+        return AgentResult(success=True, agent_name=self.agent_name, output=output, error_message=None, execution_time_ms=execution_time_ms)
+
+    def _build_output(self, final_decision: str, reasoning: str, claude_rec: Mapping[str, Any], metrics: dict[str, Any]) -> dict[str, Any]:
+        """
+        Build the orchestrator output for a successful decision.
+
+        Args:
+            final_decision: Combined decision
+            reasoning: Human-readable reasoning
+            claude_rec: Claude (or synthetic) recommendation
+            metrics: Extracted metrics
+
+        Returns:
+            Output dictionary stored on the AgentResult and in the database
+        """
+        return {
+            "decision": final_decision,
+            "reasoning": reasoning,
+            "confidence": claude_rec["confidence"],
+            "match_score": metrics["match_score"],
+            "salary_passed": metrics["salary_passed"],
+            "qa_passed": metrics["qa_passed"],
+            "flagged_concerns": tuple(claude_rec["flagged_concerns"]),
+            "recommended_action": self._decision_to_action(final_decision),
+        }
+
+    def _schedule_write(self, coro: Coroutine[Any, Any, None]) -> None:
+        """
+        Run a database write in the background without blocking the decision.
+
+        Args:
+            coro: Write coroutine to schedule
+        """
+        task = asyncio.create_task(coro)
+        self._pending_writes.add(task)
+        task.add_done_callback(self._on_write_done)
+
+    def _on_write_done(self, task: asyncio.Task) -> None:
+        """
+        Forget a finished background write and log its failure, if any.
+
+        Args:
+            task: Completed write task
+        """
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"[orchestrator] Background database write failed: {task.exception()}")
+
+    async def flush(self) -> None:
+        """
+        Wait for all background database writes to finish.
+
+        Call before shutdown so no decision is lost.
+        """
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+
+    async def close(self) -> None:
+        """
+        Flush background writes and release the pooled HTTP client, if owned.
+
+        A Claude client passed in by the caller is left open.
+        """
+        await self.flush()
+        if self._owns_claude_client:
+            await self._claude.close()
+            self._owns_claude_client = False
+
+    def _evaluate(self, stage_outputs: dict[str, Any]) -> tuple[bool, dict[str, Any], str]:
+        """
+        Verify stages, extract metrics and apply the decision rules in one call.
+
+        Args:
+            stage_outputs: Dictionary of stage outputs from previous agents
+
+        Returns:
+            Tuple of (all required stages completed, metrics, rule decision);
+            metrics and decision are empty when stages are incomplete
+        """
+        if not _stages_complete(stage_outputs):
+            return False, {}, ""
+        metrics = _stage_metrics(stage_outputs["job_matcher"], stage_outputs["salary_validator"], stage_outputs["qa"])
+        return True, metrics, _rule_decision(metrics)
 
     def _verify_required_stages(self, stage_outputs: dict[str, Any]) -> bool:
         """
@@ -137,11 +595,7 @@ class OrchestratorAgent(BaseAgent):
         Returns:
             True if all required stages completed, False otherwise
         """
-        for stage in REQUIRED_STAGES:
-            if stage not in stage_outputs or not stage_outputs[stage]:
-                logger.warning(f"[orchestrator] Missing required stage: {stage}")
-                return False
-        return True
+        return _stages_complete(stage_outputs)
 
     def _extract_metrics(self, stage_outputs: dict[str, Any]) -> dict[str, Any]:
         """
@@ -153,22 +607,7 @@ class OrchestratorAgent(BaseAgent):
         Returns:
             Dictionary of extracted metrics
         """
-        metrics = {"match_score": stage_outputs.get("job_matcher", {}).get("match_score", 0.0), "salary_passed": stage_outputs.get("salary_validator", {}).get("passed", False), "qa_passed": stage_outputs.get("qa", {}).get("pass", False)}
-
-        # Check for warnings in salary validator
-        salary_output = stage_outputs.get("salary_validator", {})
-        if "warnings" in salary_output and salary_output["warnings"]:
-            metrics["salary_has_warnings"] = True
-
-        # Check for warnings in QA
-        qa_output = stage_outputs.get("qa", {})
-        if "issues" in qa_output:
-            # Check if there are warning-level issues
-            warning_issues = [i for i in qa_output["issues"] if i.get("severity") == "warning"]
-            if warning_issues:
-                metrics["qa_has_warnings"] = True
-
-        return metrics
+        return _stage_metrics(stage_outputs.get("job_matcher") or {}, stage_outputs.get("salary_validator") or {}, stage_outputs.get("qa") or {})
 
     def _apply_decision_rules(self, metrics: dict[str, Any]) -> str:
         """
@@ -185,27 +624,9 @@ class OrchestratorAgent(BaseAgent):
         Returns:
             Decision string: auto_approve, needs_human_approval, or auto_reject
         """
-        match_score = metrics["match_score"]
-        salary_passed = metrics["salary_passed"]
-        qa_passed = metrics["qa_passed"]
-        has_warnings = metrics.get("salary_has_warnings", False) or metrics.get("qa_has_warnings", False)
-
-        # Auto-reject criteria
-        if match_score < NEEDS_APPROVAL_THRESHOLD:
-            return "auto_reject"
-        if not salary_passed:
-            return "auto_reject"
-        if not qa_passed:
-            return "auto_reject"
-
-        # Auto-approve criteria (high match, all passed, no warnings)
-        if match_score >= AUTO_APPROVE_THRESHOLD and salary_passed and qa_passed and not has_warnings:
-            return "auto_approve"
-
-        # Default to human approval for medium match or warnings
-        return "needs_human_approval"
+        return _rule_decision(metrics)
 
-    async def _get_claude_recommendation(self, job_data: dict[str, Any], stage_outputs: dict[str, Any]) -> dict[str, Any]:
+    async def _get_claude_recommendation(self, job_data: dict[str, Any], stage_outputs: dict[str, Any]) -> Mapping[str, Any]:
         """
         Get Claude decision support recommendation.
 
@@ -216,84 +637,176 @@ class OrchestratorAgent(BaseAgent):
         Returns:
             Dictionary with recommended_decision, reasoning, confidence, flagged_concerns
         """
-        # Extract key information
-        job_title = job_data.get("title", "Unknown")
-        company_name = job_data.get("company_name", "Unknown")
-        location = job_data.get("location", "Unknown")
-        salary_range = job_data.get("salary_range", "Not specified")
+        return await self._recommend_from_fields(self._prompt_fields(job_data, stage_outputs))
 
-        match_output = stage_outputs.get("job_matcher", {})
-        salary_output = stage_outputs.get("salary_validator", {})
-        qa_output = stage_outputs.get("qa", {})
-
-        match_score = match_output.get("match_score", 0)
-        match_reasoning = match_output.get("reasoning", "No reasoning provided")
+    async def _recommend_from_fields(self, fields: dict[str, Any], use_cache: bool = True) -> Mapping[str, Any]:
+        """
+        Get a Claude recommendation for one job from its prompt fields.
 
-        salary_status = "Passed" if salary_output.get("passed") else "Failed"
-        salary_analysis = salary_output.get("analysis", "No analysis")
+        Args:
+            fields: Prompt fields (from _prompt_fields)
+            use_cache: Whether to consult the recommendation cache first
 
-        qa_status = "Passed" if qa_output.get("pass") else "Failed"
-        qa_issues = qa_output.get("issues", [])
+        Returns:
+            Dictionary with recommended_decision, reasoning, confidence, flagged_concerns
+        """
+        cache_key = self._recommendation_cache_key(fields)
+        if use_cache:
+            cached = self._cached_recommendation(cache_key)
+            if cached is not None:
+                return cached
 
-        prompt = f"""You are an Orchestrator Agent making decisions about job applications. Analyze the following job application data and recommend whether to approve, request human review, or reject.
+        prompt = [_STATIC_PROMPT_BLOCK, {"type": "text", "text": _render_job_section(**fields)}]
 
-JOB DETAILS:
-Title: {job_title}
-Company: {company_name}
-Location: {location}
-Salary: {salary_range}
+        try:
+            response = await self._call_claude(prompt, _SYSTEM_BLOCKS)
+            logger.debug("[orchestrator] Claude response: {} chars", len(response))
 
-MATCH ANALYSIS (JobMatcher):
-Match Score: {match_score}%
-Reasoning: {match_reasoning}
+            # Parse and validate JSON response
+            return self._accept_recommendation(cache_key, _parse_recommendation(json_loads(response)))
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error(f"[orchestrator] Failed to parse Claude JSON response: {e}")
+            # Fallback to safe default
+            return _FALLBACK_JSON_DECODE_ERROR
+        except Exception as e:
+            logger.error(f"[orchestrator] Claude API error: {e}")
+            # Fallback to safe default
+            return _FALLBACK_API_ERROR
 
-SALARY ANALYSIS (SalaryValidator):
-Status: {salary_status}
-Analysis: {salary_analysis}
+    async def _get_batch_recommendations(self, batch_fields: list[dict[str, Any]]) -> list[Mapping[str, Any]]:
+        """
+        Get Claude recommendations for several jobs in a single request.
 
-QUALITY ASSURANCE (QA):
-Status: {qa_status}
-Issues Found: {len(qa_issues)}
+        Falls back to one request per job if the batched response is unusable.
+        Callers are expected to have checked the recommendation cache already.
 
-DECISION CRITERIA:
-- Auto-Approve: Match ≥85%, Salary passed, QA passed, no warnings
-- Human Review: Match 60-84%, OR has warnings, OR unique characteristics
-- Auto-Reject: Match <60%, OR Salary failed, OR QA failed
-
-TASK:
-Recommend a decision and provide clear reasoning. Consider:
-1. Job quality and fit for candidate
-2. Validation results from previous agents
-3. Any red flags or concerns
-4. Likelihood of application success
+        Args:
+            batch_fields: Prompt fields per job (from _prompt_fields)
 
-OUTPUT FORMAT (JSON only):
-{{
-  "recommended_decision": "auto_approve|needs_human_approval|auto_reject",
-  "reasoning": "Clear explanation of recommendation",
-  "confidence": 0.85,
-  "flagged_concerns": ["concern 1", "concern 2"]
-}}"""
+        Returns:
+            Recommendation per job, in batch_fields order
+        """
+        if len(batch_fields) <= 1:
+            return [await self._recommend_from_fields(fields, use_cache=False) for fields in batch_fields]
 
-        system_prompt = "You are an expert orchestrator making data-driven decisions about job applications. Analyze all available data and provide a well-reasoned recommendation. Output valid JSON only."
+        sections = (f"JOB {number}:\n{_render_job_section(**fields)}" for number, fields in enumerate(batch_fields, start=1))
+        prompt = [_STATIC_BATCH_PROMPT_BLOCK, {"type": "text", "text": "\n\n".join(sections)}]
 
         try:
-            response = await self._call_claude(prompt, system_prompt)
-            logger.debug(f"[orchestrator] Claude response: {len(response)} chars")
+            response = await self._call_claude(prompt, _SYSTEM_BLOCKS)
+            logger.debug("[orchestrator] Claude batch response: {} chars for {} jobs", len(response), len(batch_fields))
 
-            # Parse JSON response
-            result = json.loads(response)
-            return result
-        except json.JSONDecodeError as e:
-            logger.error(f"[orchestrator] Failed to parse Claude JSON response: {e}")
-            # Fallback to safe default
-            return {"recommended_decision": "needs_human_approval", "reasoning": "Unable to get AI recommendation, defaulting to human review", "confidence": 0.50, "flagged_concerns": ["AI recommendation unavailable"]}
+            results = json_loads(response)
+            if not isinstance(results, list) or len(results) != len(batch_fields):
+                raise ValueError(f"expected a JSON array of {len(batch_fields)} objects")
+
+            recommendations = [_parse_recommendation(result) for result in results]
+            return [self._accept_recommendation(self._recommendation_cache_key(fields), rec) for fields, rec in zip(batch_fields, recommendations)]
         except Exception as e:
-            logger.error(f"[orchestrator] Claude API error: {e}")
-            # Fallback to safe default
-            return {"recommended_decision": "needs_human_approval", "reasoning": "Error getting AI recommendation, defaulting to human review", "confidence": 0.50, "flagged_concerns": ["API error occurred"]}
+            logger.warning(f"[orchestrator] Batched Claude recommendation failed ({e}), falling back to per-job calls")
+            return [await self._recommend_from_fields(fields, use_cache=False) for fields in batch_fields]
+
+    def _prompt_fields(self, job_data: dict[str, Any], stage_outputs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Extract the values that determine the Claude prompt for a job.
+
+        Args:
+            job_data: Job information
+            stage_outputs: Previous agent outputs
+
+        Returns:
+            Dictionary of prompt fields
+        """
+        match_output = stage_outputs.get("job_matcher") or {}
+        salary_output = stage_outputs.get("salary_validator") or {}
+        qa_output = stage_outputs.get("qa") or {}
+
+        return {
+            "job_title": job_data.get("title", "Unknown"),
+            "company_name": job_data.get("company_name", "Unknown"),
+            "location": job_data.get("location", "Unknown"),
+            "salary_range": job_data.get("salary_range", "Not specified"),
+            "match_score": match_output.get("match_score", 0),
+            "match_reasoning": match_output.get("reasoning", "No reasoning provided"),
+            "salary_status": "Passed" if salary_output.get("passed") else "Failed",
+            "salary_analysis": salary_output.get("analysis", "No analysis"),
+            "qa_status": "Passed" if qa_output.get("pass") else "Failed",
+            "qa_issue_count": len(qa_output.get("issues") or ()),
+        }
+
+    def _accept_recommendation(self, cache_key: str, result: dict[str, Any]) -> Mapping[str, Any]:
+        """
+        Post-process a parsed Claude recommendation and cache it if confident.
+
+        Args:
+            cache_key: Content hash for the job's prompt
+            result: Recommendation from _parse_recommendation
+
+        Returns:
+            Recommendation to use for the decision
+        """
+        # Low confidence always ends in human review, so keep only what is reported
+        confidence = result["confidence"]
+        if confidence < LOW_CONFIDENCE_THRESHOLD:
+            return {"recommended_decision": "needs_human_approval", "confidence": confidence, "reasoning": result["reasoning"], "flagged_concerns": ()}
+
+        self._cache_recommendation(cache_key, result)
+        return result
 
-    def _combine_decisions(self, rule_decision: str, claude_rec: dict[str, Any]) -> str:
+    def _cached_recommendation(self, cache_key: str) -> dict[str, Any] | None:
+        """
+        Look up a cached Claude recommendation and record hit/miss counts.
+
+        Args:
+            cache_key: Content hash from _recommendation_cache_key
+
+        Returns:
+            Copy of the cached recommendation, or None on a miss
+        """
+        stats = self._cache_stats
+        cached = self._recommendation_cache.get(cache_key)
+        if cached is None:
+            stats["misses"] += 1
+            logger.debug("[orchestrator] Recommendation cache miss (hits={}, misses={})", stats["hits"], stats["misses"])
+            return None
+
+        self._recommendation_cache.move_to_end(cache_key)
+        stats["hits"] += 1
+        logger.debug("[orchestrator] Recommendation cache hit (hits={}, misses={})", stats["hits"], stats["misses"])
+        return dict(cached)
+
+    def _recommendation_cache_key(self, fields: dict[str, Any]) -> str:
+        """
+        Build a content hash over the inputs that determine the Claude prompt.
+
+        Args:
+            fields: Prompt fields (from _prompt_fields)
+
+        Returns:
+            Hex digest identifying the prompt content and version
+        """
+        payload = json.dumps({"prompt_version": PROMPT_VERSION, **fields}, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_recommendation(self, cache_key: str, recommendation: dict[str, Any]) -> None:
+        """
+        Store a Claude recommendation, evicting the least recently used entry.
+
+        Low-confidence recommendations are not cached so they are re-asked.
+
+        Args:
+            cache_key: Content hash from _recommendation_cache_key
+            recommendation: Parsed Claude recommendation
+        """
+        if not isinstance(recommendation, dict) or recommendation.get("confidence", 0.50) < LOW_CONFIDENCE_THRESHOLD:
+            return
+
+        self._recommendation_cache[cache_key] = dict(recommendation)
+        self._recommendation_cache.move_to_end(cache_key)
+        if len(self._recommendation_cache) > RECOMMENDATION_CACHE_SIZE:
+            self._recommendation_cache.popitem(last=False)
+
+    def _combine_decisions(self, rule_decision: str, claude_rec: Mapping[str, Any]) -> str:
         """
         Combine rule-based and Claude decisions into final decision.
 
@@ -304,29 +817,29 @@ OUTPUT FORMAT (JSON only):
 
         Args:
             rule_decision: Decision from rule-based logic
-            claude_rec: Claude recommendation dict
+            claude_rec: Recommendation with recommended_decision and confidence
 
         Returns:
             Final decision string
         """
-        claude_decision = claude_rec.get("recommended_decision", "needs_human_approval")
-        confidence = claude_rec.get("confidence", 0.50)
+        claude_decision = claude_rec["recommended_decision"]
+        confidence = claude_rec["confidence"]
 
         # Low confidence: defer to human
         if confidence < LOW_CONFIDENCE_THRESHOLD:
-            logger.debug(f"[orchestrator] Low Claude confidence ({confidence}), deferring to human")
+            logger.debug("[orchestrator] Low Claude confidence ({}), deferring to human", confidence)
             return "needs_human_approval"
 
         # Both agree: use that decision
         if rule_decision == claude_decision:
-            logger.debug(f"[orchestrator] Rule and Claude agree: {rule_decision} (confidence={confidence})")
+            logger.debug("[orchestrator] Rule and Claude agree: {} (confidence={})", rule_decision, confidence)
             return rule_decision
 
         # Conflict: defer to human for safety
-        logger.debug(f"[orchestrator] Conflict - Rule: {rule_decision}, Claude: {claude_decision}, deferring to human")
+        logger.debug("[orchestrator] Conflict - Rule: {}, Claude: {}, deferring to human", rule_decision, claude_decision)
         return "needs_human_approval"
 
-    def _generate_reasoning(self, decision: str, metrics: dict[str, Any], claude_rec: dict[str, Any] | None = None) -> str:
+    def _generate_reasoning(self, decision: str, metrics: dict[str, Any], claude_rec: Mapping[str, Any] | None = None) -> str:
         """
         Generate human-readable reasoning for the decision.
 
@@ -344,30 +857,30 @@ OUTPUT FORMAT (JSON only):
 
         # Base reasoning on decision type
         if decision == "auto_approve":
-            reasoning = f"Auto-approved: High match score ({match_score}%), salary validation passed, QA passed with no critical issues."
+            parts = [_AUTO_APPROVE_TEMPLATE.format(match_score)]
         elif decision == "auto_reject":
             if match_score < NEEDS_APPROVAL_THRESHOLD:
-                reasoning = f"Auto-rejected: Low match score ({match_score}% < {NEEDS_APPROVAL_THRESHOLD}% threshold)."
+                parts = [_LOW_MATCH_REJECT_TEMPLATE.format(match_score, NEEDS_APPROVAL_THRESHOLD)]
             elif not salary_passed:
-                reasoning = "Auto-rejected: Salary validation failed."
+                parts = [_SALARY_REJECT_REASONING]
             elif not qa_passed:
-                reasoning = "Auto-rejected: Quality assurance failed."
+                parts = [_QA_REJECT_REASONING]
             else:
-                reasoning = "Auto-rejected: Failed validation criteria."
+                parts = [_CRITERIA_REJECT_REASONING]
         else:  # needs_human_approval
-            reasoning = f"Human review required: Match score {match_score}% (moderate fit)"
+            parts = [_HUMAN_REVIEW_TEMPLATE.format(match_score)]
             if metrics.get("salary_has_warnings"):
-                reasoning += ", salary has warnings"
+                parts.append(", salary has warnings")
             if metrics.get("qa_has_warnings"):
-                reasoning += ", QA has warnings"
-            reasoning += "."
+                parts.append(", QA has warnings")
+            parts.append(".")
 
         # Append Claude reasoning if available
         if claude_rec and "reasoning" in claude_rec:
-            claude_reasoning = claude_rec["reasoning"]
-            reasoning += f" AI analysis: {claude_reasoning}"
+            parts.append(" AI analysis: ")
+            parts.append(claude_rec["reasoning"])
 
-        return reasoning
+        return "".join(parts)
 
     async def _update_database(self, job_id: str, output: dict[str, Any]) -> None:
         """
@@ -380,14 +893,12 @@ OUTPUT FORMAT (JSON only):
         decision = output["decision"]
 
         # Map decision to status
-        status_map = {"auto_approve": "approved", "needs_human_approval": "pending_approval", "auto_reject": "rejected"}
-
-        new_status = status_map.get(decision, "pending")
+        new_status = _STATUS_MAP.get(decision, "pending")
 
         # Update application status
         if hasattr(self._app_repo, "update_status"):
             await self._app_repo.update_status(job_id, new_status)
-            logger.debug(f"[orchestrator] Updated job {job_id} status to {new_status}")
+            logger.debug("[orchestrator] Updated job {} status to {}", job_id, new_status)
 
     def _decision_to_action(self, decision: str) -> str:
         """
@@ -399,5 +910,4 @@ OUTPUT FORMAT (JSON only):
         Returns:
             Action string: apply, review, or skip
         """
-        action_map = {"auto_approve": "apply", "needs_human_approval": "review", "auto_reject": "skip"}
-        return action_map.get(decision, "review")
+        return _ACTION_MAP.get(decision, "review")
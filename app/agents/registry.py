@@ -31,12 +31,10 @@ class AgentRegistry:
     6. orchestrator - Makes final approval decision
     7. form_handler - Submits application
 
-    Thread-safe singleton implementation ensures only one registry instance exists.
+    The singleton is created once at module import (imports are thread-safe),
+    so retrieving it needs no locking.
     """
 
-    _instance: "AgentRegistry | None" = None
-    _lock: threading.Lock = threading.Lock()
-
     def __init__(self):
         """
         Initialize agent registry.
@@ -44,24 +42,25 @@ class AgentRegistry:
         Note: Use get_instance() instead of calling this directly.
         """
         self._agents: dict[str, type[BaseAgent]] = {}
-        self._pipeline_order: list[str] = ["job_matcher", "salary_validator", "cv_tailor", "cover_letter_writer", "qa", "orchestrator", "form_handler"]
+        self._register_lock = threading.Lock()
+        # Classes already confirmed to inherit from BaseAgent
+        self._validated: set[type] = set()
+        self._pipeline_order: tuple[str, ...] = ("job_matcher", "salary_validator", "cv_tailor", "cover_letter_writer", "qa", "orchestrator", "form_handler")
+        # Successor of each agent in the pipeline (None for the last agent)
+        self._next: dict[str, str | None] = dict(zip(self._pipeline_order, (*self._pipeline_order[1:], None)))
 
     @classmethod
     def get_instance(cls) -> "AgentRegistry":
         """
         Get the singleton instance of AgentRegistry.
 
-        Thread-safe singleton pattern using double-checked locking.
+        The instance is created when this module is imported, so this is a
+        lock-free module global lookup.
 
         Returns:
             The singleton AgentRegistry instance
         """
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-                    logger.debug("AgentRegistry singleton instance created")
-        return cls._instance
+        return _REGISTRY
 
     def register(self, agent_name: str, agent_class: type[BaseAgent]) -> None:
         """
@@ -72,12 +71,22 @@ class AgentRegistry:
             agent_class: Agent class that inherits from BaseAgent
 
         Raises:
-            ValueError: If agent_class does not inherit from BaseAgent
+            ValueError: If agent_class does not inherit from BaseAgent, or
+                agent_name is already registered to a different class
         """
-        if not issubclass(agent_class, BaseAgent):
-            raise ValueError(f"{agent_class.__name__} must inherit from BaseAgent")
-
-        self._agents[agent_name] = agent_class
+        if agent_class not in self._validated:
+            if not issubclass(agent_class, BaseAgent):
+                raise ValueError(f"{agent_class.__name__} must inherit from BaseAgent")
+            self._validated.add(agent_class)
+
+        # Writes are serialised; reads stay lock-free (dict reads are atomic in CPython)
+        with self._register_lock:
+            existing = self._agents.get(agent_name)
+            if existing is agent_class:
+                return
+            if existing is not None:
+                raise ValueError(f"{agent_name} already registered to {existing.__name__}")
+            self._agents[agent_name] = agent_class
         logger.info(f"Registered agent: {agent_name}")
 
     def get_agent_class(self, agent_name: str) -> type[BaseAgent] | None:
@@ -102,22 +111,22 @@ class AgentRegistry:
         Returns:
             Name of next agent in pipeline, or None if current is last or not found
         """
-        try:
-            idx = self._pipeline_order.index(current_agent)
-            if idx < len(self._pipeline_order) - 1:
-                return self._pipeline_order[idx + 1]
-            return None  # Last agent in pipeline
-        except ValueError:
+        if current_agent not in self._next:
             logger.warning(f"Agent {current_agent} not found in pipeline order")
             return None
+        return self._next[current_agent]
 
-    def get_pipeline_order(self) -> list[str]:
+    def get_pipeline_order(self) -> tuple[str, ...]:
         """
         Get the agent execution order.
 
-        Returns a copy to prevent external modification of internal state.
+        The order is an immutable tuple, so it is returned without copying.
 
         Returns:
-            List of agent names in execution order
+            Tuple of agent names in execution order
         """
-        return self._pipeline_order.copy()
+        return self._pipeline_order
+
+
+# Module-level singleton; Python runs module initialisation exactly once
+_REGISTRY = AgentRegistry()
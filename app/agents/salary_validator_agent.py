@@ -7,16 +7,150 @@ minimum salary expectations. Unlike other agents, this is intentionally
 non-blocking - it flags concerns but allows jobs to proceed to the next stage.
 """
 
+import asyncio
 import json
 import re
 import time
-from pathlib import Path
+from collections.abc import Mapping
+from dataclasses import dataclass
+from decimal import Decimal
 from typing import Any
 
-import yaml
 from loguru import logger
 
 from app.agents.base_agent import AgentResult, BaseAgent
+from app.config import get_config
+from app.serialization import json_loads
+
+# Currency symbols, thousands separators and whitespace stripped from structured salary fields
+_CURRENCY_RE = re.compile(r"[$,\s]")
+# "k" thousands suffix, in either case
+_K_RE = re.compile(r"[kK]")
+
+# Salary extraction instructions, identical for every job
+_EXTRACTION_INSTRUCTIONS = """You are a Salary Extraction Agent. Extract the salary information from the job description that follows.
+
+TASK:
+Extract the salary or daily rate mentioned in the job description.
+Look for patterns like: "$X per day", "X/day", "$Xk annual", "$X-Y pa", etc.
+For salary ranges, use the midpoint.
+
+Report the result with the record_salary tool only. If no salary information is found, set salary_found to false."""
+
+_EXTRACTION_SYSTEM_PROMPT = "You are a salary extraction specialist. Parse job descriptions and extract salary information accurately. Report results with the record_salary tool only."
+
+# Structured output for salary extraction: Claude fills the tool input instead of writing JSON text
+_RECORD_SALARY_TOOL: dict[str, Any] = {
+    "name": "record_salary",
+    "description": "Record the salary or daily rate stated in the job description.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "salary_found": {"type": "boolean", "description": "Whether the description states a salary or rate"},
+            "amount": {"type": "number", "description": "Salary amount (midpoint for ranges)"},
+            "time_period": {"type": "string", "enum": ["daily", "annual"]},
+            "currency": {"type": "string", "description": "Currency code, e.g. AUD"},
+            "notes": {"type": "string", "description": "Where the salary was found, quoted briefly"},
+        },
+        "required": ["salary_found"],
+    },
+}
+
+# Output budget for the record_salary tool call; the schema needs far less than the default
+_MAX_OUTPUT_TOKENS = 256
+
+# Prompt caching: the system prompt and the static instructions form a cacheable prefix,
+# so only the job description is processed as fresh input on repeat calls
+_EXTRACTION_SYSTEM_BLOCKS = [{"type": "text", "text": _EXTRACTION_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+_EXTRACTION_INSTRUCTIONS_BLOCK = {"type": "text", "text": _EXTRACTION_INSTRUCTIONS, "cache_control": {"type": "ephemeral"}}
+
+
+def _extraction_prompt(description: str) -> list[dict[str, Any]]:
+    """Build the extraction prompt: the cached instructions followed by the job description."""
+    return [_EXTRACTION_INSTRUCTIONS_BLOCK, {"type": "text", "text": f"JOB DESCRIPTION:\n{description}"}]
+
+
+# Message Batches polling: batches trade latency for half-price tokens, so only multi-job runs use them
+BATCH_POLL_INTERVAL_SECONDS = 10.0
+BATCH_TIMEOUT_SECONDS = 3600.0
+
+
+# Dollar amounts stated with an explicit pay period, e.g. "$950 per day", "$800 - $1,000/day", "$120k-$140k p.a."
+_AMOUNT = r"(\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)\s*(k)?"
+_SALARY_RE = re.compile(
+    rf"\$\s*{_AMOUNT}(?:\s*(?:-|–|to)\s*\$?\s*{_AMOUNT})?\s*(?:\+\s*super(?:annuation)?\s*)?"
+    r"(?:(?P<daily>(?:/\s*|per\s+)(?:day|diem)\b|p/?d\b|daily\b)|(?P<annual>(?:/\s*|per\s+)(?:annum|year|yr)\b|p\.?\s?a\b\.?|annual(?:ly)?\b))",
+    re.IGNORECASE,
+)
+
+# Standard annual-to-daily conversion: 230 working days per year, stored as a reciprocal to multiply by
+WORKING_DAYS_PER_YEAR = 230
+_INV_WORKING_DAYS_PER_YEAR = 1.0 / WORKING_DAYS_PER_YEAR
+
+# Plausible ranges; anything outside is left for Claude to interpret
+_DAILY_RATE_RANGE = (100.0, 5000.0)
+_ANNUAL_SALARY_RANGE = (20000.0, 1000000.0)
+
+# Daily rate thresholds used when search.yaml omits them
+DEFAULT_MINIMUM_DAILY_RATE = 800.0
+DEFAULT_MAXIMUM_DAILY_RATE = 1500.0
+
+
+def _elapsed(start_ns: int) -> int:
+    """Return whole milliseconds since start_ns, a time.perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
+
+
+def _match_salary(description: str) -> dict[str, Any] | None:
+    """
+    Read a salary stated in a canonical format without calling Claude.
+
+    Ranges use their midpoint, and a "k" on either bound applies to both
+    ("$120-140k").
+
+    Args:
+        description: Job description text
+
+    Returns:
+        Extraction result in the record_salary shape, or None if no canonical
+        salary is present (or the amount is implausible for its period)
+    """
+    match = _SALARY_RE.search(description)
+    if match is None:
+        return None
+
+    low, low_k, high, high_k = match.group(1, 2, 3, 4)
+    multiplier = 1000.0 if low_k or high_k else 1.0
+    amount = float(low.replace(",", "")) * multiplier
+    if high is not None:
+        amount = (amount + float(high.replace(",", "")) * multiplier) / 2
+
+    time_period = "daily" if match.group("daily") else "annual"
+    lower, upper = _DAILY_RATE_RANGE if time_period == "daily" else _ANNUAL_SALARY_RANGE
+    if not lower <= amount <= upper:
+        return None
+    return {"salary_found": True, "amount": amount, "time_period": time_period, "currency": "AUD", "notes": f"Found in description as '{match.group().strip()}'"}
+
+
+@dataclass(frozen=True, slots=True)
+class SalaryExpectations:
+    """Daily rate thresholds from search.yaml, validated once at load."""
+
+    minimum: float = DEFAULT_MINIMUM_DAILY_RATE
+    maximum: float = DEFAULT_MAXIMUM_DAILY_RATE
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "SalaryExpectations":
+        """
+        Build thresholds from the salary_expectations section of search.yaml.
+
+        Raises:
+            ValueError: If a threshold is not a number or minimum exceeds maximum
+        """
+        expectations = cls(float(data.get("minimum", DEFAULT_MINIMUM_DAILY_RATE)), float(data.get("maximum", DEFAULT_MAXIMUM_DAILY_RATE)))
+        if expectations.minimum > expectations.maximum:
+            raise ValueError(f"salary_expectations minimum {expectations.minimum} exceeds maximum {expectations.maximum}")
+        return expectations
 
 
 class SalaryValidatorAgent(BaseAgent):
@@ -44,7 +178,7 @@ class SalaryValidatorAgent(BaseAgent):
             app_repository: ApplicationRepository for database access
         """
         super().__init__(config, claude_client, app_repository)
-        self._salary_expectations: dict[str, Any] | None = None
+        self._salary_expectations: SalaryExpectations | None = None
 
     @property
     def agent_name(self) -> str:
@@ -65,13 +199,13 @@ class SalaryValidatorAgent(BaseAgent):
         Returns:
             AgentResult with success status, salary details, and threshold validation
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Validate job_id
             if not job_id:
                 logger.error("[salary_validator] Missing job_id parameter")
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Missing job_id parameter", execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Missing job_id parameter", execution_time_ms=_elapsed(start_ns))
 
             # Load job data from database
             logger.info(f"[salary_validator] Processing job: {job_id}")
@@ -79,117 +213,180 @@ class SalaryValidatorAgent(BaseAgent):
 
             if not job_data:
                 logger.error(f"[salary_validator] Job not found: {job_id}")
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=f"Job not found: {job_id}", execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=f"Job not found: {job_id}", execution_time_ms=_elapsed(start_ns))
+
+            return await self._validate_job(job_id, job_data, start_ns)
 
-            # Update current stage
-            await self._update_current_stage(job_id, self.agent_name)
+        except Exception as e:
+            logger.error(f"[salary_validator] Error processing job {job_id}: {e}")
+            execution_time_ms = _elapsed(start_ns)
 
-            # Load salary expectations
-            expectations = self._load_salary_expectations()
+            return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=str(e), execution_time_ms=execution_time_ms)
 
-            # Try to extract salary from structured field first
-            salary_aud_per_day = None
-            extracted_from = "not_found"
+    async def process_batch(self, job_ids: list[str]) -> list[AgentResult]:
+        """
+        Process several jobs, extracting description salaries through one Message Batch.
 
-            structured_salary = job_data.get("salary_aud_per_day")
-            if structured_salary:
-                salary_aud_per_day = self._extract_from_structured_field(structured_salary)
-                if salary_aud_per_day is not None:
-                    extracted_from = "structured_field"
+        Jobs whose salary must come from the description are sent to Claude as
+        a single Message Batches request (half the token price of individual
+        calls). Everything else matches process().
 
-            # If not found in structured field, try extracting from description
-            if salary_aud_per_day is None:
-                description = job_data.get("description", "")
-                if description:
-                    extraction_result = await self._extract_from_description(description)
+        Args:
+            job_ids: UUIDs of the jobs to process
 
-                    if extraction_result.get("salary_found"):
-                        amount = extraction_result["amount"]
-                        time_period = extraction_result.get("time_period", "daily")
+        Returns:
+            AgentResult per job, in job_ids order
+        """
+        load_start_ns = time.perf_counter_ns()
+        loaded = await asyncio.gather(*(self._app_repo.get_job_by_id(job_id) for job_id in job_ids if job_id), return_exceptions=True)
+        jobs = iter(loaded)
+        job_datas = [next(jobs) if job_id else None for job_id in job_ids]
+        load_ns = time.perf_counter_ns() - load_start_ns
+
+        # Only jobs without a usable structured salary need Claude
+        descriptions = {index: job_data["description"] for index, job_data in enumerate(job_datas) if isinstance(job_data, dict) and job_data and self._needs_description_extraction(job_data)}
+        extraction_start_ns = time.perf_counter_ns()
+        extractions = dict(zip(descriptions, await self._extract_batch_from_descriptions(list(descriptions.values()))))
+        extraction_ns = time.perf_counter_ns() - extraction_start_ns
+
+        results = []
+        for index, (job_id, job_data) in enumerate(zip(job_ids, job_datas)):
+            # Each job's time covers the shared load, the batched extraction if it needed one, and its own validation
+            start_ns = time.perf_counter_ns() - load_ns - (extraction_ns if index in extractions else 0)
+            if not isinstance(job_data, dict) or not job_data:
+                # process() reports missing ids, missing jobs and load errors consistently
+                results.append(await self.process(job_id))
+                continue
+            try:
+                results.append(await self._validate_job(job_id, job_data, start_ns, extractions.get(index)))
+            except Exception as e:
+                logger.error(f"[salary_validator] Error processing job {job_id}: {e}")
+                results.append(AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=str(e), execution_time_ms=_elapsed(start_ns)))
+        return results
+
+    async def _validate_job(self, job_id: str, job_data: dict[str, Any], start_ns: int, extraction_result: dict[str, Any] | None = None) -> AgentResult:
+        """
+        Validate a loaded job's salary and record the stage.
 
-                        # Convert annual to daily if needed
-                        if time_period == "annual":
-                            salary_aud_per_day = self._convert_annual_to_daily(amount)
-                        else:
-                            salary_aud_per_day = amount
+        Args:
+            job_id: UUID of the job
+            job_data: Job record
+            start_ns: Processing start time from time.perf_counter_ns()
+            extraction_result: Description extraction already obtained (e.g. from a batch);
+                Claude is called directly when it is needed and not provided
 
-                        extracted_from = "job_description"
+        Returns:
+            Successful AgentResult with salary details and threshold validation
+        """
+        # Load salary expectations
+        expectations = self._load_salary_expectations()
 
-                        # Update jobs table with extracted salary
-                        await self._app_repo.update_job_salary(job_id, salary_aud_per_day)
+        # Structured field first: the common case, resolved without Claude or a jobs table write
+        structured_salary = job_data.get("salary_aud_per_day")
+        salary_aud_per_day = self._extract_from_structured_field(structured_salary) if structured_salary else None
+        if salary_aud_per_day is not None:
+            extracted_from = "structured_field"
+        else:
+            salary_aud_per_day, extracted_from = await self._salary_from_description(job_id, job_data.get("description", ""), extraction_result)
 
-            # Validate against threshold
-            meets_threshold, missing_salary = self._validate_threshold(salary_aud_per_day)
+        # Validate against threshold
+        meets_threshold, missing_salary = self._validate_threshold(salary_aud_per_day)
 
-            # Build output (non-blocking - no status change)
-            output = {
-                "salary_aud_per_day": salary_aud_per_day,
-                "currency": "AUD",
-                "meets_threshold": meets_threshold,
-                "missing_salary": missing_salary,
-                "extracted_from": extracted_from,
-                "minimum_threshold": expectations["minimum"],
-                "maximum_threshold": expectations["maximum"],
-            }
+        # Build output (non-blocking - no status change)
+        output = {
+            "salary_aud_per_day": salary_aud_per_day,
+            "currency": "AUD",
+            "meets_threshold": meets_threshold,
+            "missing_salary": missing_salary,
+            "extracted_from": extracted_from,
+            "minimum_threshold": expectations.minimum,
+            "maximum_threshold": expectations.maximum,
+        }
 
-            # Update database with stage completion
-            await self._add_completed_stage(job_id, self.agent_name, output)
+        # Record stage completion (current stage, completed stage and output in one write)
+        await self._apply_stage_result(job_id, self.agent_name, output)
 
-            # Log validation result
-            logger.info(f"[salary_validator] Job {job_id}: salary={salary_aud_per_day}, meets_threshold={meets_threshold}, missing={missing_salary}")
+        # Log validation result
+        logger.info(f"[salary_validator] Job {job_id}: salary={salary_aud_per_day}, meets_threshold={meets_threshold}, missing={missing_salary}")
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
+        execution_time_ms = _elapsed(start_ns)
 
-            return AgentResult(success=True, agent_name=self.agent_name, output=output, error_message=None, execution_time_ms=execution_time_ms)
+        return AgentResult(success=True, agent_name=self.agent_name, output=output, error_message=None, execution_time_ms=execution_time_ms)
 
-        except Exception as e:
-            logger.error(f"[salary_validator] Error processing job {job_id}: {e}")
-            execution_time_ms = int((time.time() - start_time) * 1000)
+    async def _salary_from_description(self, job_id: str, description: str, extraction_result: dict[str, Any] | None) -> tuple[float | None, str]:
+        """
+        Extract the daily rate from the job description and store it on the job.
 
-            return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=str(e), execution_time_ms=execution_time_ms)
+        Args:
+            job_id: UUID of the job
+            description: Job description text
+            extraction_result: Extraction already obtained (e.g. from a batch), or None to extract now
 
-    def _load_salary_expectations(self) -> dict[str, Any]:
+        Returns:
+            Tuple of (salary_aud_per_day, extracted_from); (None, "not_found") if no salary was found
+        """
+        if not description:
+            return None, "not_found"
+
+        if extraction_result is None:
+            extraction_result = await self._extract_from_description(description)
+        if not extraction_result.get("salary_found"):
+            return None, "not_found"
+
+        # Convert annual to daily if needed
+        amount = extraction_result["amount"]
+        salary_aud_per_day = self._convert_annual_to_daily(amount) if extraction_result.get("time_period", "daily") == "annual" else amount
+
+        # Update jobs table with extracted salary
+        await self._app_repo.update_job_salary(job_id, salary_aud_per_day)
+        return salary_aud_per_day, "job_description"
+
+    def _needs_description_extraction(self, job_data: dict[str, Any]) -> bool:
+        """Return True if the salary can only come from Claude reading the description."""
+        structured_salary = job_data.get("salary_aud_per_day")
+        if structured_salary and self._extract_from_structured_field(structured_salary) is not None:
+            return False
+        return bool(job_data.get("description"))
+
+    def _load_salary_expectations(self) -> SalaryExpectations:
         """
         Load salary expectations from search.yaml.
 
         Returns:
-            Dictionary containing minimum and maximum salary thresholds
+            Immutable minimum and maximum salary thresholds
 
         Raises:
-            Exception if search.yaml cannot be loaded
+            Exception if search.yaml cannot be loaded or the thresholds are invalid
         """
         if self._salary_expectations is not None:
             return self._salary_expectations
 
-        config_path = Path("config/search.yaml")
-
         try:
-            with open(config_path) as f:
-                search_config = yaml.safe_load(f)
+            # Parsed once per process by the Config singleton (and cached by file signature on reload)
+            salary_expectations = get_config().search.get("salary_expectations", {})
 
-            salary_expectations = search_config.get("salary_expectations", {})
+            self._salary_expectations = SalaryExpectations.from_dict(salary_expectations)
 
-            self._salary_expectations = {"minimum": salary_expectations.get("minimum", 800.0), "maximum": salary_expectations.get("maximum", 1500.0)}
-
-            logger.debug(f"[salary_validator] Loaded salary expectations: {self._salary_expectations}")
+            logger.debug("[salary_validator] Loaded salary expectations: {}", self._salary_expectations)
             return self._salary_expectations
 
         except Exception as e:
             logger.error(f"[salary_validator] Failed to load search.yaml: {e}")
             raise
 
-    def _extract_from_structured_field(self, salary_str: str | None) -> float | None:
+    def _extract_from_structured_field(self, salary_str: str | int | float | Decimal | None) -> float | None:
         """
         Extract salary from structured field with various formats.
 
         Handles formats like:
+        - 800 / Decimal("800.00") (numeric DECIMAL column values)
         - "800"
         - "$800"
         - "800.00"
         - "$1,200.00"
 
         Args:
-            salary_str: Salary string from database field
+            salary_str: Salary value from database field
 
         Returns:
             Parsed salary as float, or None if cannot parse
@@ -198,12 +395,17 @@ class SalaryValidatorAgent(BaseAgent):
             return None
 
         try:
+            # Fast path: numeric column values and plain ASCII numeric strings need no cleaning
+            # (isdigit() alone also accepts digits such as "²" that float() rejects)
+            if isinstance(salary_str, (int, float, Decimal)) or (salary_str.isascii() and salary_str.replace(".", "", 1).isdigit()):
+                return float(salary_str)
+
             # Remove currency symbols, commas, and whitespace
-            cleaned = re.sub(r"[$,\s]", "", str(salary_str).strip())
+            cleaned = _CURRENCY_RE.sub("", str(salary_str).strip())
 
             # Handle "k" suffix (thousands)
-            if "k" in cleaned.lower():
-                cleaned = cleaned.lower().replace("k", "")
+            cleaned, k_count = _K_RE.subn("", cleaned)
+            if k_count:
                 return float(cleaned) * 1000
 
             # Try direct float conversion
@@ -217,8 +419,8 @@ class SalaryValidatorAgent(BaseAgent):
         """
         Extract salary from job description using Claude AI.
 
-        Uses Claude Haiku to parse unstructured text and identify salary information
-        in various formats (daily, annual, ranges, etc.).
+        Canonical formats ("$950 per day", "$120k pa", "$800-$1,000/day") are read
+        with a regex; Claude Haiku is only asked when none of them match.
 
         Args:
             description: Job description text
@@ -231,39 +433,96 @@ class SalaryValidatorAgent(BaseAgent):
                 - currency: str (if found)
                 - notes: str (if found)
         """
-        try:
-            prompt = f"""You are a Salary Extraction Agent. Extract the salary information from the job description.
+        matched = _match_salary(description)
+        if matched is not None:
+            logger.debug("[salary_validator] Salary matched locally: {}", matched["notes"])
+            return matched
 
-JOB DESCRIPTION:
-{description}
-
-TASK:
-Extract the salary or daily rate mentioned in the job description.
-Look for patterns like: "$X per day", "X/day", "$Xk annual", "$X-Y pa", etc.
-For salary ranges, use the midpoint.
+        try:
+            response = await self._call_claude_tool(_extraction_prompt(description), _EXTRACTION_SYSTEM_BLOCKS, _RECORD_SALARY_TOOL, max_tokens=_MAX_OUTPUT_TOKENS)
 
-OUTPUT FORMAT (JSON only):
-{{
-  "salary_found": true|false,
-  "amount": 950.0,
-  "time_period": "daily|annual",
-  "currency": "AUD",
-  "notes": "Found in description as '$950 per day'"
-}}
+            # The tool input is already structured; text only comes back if Claude ignored the tool
+            return self._check_extraction(response) if isinstance(response, dict) else self._parse_salary_extraction_response(response)
 
-If no salary information found, return: {{"salary_found": false}}"""
+        except Exception as e:
+            logger.error(f"[salary_validator] Claude API error during extraction: {e}")
+            return {"salary_found": False}
 
-            system_prompt = """You are a salary extraction specialist. Parse job descriptions and extract salary information accurately. Return JSON only, no additional text."""
+    async def _extract_batch_from_descriptions(self, descriptions: list[str]) -> list[dict[str, Any]]:
+        """
+        Extract salaries from several descriptions with one Message Batches request.
 
-            response = await self._call_claude(prompt, system_prompt)
+        A single description is sent directly, since a batch only adds latency.
+        Descriptions in a canonical format are matched locally first (see
+        _match_salary). Descriptions whose batch entry did not succeed, or the whole batch if it
+        fails or exceeds BATCH_TIMEOUT_SECONDS, fall back to individual calls.
 
-            # Parse Claude's response
-            parsed = self._parse_salary_extraction_response(response)
-            return parsed
+        Args:
+            descriptions: Job description texts
 
-        except Exception as e:
-            logger.error(f"[salary_validator] Claude API error during extraction: {e}")
+        Returns:
+            Extraction result per description, in order
+        """
+        # Canonical formats are read locally; only the rest need Claude
+        results: list[dict[str, Any] | None] = [_match_salary(description) for description in descriptions]
+        pending = [index for index, result in enumerate(results) if result is None]
+
+        extracted: dict[str, dict[str, Any]] = {}
+        if len(pending) >= 2:
+            try:
+                requests = [
+                    {
+                        "custom_id": f"job-{index}",
+                        "params": {
+                            "model": self.model,
+                            "max_tokens": _MAX_OUTPUT_TOKENS,
+                            "system": _EXTRACTION_SYSTEM_BLOCKS,
+                            "messages": [{"role": "user", "content": _extraction_prompt(descriptions[index])}],
+                            "tools": [_RECORD_SALARY_TOOL],
+                            "tool_choice": {"type": "tool", "name": _RECORD_SALARY_TOOL["name"]},
+                        },
+                    }
+                    for index in pending
+                ]
+                batch = await self._claude.messages.batches.create(requests=requests)
+                logger.info(f"[salary_validator] Submitted salary extraction batch {batch.id} for {len(pending)} jobs")
+
+                deadline = time.monotonic() + BATCH_TIMEOUT_SECONDS
+                while batch.processing_status != "ended":
+                    if time.monotonic() > deadline:
+                        await self._claude.messages.batches.cancel(batch.id)
+                        raise TimeoutError(f"batch {batch.id} still {batch.processing_status} after {BATCH_TIMEOUT_SECONDS}s")
+                    await asyncio.sleep(BATCH_POLL_INTERVAL_SECONDS)
+                    batch = await self._claude.messages.batches.retrieve(batch.id)
+
+                async for entry in await self._claude.messages.batches.results(batch.id):
+                    if entry.result.type == "succeeded":
+                        extracted[entry.custom_id] = self._extraction_from_content(entry.result.message.content)
+            except Exception as e:
+                logger.error(f"[salary_validator] Salary extraction batch failed, falling back to individual calls: {e}")
+
+        extractions: list[dict[str, Any]] = []
+        for index, result in enumerate(results):
+            if result is None:
+                result = extracted.get(f"job-{index}")
+            if result is None:
+                result = await self._extract_from_description(descriptions[index])
+            extractions.append(result)
+        return extractions
+
+    def _extraction_from_content(self, content: list[Any]) -> dict[str, Any]:
+        """Read the extraction from a message's content blocks, preferring the record_salary tool input."""
+        for block in content:
+            if getattr(block, "type", None) == "tool_use":
+                return self._check_extraction(dict(block.input))
+        return self._parse_salary_extraction_response(content[0].text)
+
+    def _check_extraction(self, parsed: Any) -> dict[str, Any]:
+        """Reject shapes the caller cannot use instead of failing later on a missing or non-numeric amount."""
+        if not isinstance(parsed, dict) or (parsed.get("salary_found") and not isinstance(parsed.get("amount"), int | float)):
+            logger.warning(f"[salary_validator] Unexpected salary extraction shape: {str(parsed)[:200]}")
             return {"salary_found": False}
+        return parsed
 
     def _parse_salary_extraction_response(self, response: str) -> dict[str, Any]:
         """
@@ -276,18 +535,13 @@ If no salary information found, return: {{"salary_found": false}}"""
             Parsed dictionary with salary information
         """
         try:
-            # Extract JSON from response (Claude sometimes adds markdown)
-            if "```json" in response:
-                start = response.find("```json") + 7
-                end = response.find("```", start)
-                response = response[start:end].strip()
-            elif "```" in response:
-                start = response.find("```") + 3
-                end = response.find("```", start)
-                response = response[start:end].strip()
-
-            parsed = json.loads(response)
-            return parsed
+            # Extract JSON from response (Claude sometimes adds markdown); one forward pass over the fences
+            _, fence, fenced = response.partition("```")
+            if fence:
+                fenced = fenced.removeprefix("json")
+                response = fenced.partition("```")[0].strip()
+
+            return self._check_extraction(json_loads(response))
 
         except json.JSONDecodeError as e:
             logger.error(f"[salary_validator] Failed to parse Claude response: {e}")
@@ -305,8 +559,7 @@ If no salary information found, return: {{"salary_found": false}}"""
         Returns:
             Daily rate
         """
-        WORKING_DAYS_PER_YEAR = 230
-        return annual_salary / WORKING_DAYS_PER_YEAR
+        return annual_salary * _INV_WORKING_DAYS_PER_YEAR
 
     def _validate_threshold(self, salary: float | None) -> tuple[bool, bool]:
         """
@@ -320,8 +573,7 @@ If no salary information found, return: {{"salary_found": false}}"""
                 - meets_threshold: True if salary >= minimum
                 - missing_salary: True if salary could not be determined
         """
-        expectations = self._load_salary_expectations()
-        minimum = expectations["minimum"]
+        minimum = self._load_salary_expectations().minimum
 
         if salary is None:
             return (False, True)  # Does not meet threshold, salary is missing
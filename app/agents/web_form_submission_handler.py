@@ -5,15 +5,27 @@ Handles browser automation, form filling, file uploads, submission,
 and error handling for web-based job applications.
 """
 
+import asyncio
+import os
 import time
-from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
-from app.agents.base_agent import AgentResult, BaseAgent
+from app.agents.base_agent import DEFAULT_PROCESS_CONCURRENCY, AgentResult, BaseAgent
 from app.services.playwright_service import PlaywrightService
 
+# Generated documents and screenshots live in {_EXPORT_ROOT}/{job_id}/; paths stay plain strings for Playwright
+_EXPORT_ROOT = "export_cv_cover_letter"
+
+# Default cap on browser contexts open at once in process_many()
+DEFAULT_MAX_BROWSER_CONTEXTS = 4
+
+
+def _elapsed(start_ns: int) -> int:
+    """Return whole milliseconds since start_ns, a time.perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
+
 
 class WebFormSubmissionHandler(BaseAgent):
     """
@@ -26,6 +38,9 @@ class WebFormSubmissionHandler(BaseAgent):
     - CV and cover letter file uploads
     - Screenshot capture for confirmation
     - Comprehensive error handling
+
+    One browser is shared across jobs, so use the handler as an async
+    context manager (or call close()) to shut Chromium down.
     """
 
     def __init__(self, config: dict[str, Any], claude_client: Any, app_repository: Any):
@@ -39,12 +54,109 @@ class WebFormSubmissionHandler(BaseAgent):
         """
         super().__init__(config, claude_client, app_repository)
         self._playwright_service = PlaywrightService(config.get("web_form", {}))
+        self._browser: Any | None = None
+        self._browser_lock = asyncio.Lock()
+        self._pending_screenshots: set[asyncio.Task] = set()
+        self._max_contexts = config.get("web_form", {}).get("browser", {}).get("max_contexts", DEFAULT_MAX_BROWSER_CONTEXTS)
 
     @property
     def agent_name(self) -> str:
         """Return agent name."""
         return "web_form_submission_handler"
 
+    async def _get_browser(self) -> Any:
+        """
+        Return the shared browser, launching it on first use.
+
+        Launching Chromium takes seconds, so one browser is reused across
+        jobs and each job gets its own context instead.
+
+        Returns:
+            Browser instance
+        """
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                self._browser = await self._playwright_service.initialize_browser()
+                logger.debug("[web_form_submission_handler] Browser initialized")
+            return self._browser
+
+    async def _capture_and_close(self, page: Any, job_id: str, output: dict[str, Any]) -> None:
+        """
+        Take an audit screenshot, then close the page's browser context.
+
+        If no screenshot is saved, output["screenshot_path"] is cleared and
+        output["screenshot_failed"] set, and the stage output is stored again
+        so the record never points at a missing file.
+
+        Args:
+            page: Page the form was submitted on
+            job_id: Job the submission belongs to
+            output: Stage output holding the destination PNG path
+        """
+        saved: str | None = None
+        try:
+            saved = await self._playwright_service.take_screenshot(page, output["screenshot_path"])
+        finally:
+            try:
+                if saved is None:
+                    logger.warning(f"[web_form_submission_handler] Audit screenshot not saved for job {job_id}")
+                    output["screenshot_path"] = None
+                    output["screenshot_failed"] = True
+                    await self._store_stage_output(job_id, self.agent_name, output)
+            finally:
+                await self._playwright_service.close_page(page)
+
+    def _on_screenshot_done(self, task: asyncio.Task) -> None:
+        """
+        Forget a finished background screenshot and log its failure, if any.
+
+        Args:
+            task: Completed screenshot task
+        """
+        self._pending_screenshots.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"[web_form_submission_handler] Background screenshot failed: {task.exception()}")
+
+    async def flush(self) -> None:
+        """
+        Wait for all background screenshots to finish.
+
+        Call before shutdown so no audit screenshot is lost.
+        """
+        if self._pending_screenshots:
+            await asyncio.gather(*self._pending_screenshots, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Finish background screenshots and close the shared browser, if one was launched. Call on shutdown."""
+        await self.flush()
+        if self._browser is not None:
+            await self._playwright_service.close_browser(self._browser)
+            self._browser = None
+
+    async def __aenter__(self) -> "WebFormSubmissionHandler":
+        """Return the handler; the shared browser is launched by the first job."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the handler, including its browser, on leaving the block."""
+        await self.close()
+
+    async def process_many(self, job_ids: list[str], concurrency: int = DEFAULT_PROCESS_CONCURRENCY) -> list[AgentResult | BaseException]:
+        """
+        Submit several jobs concurrently over the shared browser.
+
+        Each job in flight holds its own browser context, so concurrency is
+        capped at web_form.browser.max_contexts.
+
+        Args:
+            job_ids: UUIDs of the jobs to process
+            concurrency: Maximum number of jobs in flight
+
+        Returns:
+            Results in job_ids order; unexpected exceptions are returned in place
+        """
+        return await super().process_many(job_ids, min(concurrency, self._max_contexts))
+
     async def process(self, job_id: str) -> AgentResult:
         """
         Process a job to submit application via web form.
@@ -55,14 +167,14 @@ class WebFormSubmissionHandler(BaseAgent):
         Returns:
             AgentResult with success status, form URL, screenshot path
         """
-        start_time = time.time()
-        browser = None
+        start_ns = time.perf_counter_ns()
+        page = None
 
         try:
             # Validate job_id
             if not job_id:
                 logger.error("[web_form_submission_handler] Missing job_id parameter")
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Missing job_id parameter", execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Missing job_id parameter", execution_time_ms=_elapsed(start_ns))
 
             # Load job data
             logger.info(f"[web_form_submission_handler] Processing job: {job_id}")
@@ -70,14 +182,14 @@ class WebFormSubmissionHandler(BaseAgent):
 
             if not job_data:
                 logger.error(f"[web_form_submission_handler] Job not found: {job_id}")
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=f"Job not found: {job_id}", execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=f"Job not found: {job_id}", execution_time_ms=_elapsed(start_ns))
 
             # Get application URL
             application_url = job_data.get("application_url")
             if not application_url:
                 logger.error(f"[web_form_submission_handler] No application URL for job {job_id}")
                 await self._app_repo.update_status(job_id, "pending")
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="No application URL found", execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="No application URL found", execution_time_ms=_elapsed(start_ns))
 
             # Update current stage
             await self._update_current_stage(job_id, self.agent_name)
@@ -90,17 +202,16 @@ class WebFormSubmissionHandler(BaseAgent):
                 logger.error(f"[web_form_submission_handler] CV/CL files not found for job {job_id}: {e}")
                 await self._app_repo.update_status(job_id, "failed")
                 await self._update_error_info(job_id, {"stage": self.agent_name, "error_type": "missing_files", "error_message": str(e)})
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=str(e), execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=str(e), execution_time_ms=_elapsed(start_ns))
 
-            # Initialize browser
+            # Get shared browser
             try:
-                browser = await self._playwright_service.initialize_browser()
-                logger.debug("[web_form_submission_handler] Browser initialized")
+                browser = await self._get_browser()
             except Exception as e:
                 logger.error(f"[web_form_submission_handler] Browser initialization failed: {e}")
                 await self._app_repo.update_status(job_id, "failed")
                 await self._update_error_info(job_id, {"stage": self.agent_name, "error_type": "browser_init_failed", "error_message": str(e)})
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=f"Browser initialization failed: {e}", execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=f"Browser initialization failed: {e}", execution_time_ms=_elapsed(start_ns))
 
             # Navigate to form
             try:
@@ -108,20 +219,19 @@ class WebFormSubmissionHandler(BaseAgent):
                 logger.info(f"[web_form_submission_handler] Navigated to {application_url}")
             except Exception as e:
                 logger.error(f"[web_form_submission_handler] Navigation failed: {e}")
-                await self._playwright_service.close_browser(browser)
                 await self._app_repo.update_status(job_id, "failed")
                 await self._update_error_info(job_id, {"stage": self.agent_name, "error_type": "navigation_failed", "error_message": str(e)})
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=f"Navigation failed: {e}", execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=f"Navigation failed: {e}", execution_time_ms=_elapsed(start_ns))
 
             # Detect form fields
             mappings = await self._playwright_service.detect_form_fields(page)
 
             if not mappings.name_field or not mappings.email_field or not mappings.submit_button:
                 logger.error("[web_form_submission_handler] Missing required form fields")
-                await self._playwright_service.close_browser(browser)
+                await self._playwright_service.close_page(page)
                 await self._app_repo.update_status(job_id, "pending")
                 await self._update_error_info(job_id, {"stage": self.agent_name, "error_type": "form_fields_not_detected", "error_message": "Could not detect required form fields"})
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Could not detect required form fields - may require manual submission", execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Could not detect required form fields - may require manual submission", execution_time_ms=_elapsed(start_ns))
 
             # Prepare form data
             form_data = {"name": self._playwright_service._applicant_name, "email": self._playwright_service._applicant_email, "phone": self._playwright_service._applicant_phone, "cv_path": cv_path, "cl_path": cl_path}
@@ -131,20 +241,30 @@ class WebFormSubmissionHandler(BaseAgent):
 
             if not fill_success:
                 logger.error("[web_form_submission_handler] Form filling failed")
-                await self._playwright_service.close_browser(browser)
+                await self._playwright_service.close_page(page)
                 await self._app_repo.update_status(job_id, "pending")
                 await self._update_error_info(job_id, {"stage": self.agent_name, "error_type": "form_fill_failed", "error_message": "Failed to fill form fields"})
-                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Failed to fill form fields", execution_time_ms=int((time.time() - start_time) * 1000))
+                return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message="Failed to fill form fields", execution_time_ms=_elapsed(start_ns))
 
             # Submit form
             submit_success = await self._playwright_service.submit_form(page, mappings.submit_button)
 
-            # Take screenshot (regardless of submission success)
-            screenshot_dir = Path("export_cv_cover_letter") / job_id
-            screenshot_path = await self._playwright_service.take_screenshot(page, str(screenshot_dir / "confirmation.png"))
+            screenshot_path = os.path.join(_EXPORT_ROOT, job_id, "confirmation.png")
+            output: dict[str, Any]
+            if submit_success:
+                output = {"form_url": application_url, "screenshot_path": screenshot_path, "submission_timestamp": int(time.time())}
+
+                # Audit-only screenshot: captured in the background, which then closes the job's context
+                task = asyncio.create_task(self._capture_and_close(page, job_id, output))
+                self._pending_screenshots.add(task)
+                task.add_done_callback(self._on_screenshot_done)
+                page = None
+            else:
+                # Diagnostic screenshot must exist before the failure is recorded
+                output = {"screenshot_path": await self._playwright_service.take_screenshot(page, screenshot_path)}
+                await self._playwright_service.close_page(page)
 
-            # Close browser
-            await self._playwright_service.close_browser(browser)
+            # The browser itself stays open for the next job
 
             # Update database based on result
             if submit_success:
@@ -152,33 +272,27 @@ class WebFormSubmissionHandler(BaseAgent):
                 await self._app_repo.update_submission_method(job_id, "web_form")
                 logger.info(f"[web_form_submission_handler] Form submitted successfully for job {job_id}")
 
-                # Build output
-                output = {"form_url": application_url, "screenshot_path": screenshot_path, "submission_timestamp": int(time.time())}
-
                 # Add completed stage
                 await self._add_completed_stage(job_id, self.agent_name, output)
 
-                execution_time_ms = int((time.time() - start_time) * 1000)
+                execution_time_ms = _elapsed(start_ns)
                 return AgentResult(success=True, agent_name=self.agent_name, output=output, error_message=None, execution_time_ms=execution_time_ms)
             else:
                 await self._app_repo.update_status(job_id, "failed")
-                await self._update_error_info(job_id, {"stage": self.agent_name, "error_type": "submission_failed", "error_message": "Form submission failed or timed out", "screenshot_path": screenshot_path})
+                await self._update_error_info(job_id, {"stage": self.agent_name, "error_type": "submission_failed", "error_message": "Form submission failed or timed out", "screenshot_path": output["screenshot_path"]})
                 logger.error(f"[web_form_submission_handler] Form submission failed for job {job_id}")
 
-                execution_time_ms = int((time.time() - start_time) * 1000)
-                return AgentResult(success=False, agent_name=self.agent_name, output={"screenshot_path": screenshot_path}, error_message="Form submission failed or timed out", execution_time_ms=execution_time_ms)
+                execution_time_ms = _elapsed(start_ns)
+                return AgentResult(success=False, agent_name=self.agent_name, output=output, error_message="Form submission failed or timed out", execution_time_ms=execution_time_ms)
 
         except Exception as e:
             logger.error(f"[web_form_submission_handler] Error processing job {job_id}: {e}")
 
-            # Ensure browser is closed
-            if browser:
-                try:
-                    await self._playwright_service.close_browser(browser)
-                except Exception:
-                    pass
+            # Ensure this job's browser context is closed
+            if page:
+                await self._playwright_service.close_page(page)
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
+            execution_time_ms = _elapsed(start_ns)
             return AgentResult(success=False, agent_name=self.agent_name, output={}, error_message=str(e), execution_time_ms=execution_time_ms)
 
     def _find_cv_cl_files(self, job_id: str) -> tuple[str, str]:
@@ -195,24 +309,31 @@ class WebFormSubmissionHandler(BaseAgent):
             FileNotFoundError: If files don't exist
         """
         # Look in export_cv_cover_letter/{job_id}/ directory
-        job_dir = Path("export_cv_cover_letter") / job_id
-
-        if not job_dir.exists():
-            raise FileNotFoundError(f"CV/CL directory not found: {job_dir}")
+        job_dir = os.path.join(_EXPORT_ROOT, job_id)
 
-        # Find CV file (CV_*.docx)
-        cv_files = list(job_dir.glob("CV_*.docx"))
-        if not cv_files:
+        # Single directory listing instead of exists() plus one glob per prefix
+        cv_path: str | None = None
+        cl_path: str | None = None
+        try:
+            with os.scandir(job_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.endswith(".docx"):
+                        continue
+                    if cv_path is None and name.startswith("CV_"):
+                        cv_path = os.path.join(job_dir, name)
+                    elif cl_path is None and name.startswith("CL_"):
+                        cl_path = os.path.join(job_dir, name)
+                    if cv_path is not None and cl_path is not None:
+                        break
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"CV/CL directory not found: {job_dir}") from None
+
+        if cv_path is None:
             raise FileNotFoundError(f"CV file not found in {job_dir}")
-
-        # Find CL file (CL_*.docx)
-        cl_files = list(job_dir.glob("CL_*.docx"))
-        if not cl_files:
+        if cl_path is None:
             raise FileNotFoundError(f"Cover letter file not found in {job_dir}")
 
-        cv_path = str(cv_files[0])
-        cl_path = str(cl_files[0])
-
-        logger.debug(f"[web_form_submission_handler] Found CV: {cv_path}, CL: {cl_path}")
+        logger.debug("[web_form_submission_handler] Found CV: {}, CL: {}", cv_path, cl_path)
 
         return cv_path, cl_path
@@ -2,9 +2,9 @@
 Configuration module for the Job Application Automation System.
 
 Provides centralized configuration management with YAML file loading,
-Pydantic validation, and singleton pattern for global access.
+Pydantic validation, and a shared instance for global access.
 """
 
-from app.config.loader import Config, get_config
+from app.config.loader import Config, get_config, reload_config
 
-__all__ = ["Config", "get_config"]
+__all__ = ["Config", "get_config", "reload_config"]
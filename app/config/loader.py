@@ -1,43 +1,177 @@
 """
-Configuration loader module with singleton pattern.
+Configuration loader module with a shared, lazily loaded instance.
 
 Loads and manages YAML configuration files for the Job Application
 Automation System.
 """
 
+import copy
+import marshal
 import os
+import struct
+import sys
+import threading
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 import yaml
 from loguru import logger
 
+from app.config.models import SearchConfig
 
-class Config:
-    """Singleton configuration loader for YAML files."""
+# libyaml's C loader/dumper are several times faster; PyYAML builds without libyaml only ship the Python ones
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
 
-    _instance: "Config | None" = None
+# Parsed YAML keyed by resolved path, with the (st_mtime_ns, st_size, st_ino) signature it was parsed at
+_YAML_CACHE: dict[Path, tuple[tuple[int, int, int], Any]] = {}
+_YAML_CACHE_LOCK = threading.Lock()
 
-    def __new__(cls) -> "Config":
-        """Create or return singleton instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+# On-disk parse cache written next to each YAML file, so a fresh process skips the parse too.
+# marshal round-trips YAML's plain types exactly and, unlike pickle, cannot run code on load.
+_DISK_CACHE_SUFFIX = ".cache"
+# st_mtime_ns, st_size, st_ino of the parsed file, then sys.hexversion (marshal's format is version specific)
+_DISK_CACHE_HEADER = struct.Struct("<qQQI")
+
+
+def _disk_cache_path(path: Path) -> Path:
+    """Return the sidecar cache path for a YAML file."""
+    return path.with_name(path.name + _DISK_CACHE_SUFFIX)
+
+
+def _read_disk_cache(path: Path, signature: tuple[int, int, int]) -> tuple[bool, Any]:
+    """
+    Load a YAML file's parse from its sidecar cache.
+
+    Args:
+        path: Resolved path to the YAML file
+        signature: Current (st_mtime_ns, st_size, st_ino) of the YAML file
+
+    Returns:
+        Tuple of (hit, data); hit is False if the cache is missing, stale or unreadable
+    """
+    try:
+        blob = _disk_cache_path(path).read_bytes()
+    except OSError:
+        return False, None
+    if len(blob) < _DISK_CACHE_HEADER.size or _DISK_CACHE_HEADER.unpack_from(blob) != (*signature, sys.hexversion):
+        return False, None
+    try:
+        return True, marshal.loads(memoryview(blob)[_DISK_CACHE_HEADER.size :])
+    except (EOFError, ValueError, TypeError):
+        return False, None
+
+
+def _write_disk_cache(path: Path, signature: tuple[int, int, int], data: Any) -> None:
+    """
+    Store a YAML file's parse in its sidecar cache, atomically and best effort.
+
+    Args:
+        path: Resolved path to the YAML file
+        signature: (st_mtime_ns, st_size, st_ino) the data was parsed at
+        data: Parsed YAML data
+    """
+    try:
+        payload = marshal.dumps(data)
+    except ValueError:
+        # Timestamps and other non-plain YAML types are simply parsed every time
+        return
+
+    cache_path = _disk_cache_path(path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(_DISK_CACHE_HEADER.pack(*signature, sys.hexversion) + payload)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def _read_yaml_cached(file_path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    The file is re-parsed only when its modification time, size or inode
+    differs from the cached signature; a new process first tries the
+    sidecar cache on disk. Callers get a deep copy, so mutating the result
+    never alters the cache.
+
+    Args:
+        file_path: Path to the YAML file
+
+    Returns:
+        Parsed YAML data (None for an empty file)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If YAML syntax is invalid
+    """
+    path = file_path.resolve()
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1])
+
+    hit, data = _read_disk_cache(path, signature)
+    if not hit:
+        # One read into memory; libyaml then scans a contiguous buffer (and detects the encoding itself)
+        data = yaml.load(path.read_bytes(), Loader=_YamlLoader)
+        _write_disk_cache(path, signature, data)
+
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[path] = (signature, data)
+    return copy.deepcopy(data)
 
-    def __init__(self) -> None:
-        """Initialize configuration by loading all YAML files."""
-        if self._initialized:
-            return
 
+# Shared instance returned by get_config(), created on first use
+_CONFIG: "Config | None" = None
+_CONFIG_LOCK = threading.Lock()
+
+
+class Config:
+    """Configuration loader for YAML files. Use get_config() for the shared instance."""
+
+    # Section attribute for each YAML file; save_yaml() and reload() dispatch through this table
+    _ATTR_MAP = {"search.yaml": "search", "agents.yaml": "agents", "platforms.yaml": "platforms", "similarity.yaml": "similarity"}
+    # Cached properties computed from a section, dropped whenever that section changes
+    _DERIVED_ATTRS = {"search": ("search_model",)}
+
+    def __init__(self) -> None:
+        """Initialize configuration; each YAML file is parsed on first access."""
         self._config_path = self._get_config_path()
-        self.search = self.load_yaml("search.yaml")
-        self.agents = self.load_yaml("agents.yaml")
-        self.platforms = self.load_yaml("platforms.yaml")
-        self.similarity = self.load_yaml("similarity.yaml")
 
-        self._initialized = True
-        logger.info("Configuration loaded successfully")
+    @cached_property
+    def search(self) -> dict[str, Any]:
+        """Search criteria from search.yaml."""
+        return self.load_yaml("search.yaml")
+
+    @cached_property
+    def search_model(self) -> SearchConfig:
+        """Search criteria validated into an immutable SearchConfig, for attribute access."""
+        return SearchConfig.model_validate(self.search)
+
+    @cached_property
+    def agents(self) -> dict[str, Any]:
+        """Agent settings from agents.yaml."""
+        return self.load_yaml("agents.yaml")
+
+    @cached_property
+    def platforms(self) -> dict[str, Any]:
+        """Job platform settings from platforms.yaml."""
+        return self.load_yaml("platforms.yaml")
+
+    @cached_property
+    def similarity(self) -> dict[str, Any]:
+        """Duplicate detection settings from similarity.yaml."""
+        return self.load_yaml("similarity.yaml")
 
     def _get_config_path(self) -> Path:
         """
@@ -72,8 +206,7 @@ class Config:
             raise FileNotFoundError(error_msg)
 
         try:
-            with open(file_path) as f:
-                config_data = yaml.safe_load(f)
+            config_data = _read_yaml_cached(file_path)
 
             if config_data is None:
                 raise ValueError(f"Empty configuration file: {file_path}")
@@ -107,19 +240,20 @@ class Config:
 
         try:
             with open(file_path, "w") as f:
-                yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+                yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
             logger.info(f"Saved configuration to {filename}")
 
+            # Drop the cached parses rather than trust the stat signature for a write within the same timestamp tick
+            resolved = file_path.resolve()
+            with _YAML_CACHE_LOCK:
+                _YAML_CACHE.pop(resolved, None)
+            _disk_cache_path(resolved).unlink(missing_ok=True)
+
             # Update the in-memory config
-            if filename == "search.yaml":
-                self.search = data
-            elif filename == "agents.yaml":
-                self.agents = data
-            elif filename == "platforms.yaml":
-                self.platforms = data
-            elif filename == "similarity.yaml":
-                self.similarity = data
+            attr = self._ATTR_MAP.get(filename)
+            if attr:
+                self._set_section(attr, data)
 
         except PermissionError as e:
             error_msg = f"Permission denied writing to {filename}: {e}"
@@ -143,16 +277,26 @@ class Config:
         Note: Use with caution as this reloads configuration at runtime.
         """
         logger.warning("Reloading configuration files")
-        self.search = self.load_yaml("search.yaml")
-        self.agents = self.load_yaml("agents.yaml")
-        self.platforms = self.load_yaml("platforms.yaml")
-        self.similarity = self.load_yaml("similarity.yaml")
+        for filename, attr in self._ATTR_MAP.items():
+            self._set_section(attr, self.load_yaml(filename))
         logger.info("Configuration reloaded successfully")
 
+    def _set_section(self, attr: str, data: dict[str, Any]) -> None:
+        """
+        Replace a configuration section and drop anything derived from it.
+
+        Args:
+            attr: Section attribute name (e.g., "search")
+            data: New section data
+        """
+        setattr(self, attr, data)
+        for derived in self._DERIVED_ATTRS.get(attr, ()):
+            self.__dict__.pop(derived, None)
+
 
 def get_config() -> Config:
     """
-    Get the singleton Config instance.
+    Get the shared Config instance, loading it on first call.
 
     Returns:
         Config instance
@@ -162,4 +306,27 @@ def get_config() -> Config:
         >>> job_type = config.search['job_type']
         >>> match_threshold = config.agents['job_matcher_agent']['match_threshold']
     """
-    return Config()
+    global _CONFIG
+    config = _CONFIG
+    if config is None:
+        with _CONFIG_LOCK:
+            if _CONFIG is None:
+                _CONFIG = Config()
+            config = _CONFIG
+    return config
+
+
+def reload_config() -> Config:
+    """
+    Replace the shared Config instance with a fresh one.
+
+    Sections of the new instance are read from disk again on first access;
+    callers holding the previous instance keep its values.
+
+    Returns:
+        The new shared Config instance
+    """
+    global _CONFIG
+    with _CONFIG_LOCK:
+        _CONFIG = Config()
+        return _CONFIG
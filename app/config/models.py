@@ -6,10 +6,16 @@ Provides type-safe configuration access with validation.
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
-class LocationsConfig(BaseModel):
+class _ConfigModel(BaseModel):
+    """Base for config models; schemas are built on first validation rather than at import, and instances are immutable."""
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+
+class LocationsConfig(_ConfigModel):
     """Location preferences configuration."""
 
     primary: str
@@ -17,7 +23,7 @@ class LocationsConfig(BaseModel):
     exclude: list[str] = []
 
 
-class KeywordsConfig(BaseModel):
+class KeywordsConfig(_ConfigModel):
     """Job keywords configuration."""
 
     primary: list[str]
@@ -25,7 +31,7 @@ class KeywordsConfig(BaseModel):
     exclude: list[str] = []
 
 
-class TechnologiesConfig(BaseModel):
+class TechnologiesConfig(_ConfigModel):
     """Technology requirements configuration."""
 
     must_have: list[str]
@@ -33,7 +39,7 @@ class TechnologiesConfig(BaseModel):
     nice_to_have: list[str]
 
 
-class SalaryExpectationsConfig(BaseModel):
+class SalaryExpectationsConfig(_ConfigModel):
     """Salary expectations configuration."""
 
     minimum: int = Field(ge=0)
@@ -57,7 +63,7 @@ class SalaryExpectationsConfig(BaseModel):
         return v
 
 
-class SearchConfig(BaseModel):
+class SearchConfig(_ConfigModel):
     """Search criteria configuration with validation."""
 
     job_type: Literal["contract", "permanent", "casual"]
@@ -68,7 +74,7 @@ class SearchConfig(BaseModel):
     salary_expectations: SalaryExpectationsConfig
 
 
-class ScoringWeightsConfig(BaseModel):
+class ScoringWeightsConfig(_ConfigModel):
     """Scoring weights for job matching."""
 
     must_have_present: float = Field(ge=0.0, le=1.0)
@@ -77,7 +83,7 @@ class ScoringWeightsConfig(BaseModel):
     location_match: float = Field(ge=0.0, le=1.0)
 
 
-class AgentConfigBase(BaseModel):
+class AgentConfigBase(_ConfigModel):
     """Base configuration for agents."""
 
     model: str
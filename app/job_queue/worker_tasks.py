@@ -4,17 +4,31 @@ This module defines the worker tasks that are executed by RQ workers
 to process jobs asynchronously through the agent pipeline.
 """
 
+import re
+from functools import lru_cache
 from typing import Any
-from uuid import UUID
 
 from loguru import logger
 
-from app.job_queue.redis_client import get_redis_connection
 from app.repositories.application_repository import ApplicationRepository
-from app.repositories.database import get_connection
 from app.repositories.jobs_repository import JobsRepository
 from app.services.job_processor import JobProcessorService
 
+# Hyphenated UUID, the form JobQueue.enqueue_job sends (str(UUID)); repositories take job IDs as strings
+_UUID_RE = re.compile(r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z")
+
+
+@lru_cache(maxsize=1)
+def get_application_repository() -> ApplicationRepository:
+    """Get the application repository shared by tasks in this worker process."""
+    return ApplicationRepository()
+
+
+@lru_cache(maxsize=1)
+def get_job_processor() -> JobProcessorService:
+    """Get the job processor shared by tasks in this worker process, built on first use."""
+    return JobProcessorService(jobs_repository=JobsRepository(), application_repository=get_application_repository())
+
 
 def process_job(job_id: str) -> dict[str, Any]:
     """Process a job through the agent pipeline.
@@ -42,44 +56,40 @@ def process_job(job_id: str) -> dict[str, Any]:
         >>> print(result["status"])
         'success'
     """
-    try:
-        # Validate UUID format
-        job_uuid = UUID(job_id)
-    except ValueError as e:
+    # Validate UUID format; the job_id string is passed on, not a UUID object
+    if not isinstance(job_id, str) or _UUID_RE.match(job_id) is None:
         logger.error(f"Invalid job_id format: {job_id}")
-        raise ValueError(f"Invalid UUID format: {job_id}") from e
+        raise ValueError(f"Invalid UUID format: {job_id}")
 
-    logger.info(f"Worker processing job: {job_id}")
+    # Job IDs are stored as str(uuid4()), which is lowercase; normalize once here rather than per repository call
+    job_id = job_id.lower()
 
-    # Initialize dependencies
-    get_redis_connection()
-    db_conn = get_connection()
-    jobs_repo = JobsRepository(db_conn)
-    app_repo = ApplicationRepository(db_conn)
+    # Start and status transitions are debug-level; each task logs once at info (or above) with its outcome
+    logger.debug("Worker processing job: {}", job_id)
+
+    # Repositories, the Claude client and agent config are built once per worker process, not per task
+    app_repo = get_application_repository()
 
     # Update status to 'processing'
-    app_repo.update_status(job_uuid, "pending")  # Using 'pending' for now
-    logger.info(f"Job status updated to 'processing': {job_id}")
+    app_repo.update_status(job_id, "pending")  # Using 'pending' for now
+    logger.debug("Job status updated to 'processing': {}", job_id)
 
     try:
-        # Create JobProcessorService and process job
-        processor = JobProcessorService(jobs_repository=jobs_repo, application_repository=app_repo)
-
-        result = processor.process_job(job_uuid)
+        result = get_job_processor().process_job(job_id)
 
         # Update status based on result
         if result.get("status") == "success":
-            app_repo.update_status(job_uuid, "completed")
+            app_repo.update_status(job_id, "completed")
             logger.info(f"Job processing completed successfully: {job_id}")
         else:
-            app_repo.update_status(job_uuid, "failed")
+            app_repo.update_status(job_id, "failed")
             logger.warning(f"Job processing failed: {job_id}")
 
         return result
 
     except Exception as e:
         # Update status to failed and log error
-        app_repo.update_status(job_uuid, "failed")
+        app_repo.update_status(job_id, "failed")
         logger.error(f"Job processing exception: {job_id} - {str(e)}")
         raise
 
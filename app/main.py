@@ -5,29 +5,67 @@ This module sets up the FastAPI application with all routes, middleware,
 and configuration needed for the REST API.
 """
 
+import asyncio
 import os
+import sys
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 
-from fastapi import FastAPI, Query, WebSocket, WebSocketDisconnect
+from fastapi import Depends, FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from loguru import logger
 
+from app.config import get_config
+from app.config.models import SearchConfig
+from app.repositories.application_repository import ApplicationRepository
+from app.repositories.database import ThreadConnection, get_database_info, initialize_database
+from app.repositories.jobs_repository import JobsRepository
+from app.services.approval_mode import ApprovalModeService
+from app.services.pending_jobs import PendingJobsService
+from app.serialization import HAS_ORJSON, json_dumps
+from app.services.pipeline_metrics import PipelineMetricsService
+from app.ui.websocket import manager
+
+# Responses are serialized by orjson; FastAPI's stdlib JSONResponse is only used where orjson is missing
+_DefaultResponse = ORJSONResponse if HAS_ORJSON else JSONResponse
+
+
 # Configure logging
 log_level = os.getenv("LOG_LEVEL", "INFO")
 app_env = os.getenv("APP_ENV", "development")
 
-# Only log to file in non-test environments to avoid permission issues in CI/CD
+# Production replaces loguru's colourised default sink with a plain one; enqueue moves the write off the calling thread
+if app_env == "production":
+    logger.remove()
+    logger.add(sys.stderr, format="{time} {level} {message}", level=log_level, enqueue=True)
+
+# Only log to file in non-test environments to avoid permission issues in CI/CD.
+# The file sink is queued so requests never wait on disk writes; production leaves out the call site
 if app_env != "test":
+    log_file_format = "{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}" if app_env == "production" else "{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}"
     try:
-        logger.add("logs/app.log", rotation="1 day", retention="30 days", format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}", level=log_level)
+        logger.add("logs/app.log", rotation="1 day", retention="30 days", format=log_file_format, level=log_level, enqueue=True)
     except PermissionError:
         # If we can't write to logs directory, just log to stderr
         logger.warning("Cannot write to logs/app.log, logging to stderr only")
 
 
+# Eager tasks run their first step synchronously, so coroutines that finish without suspending never get scheduled
+# on the loop. asyncio.eager_task_factory is Python 3.12+; older interpreters keep the default factory.
+_EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+
+
+def _warm_config() -> None:
+    """Parse every configuration section so the first request doesn't pay for it."""
+    config = get_config()
+    for section in ("search", "agents", "platforms", "similarity"):
+        getattr(config, section)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
@@ -44,14 +82,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info(f"Environment: {os.getenv('APP_ENV', 'development')}")
     logger.info(f"Log level: {log_level}")
 
-    # Initialize database connection
-    try:
-        from app.repositories.database import initialize_database
-
-        initialize_database()
+    # Set on the serving loop itself, so it applies in every uvicorn worker whatever loop implementation is in use
+    loop = asyncio.get_running_loop()
+    if _EAGER_TASK_FACTORY is not None and loop.get_task_factory() is None:
+        loop.set_task_factory(_EAGER_TASK_FACTORY)
+        logger.debug("Eager task factory enabled")
+
+    # Database setup and config parsing are independent blocking work, so they overlap in threads
+    init_db = os.getenv("INIT_DB_ON_STARTUP", "true").lower() == "true"
+    startup_tasks = [asyncio.to_thread(_warm_config)]
+    if init_db:
+        startup_tasks.append(asyncio.to_thread(initialize_database))
+    config_result, *db_result = await asyncio.gather(*startup_tasks, return_exceptions=True)
+
+    if isinstance(config_result, Exception):
+        logger.warning(f"Configuration warm-up warning: {config_result}")
+    if not init_db:
+        logger.info("Database initialization skipped (INIT_DB_ON_STARTUP=false)")
+    elif isinstance(db_result[0], Exception):
+        logger.warning(f"Database initialization warning: {db_result[0]}")
+    else:
         logger.info("Database initialized successfully")
-    except Exception as e:
-        logger.warning(f"Database initialization warning: {e}")
 
     yield
 
@@ -59,6 +110,69 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Shutting down Job Application Automation System API")
 
 
+# Handlers doing only blocking DuckDB work are plain `def`, so FastAPI runs them in its threadpool rather than on the
+# event loop; async handlers hand blocking calls to asyncio.to_thread. Shared repositories and services hold a
+# ThreadConnection, which gives each thread its own cursor.
+@lru_cache(maxsize=1)
+def get_jobs_repository() -> JobsRepository:
+    """
+    Provide the shared JobsRepository (FastAPI dependency).
+
+    Repositories only wrap the process-wide DuckDB connection, so one
+    instance serves every request.
+
+    Returns:
+        JobsRepository instance
+    """
+    return JobsRepository()
+
+
+@lru_cache(maxsize=1)
+def get_application_repository() -> ApplicationRepository:
+    """
+    Provide the shared ApplicationRepository (FastAPI dependency).
+
+    Returns:
+        ApplicationRepository instance
+    """
+    return ApplicationRepository()
+
+
+@lru_cache(maxsize=1)
+def get_pending_jobs_service() -> PendingJobsService:
+    """
+    Provide the shared PendingJobsService (FastAPI dependency).
+
+    Returns:
+        PendingJobsService instance
+    """
+    return PendingJobsService(ThreadConnection())
+
+
+@lru_cache(maxsize=1)
+def get_approval_mode_service() -> ApprovalModeService:
+    """
+    Provide the shared ApprovalModeService (FastAPI dependency).
+
+    Its system_config table check runs once, on first use.
+
+    Returns:
+        ApprovalModeService instance
+    """
+    return ApprovalModeService(ThreadConnection())
+
+
+@lru_cache(maxsize=1)
+def get_pipeline_metrics_service() -> PipelineMetricsService:
+    """
+    Provide the shared PipelineMetricsService (FastAPI dependency).
+
+    Returns:
+        PipelineMetricsService instance
+    """
+    return PipelineMetricsService(ThreadConnection())
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Job Application Automation System",
@@ -68,22 +182,36 @@ app = FastAPI(
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
     lifespan=lifespan,
+    default_response_class=_DefaultResponse,
 )
 
 # Configure CORS middleware for Vue 3 frontend integration
 allowed_origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:5173,http://localhost:5174,http://localhost:8000")
-app.add_middleware(CORSMiddleware, allow_origins=allowed_origins.split(","), allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
+# Starlette keeps allow_origins as given and tests `origin in allow_origins` per request, so a frozenset makes that a hash lookup
+app.add_middleware(CORSMiddleware, allow_origins=frozenset(allowed_origins.split(",")), allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
+
+
+# Serialized /health body and its time.monotonic() timestamp; probes within the TTL skip the database query and serialization
+HEALTH_CACHE_TTL_SECONDS = 1.0
+_health_cache: tuple[float, bytes] | None = None
 
 
 @app.get("/health", tags=["System"])
-async def health_check() -> JSONResponse:
+def health_check() -> Response:
     """
     Health check endpoint.
 
+    The response body is reused for HEALTH_CACHE_TTL_SECONDS, so readiness
+    probes hitting it many times a second query the database at most once
+    per interval.
+
     Returns:
         JSON response with health status
     """
-    from app.repositories.database import get_database_info
+    global _health_cache
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < HEALTH_CACHE_TTL_SECONDS:
+        return Response(content=_health_cache[1], media_type="application/json")
 
     try:
         db_info = get_database_info()
@@ -96,8 +224,10 @@ async def health_check() -> JSONResponse:
 
     health_data = {"status": "healthy", "service": "job-automation-api", "version": "1.0.0-mvp", "environment": os.getenv("APP_ENV", "development"), "database": {"status": db_status, "tables": table_count}}
 
-    logger.debug(f"Health check: {health_data}")
-    return JSONResponse(content=health_data, status_code=200)
+    logger.debug("Health check: {}", health_data)
+    body = json_dumps(health_data)
+    _health_cache = (now, body)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/", tags=["System"])
@@ -122,8 +252,6 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     Args:
         websocket: The WebSocket connection
     """
-    from app.ui.websocket import manager
-
     await manager.connect(websocket)
     try:
         while True:
@@ -138,31 +266,27 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
 
 
 @app.get("/api/config", tags=["Configuration"])
-async def get_configuration() -> dict:
+def get_configuration() -> dict:
     """
     Get current configuration (sanitized).
 
     Returns:
         Sanitized configuration data
     """
-    from app.config import get_config
-    from app.repositories.database import get_database_info
-
     config = get_config()
+    search = config.search_model
 
-    return {"search": {"job_type": config.search.get("job_type"), "duration": config.search.get("duration")}, "agents": list(config.agents.keys()), "platforms": list(config.platforms.keys()), "database": get_database_info()}
+    return {"search": {"job_type": search.job_type, "duration": search.duration}, "agents": list(config.agents.keys()), "platforms": list(config.platforms.keys()), "database": get_database_info()}
 
 
 @app.get("/api/config/search", tags=["Configuration"])
-async def get_search_configuration() -> dict:
+def get_search_configuration() -> dict:
     """
     Get full search configuration.
 
     Returns:
         Complete search configuration from search.yaml
     """
-    from app.config import get_config
-
     config = get_config()
     logger.debug("Returning search configuration")
 
@@ -180,10 +304,6 @@ async def update_search_configuration(config_data: dict) -> dict:
     Returns:
         Success message and updated configuration
     """
-    from fastapi import HTTPException
-
-    from app.config import get_config
-
     try:
         config = get_config()
 
@@ -193,8 +313,11 @@ async def update_search_configuration(config_data: dict) -> dict:
             if field not in config_data:
                 raise ValueError(f"Missing required field: {field}")
 
-        # Save the configuration
-        config.save_yaml("search.yaml", config_data)
+        # Reject values /api/config could not read back (pydantic's ValidationError is a ValueError)
+        SearchConfig.model_validate(config_data)
+
+        # Save the configuration (file write and cache invalidation) off the event loop
+        await asyncio.to_thread(config.save_yaml, "search.yaml", config_data)
 
         logger.info("Search configuration updated successfully")
         return {"success": True, "message": "Configuration updated successfully", "config": config.search}
@@ -211,7 +334,7 @@ async def update_search_configuration(config_data: dict) -> dict:
 
 
 @app.get("/api/jobs", tags=["Jobs"])
-async def list_jobs(platform: str | None = None, limit: int = 20, offset: int = 0) -> dict:
+def list_jobs(platform: str | None = None, limit: int = 20, offset: int = 0, repo: JobsRepository = Depends(get_jobs_repository)) -> dict:
     """
     List jobs with optional filtering.
 
@@ -219,12 +342,11 @@ async def list_jobs(platform: str | None = None, limit: int = 20, offset: int =
         platform: Filter by platform source (linkedin, seek, indeed)
         limit: Maximum number of jobs to return (default: 20, max: 100)
         offset: Number of jobs to skip for pagination
+        repo: Jobs repository (injected)
 
     Returns:
         List of jobs with pagination info
     """
-    from app.repositories.jobs_repository import JobsRepository
-
     # Validate limit
     limit = min(limit, 100)
 
@@ -232,29 +354,23 @@ async def list_jobs(platform: str | None = None, limit: int = 20, offset: int =
     if platform:
         filters["platform_source"] = platform
 
-    repo = JobsRepository()
-    jobs = repo.list_jobs(filters=filters, limit=limit, offset=offset)
-    total = repo.count_jobs(filters=filters)
+    jobs, total = repo.list_raw_with_count(filters=filters, limit=limit, offset=offset)
 
-    return {"jobs": [job.to_dict() for job in jobs], "pagination": {"limit": limit, "offset": offset, "total": total, "has_more": (offset + len(jobs)) < total}}
+    return {"jobs": jobs, "pagination": {"limit": limit, "offset": offset, "total": total, "has_more": (offset + len(jobs)) < total}}
 
 
 @app.get("/api/jobs/{job_id}", tags=["Jobs"])
-async def get_job(job_id: str) -> dict:
+def get_job(job_id: str, repo: JobsRepository = Depends(get_jobs_repository)) -> dict:
     """
     Get a specific job by ID.
 
     Args:
         job_id: The job ID to retrieve
+        repo: Jobs repository (injected)
 
     Returns:
         Job details
     """
-    from fastapi import HTTPException
-
-    from app.repositories.jobs_repository import JobsRepository
-
-    repo = JobsRepository()
     job = repo.get_job_by_id(job_id)
 
     if not job:
@@ -264,7 +380,7 @@ async def get_job(job_id: str) -> dict:
 
 
 @app.get("/api/applications", tags=["Applications"])
-async def list_applications(status: str | None = None, limit: int = 20, offset: int = 0) -> dict:
+def list_applications(status: str | None = None, limit: int = 20, offset: int = 0, repo: ApplicationRepository = Depends(get_application_repository)) -> dict:
     """
     List applications with optional filtering.
 
@@ -272,12 +388,11 @@ async def list_applications(status: str | None = None, limit: int = 20, offset:
         status: Filter by application status
         limit: Maximum number of applications to return (default: 20, max: 100)
         offset: Number of applications to skip for pagination
+        repo: Application repository (injected)
 
     Returns:
         List of applications with pagination info
     """
-    from app.repositories.application_repository import ApplicationRepository
-
     # Validate limit
     limit = min(limit, 100)
 
@@ -285,29 +400,23 @@ async def list_applications(status: str | None = None, limit: int = 20, offset:
     if status:
         filters["status"] = status
 
-    repo = ApplicationRepository()
-    applications = repo.list_applications(filters=filters, limit=limit, offset=offset)
-    total = repo.count_applications(filters=filters)
+    applications, total = repo.list_raw_with_count(filters=filters, limit=limit, offset=offset)
 
-    return {"applications": [app.to_dict() for app in applications], "pagination": {"limit": limit, "offset": offset, "total": total, "has_more": (offset + len(applications)) < total}}
+    return {"applications": applications, "pagination": {"limit": limit, "offset": offset, "total": total, "has_more": (offset + len(applications)) < total}}
 
 
 @app.get("/api/applications/{application_id}", tags=["Applications"])
-async def get_application(application_id: str) -> dict:
+def get_application(application_id: str, repo: ApplicationRepository = Depends(get_application_repository)) -> dict:
     """
     Get a specific application by ID.
 
     Args:
         application_id: The application ID to retrieve
+        repo: Application repository (injected)
 
     Returns:
         Application details
     """
-    from fastapi import HTTPException
-
-    from app.repositories.application_repository import ApplicationRepository
-
-    repo = ApplicationRepository()
     application = repo.get_application_by_id(application_id)
 
     if not application:
@@ -317,22 +426,18 @@ async def get_application(application_id: str) -> dict:
 
 
 @app.post("/api/jobs/{job_id}/retry", tags=["Jobs"])
-async def retry_job(job_id: str) -> dict:
+async def retry_job(job_id: str, service: PendingJobsService = Depends(get_pending_jobs_service)) -> dict:
     """
     Retry a failed or pending job.
 
     Args:
         job_id: The job ID to retry
+        service: Pending jobs service (injected)
 
     Returns:
         Result of retry operation
     """
-    from fastapi import HTTPException
-
     from app.models.api_requests import RetryJobRequest
-    from app.repositories.database import get_db_connection
-    from app.services.pending_jobs import PendingJobsService
-    from app.ui.websocket import manager
 
     # Validate input
     try:
@@ -342,9 +447,7 @@ async def retry_job(job_id: str) -> dict:
         raise HTTPException(status_code=400, detail=f"Invalid job_id: {str(e)}")
 
     try:
-        db = get_db_connection()
-        service = PendingJobsService(db)
-        result = service.retry_job(validated_job_id)
+        result = await asyncio.to_thread(service.retry_job, validated_job_id)
 
         # Broadcast WebSocket update
         await manager.broadcast({"type": "job_retry", "job_id": validated_job_id, "status": result.get("status")})
@@ -359,20 +462,17 @@ async def retry_job(job_id: str) -> dict:
 
 
 @app.get("/api/pipeline", tags=["Pipeline"])
-async def get_pipeline_status() -> dict:
+def get_pipeline_status(service: PipelineMetricsService = Depends(get_pipeline_metrics_service)) -> dict:
     """
     Get current pipeline status and metrics.
 
+    Args:
+        service: Pipeline metrics service (injected)
+
     Returns:
         Pipeline metrics including active jobs, stage counts, and bottlenecks
     """
-    from app.repositories.database import get_db_connection
-    from app.services.pipeline_metrics import PipelineMetricsService
-
     try:
-        db = get_db_connection()
-        service = PipelineMetricsService(db)
-
         active_jobs = service.get_active_jobs_in_pipeline()
         stage_counts = service.get_pipeline_stage_counts()
 
@@ -383,23 +483,18 @@ async def get_pipeline_status() -> dict:
 
 
 @app.get("/api/pending", tags=["Pending"])
-async def list_pending_jobs(limit: int = 20) -> dict:
+def list_pending_jobs(limit: int = 20, service: PendingJobsService = Depends(get_pending_jobs_service)) -> dict:
     """
     List jobs requiring manual intervention.
 
     Args:
         limit: Maximum number of jobs to return
+        service: Pending jobs service (injected)
 
     Returns:
         List of pending jobs with error details
     """
-    from app.repositories.database import get_db_connection
-    from app.services.pending_jobs import PendingJobsService
-
     try:
-        db = get_db_connection()
-        service = PendingJobsService(db)
-
         jobs = service.get_pending_jobs(limit=limit)
         return {"pending_jobs": jobs, "count": len(jobs)}
     except Exception as e:
@@ -408,22 +503,18 @@ async def list_pending_jobs(limit: int = 20) -> dict:
 
 
 @app.post("/api/pending/{job_id}/approve", tags=["Pending"])
-async def approve_pending_job(job_id: str) -> dict:
+async def approve_pending_job(job_id: str, service: ApprovalModeService = Depends(get_approval_mode_service)) -> dict:
     """
     Approve a pending job for submission.
 
     Args:
         job_id: The job ID to approve
+        service: Approval mode service (injected)
 
     Returns:
         Result of approve operation
     """
-    from fastapi import HTTPException
-
     from app.models.api_requests import ApproveJobRequest
-    from app.repositories.database import get_db_connection
-    from app.services.approval_mode import ApprovalModeService
-    from app.ui.websocket import manager
 
     # Validate input
     try:
@@ -433,9 +524,7 @@ async def approve_pending_job(job_id: str) -> dict:
         raise HTTPException(status_code=400, detail=f"Invalid job_id: {str(e)}")
 
     try:
-        db = get_db_connection()
-        service = ApprovalModeService(db)
-        result = service.approve_job(validated_job_id)
+        result = await asyncio.to_thread(service.approve_job, validated_job_id)
 
         # Broadcast WebSocket update
         await manager.broadcast({"type": "job_update", "job_id": validated_job_id, "status": "approved", "action": "approve"})
@@ -450,23 +539,19 @@ async def approve_pending_job(job_id: str) -> dict:
 
 
 @app.post("/api/pending/{job_id}/reject", tags=["Pending"])
-async def reject_pending_job(job_id: str, reason: str = "User rejected") -> dict:
+async def reject_pending_job(job_id: str, reason: str = "User rejected", service: ApprovalModeService = Depends(get_approval_mode_service)) -> dict:
     """
     Reject a pending job.
 
     Args:
         job_id: The job ID to reject
         reason: Optional reason for rejection
+        service: Approval mode service (injected)
 
     Returns:
         Result of reject operation
     """
-    from fastapi import HTTPException
-
     from app.models.api_requests import RejectJobRequest
-    from app.repositories.database import get_db_connection
-    from app.services.approval_mode import ApprovalModeService
-    from app.ui.websocket import manager
 
     # Validate input
     try:
@@ -477,9 +562,7 @@ async def reject_pending_job(job_id: str, reason: str = "User rejected") -> dict
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
 
     try:
-        db = get_db_connection()
-        service = ApprovalModeService(db)
-        result = service.reject_job(validated_job_id, validated_reason)
+        result = await asyncio.to_thread(service.reject_job, validated_job_id, validated_reason)
 
         # Broadcast WebSocket update
         await manager.broadcast({"type": "job_update", "job_id": validated_job_id, "status": "rejected", "action": "reject"})
@@ -493,6 +576,31 @@ async def reject_pending_job(job_id: str, reason: str = "User rejected") -> dict
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+async def _run_poller(label: str, poller_class: type, poller_config: dict, jobs_repo: JobsRepository, app_repo: ApplicationRepository) -> dict:
+    """
+    Run one poller pass in a worker thread.
+
+    Args:
+        label: Platform name for log messages (e.g., "SEEK")
+        poller_class: Poller class to instantiate
+        poller_config: Configuration passed to the poller
+        jobs_repo: Jobs repository
+        app_repo: Application repository
+
+    Returns:
+        Poller metrics, or {"error": ...} if the poller failed
+    """
+    try:
+        logger.info(f"Starting {label} poller...")
+        poller = poller_class(config=poller_config, jobs_repository=jobs_repo, application_repository=app_repo)
+        poller_metrics: dict = await asyncio.to_thread(poller.run_once)
+        logger.info(f"{label} polling complete: {poller_metrics}")
+        return poller_metrics
+    except Exception as e:
+        logger.error(f"{label} poller error: {e}")
+        return {"error": str(e)}
+
+
 @app.post("/api/discover", tags=["Jobs"])
 async def discover_jobs() -> dict:
     """
@@ -503,14 +611,8 @@ async def discover_jobs() -> dict:
     Returns:
         Discovery results with metrics from each poller
     """
-    from fastapi import HTTPException
-
-    from app.config import get_config
     from app.pollers.indeed_poller import IndeedPoller
     from app.pollers.seek_poller import SEEKPoller
-    from app.repositories.application_repository import ApplicationRepository
-    from app.repositories.jobs_repository import JobsRepository
-    from app.ui.websocket import manager
 
     try:
         logger.info("Job discovery triggered via API")
@@ -520,34 +622,15 @@ async def discover_jobs() -> dict:
         search_config = config.search
 
         # Initialize repositories
-        jobs_repo = JobsRepository()
-        app_repo = ApplicationRepository()
+        jobs_repo = get_jobs_repository()
+        app_repo = get_application_repository()
 
         results = {"status": "completed", "timestamp": datetime.now().isoformat(), "pollers": {}}
 
-        # Run SEEK poller if enabled
-        if search_config.get("seek", {}).get("enabled", False):
-            try:
-                logger.info("Starting SEEK poller...")
-                seek_poller = SEEKPoller(config={"search": search_config, "seek": config.platforms.get("seek", {})}, jobs_repository=jobs_repo, application_repository=app_repo)
-                seek_metrics = seek_poller.run_once()
-                results["pollers"]["seek"] = seek_metrics
-                logger.info(f"SEEK polling complete: {seek_metrics}")
-            except Exception as e:
-                logger.error(f"SEEK poller error: {e}")
-                results["pollers"]["seek"] = {"error": str(e)}
-
-        # Run Indeed poller if enabled
-        if search_config.get("indeed", {}).get("enabled", False):
-            try:
-                logger.info("Starting Indeed poller...")
-                indeed_poller = IndeedPoller(config={"search": search_config, "indeed": config.platforms.get("indeed", {})}, jobs_repository=jobs_repo, application_repository=app_repo)
-                indeed_metrics = indeed_poller.run_once()
-                results["pollers"]["indeed"] = indeed_metrics
-                logger.info(f"Indeed polling complete: {indeed_metrics}")
-            except Exception as e:
-                logger.error(f"Indeed poller error: {e}")
-                results["pollers"]["indeed"] = {"error": str(e)}
+        # Pollers block on HTTP and DuckDB, so the enabled ones run concurrently in worker threads
+        enabled = [(name, label, poller_class) for name, label, poller_class in (("seek", "SEEK", SEEKPoller), ("indeed", "Indeed", IndeedPoller)) if search_config.get(name, {}).get("enabled", False)]
+        metrics = await asyncio.gather(*(_run_poller(label, poller_class, {"search": search_config, name: config.platforms.get(name, {})}, jobs_repo, app_repo) for name, label, poller_class in enabled))
+        results["pollers"] = {name: poller_metrics for (name, _, _), poller_metrics in zip(enabled, metrics, strict=True)}
 
         # Broadcast WebSocket update
         await manager.broadcast({"type": "job_discovery_complete", "results": results})
@@ -561,7 +644,7 @@ async def discover_jobs() -> dict:
 
 
 @app.get("/api/history", tags=["Applications"])
-async def get_application_history(
+def get_application_history(
     platform: list[str] | None = Query(None),
     date_from: str | None = None,
     date_to: str | None = None,
@@ -572,6 +655,7 @@ async def get_application_history(
     page_size: int = 25,
     sort_by: str = "applied_date",
     sort_order: str = "desc",
+    repo: ApplicationRepository = Depends(get_application_repository),
 ) -> dict:
     """
     Get application history with filtering, sorting, and pagination.
@@ -591,13 +675,11 @@ async def get_application_history(
         page_size: Items per page (max 100)
         sort_by: Column to sort by (title, company, platform, applied_date, match_score, status)
         sort_order: Sort order (asc or desc)
+        repo: Application repository (injected)
 
     Returns:
         Paginated application history with job details
     """
-    from fastapi import HTTPException
-    from app.repositories.application_repository import ApplicationRepository
-
     try:
         # Validate parameters using Pydantic model
         from app.models.api_requests import HistoryFilterParams
@@ -607,7 +689,6 @@ async def get_application_history(
         params = HistoryFilterParams(platform=platform, date_from=date_from, date_to=date_to, min_score=min_score, max_score=max_score, status=status, page=page, page_size=page_size, sort_by=sort_by, sort_order=sort_order)
 
         # Get application history from repository
-        repo = ApplicationRepository()
         applications, total = repo.get_application_history(
             platforms=params.platform,
             date_from=params.date_from,
@@ -653,10 +734,14 @@ def start() -> None:
     host = os.getenv("API_HOST", "0.0.0.0")
     port = int(os.getenv("API_PORT", "8000"))
     reload = os.getenv("APP_ENV", "development") == "development"
+    # uvicorn can't reload with several workers. Each worker is a separate process and DuckDB allows one
+    # read-write process per database file, so API_WORKERS stays 1 unless the database lives elsewhere
+    workers = 1 if reload else int(os.getenv("API_WORKERS", "1"))
 
-    logger.info(f"Starting FastAPI server on {host}:{port}")
+    logger.info(f"Starting FastAPI server on {host}:{port} ({workers} worker{'s' if workers != 1 else ''})")
 
-    uvicorn.run("app.main:app", host=host, port=port, reload=reload, log_level=log_level.lower())
+    # loop/http "auto" already select uvloop and httptools when installed (uvicorn[standard]), with asyncio/h11 fallbacks
+    uvicorn.run("app.main:app", host=host, port=port, reload=reload, workers=workers, log_level=log_level.lower())
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 """Repository modules for database operations."""
 
-from app.repositories.database import DatabaseConnection, create_indexes, create_tables, get_connection, get_database_info, get_db_connection, initialize_database
+from app.repositories.database import DatabaseConnection, ThreadConnection, create_indexes, create_tables, get_connection, get_database_info, get_db_connection, initialize_database
 
-__all__ = ["get_connection", "initialize_database", "create_tables", "create_indexes", "get_database_info", "DatabaseConnection", "get_db_connection"]
+__all__ = ["get_connection", "initialize_database", "create_tables", "create_indexes", "get_database_info", "DatabaseConnection", "ThreadConnection", "get_db_connection"]
@@ -7,7 +7,31 @@ Handles all database operations for application tracking through the agent pipel
 from loguru import logger
 
 from app.models.application import Application
-from app.repositories.database import get_connection
+from app.repositories.database import ThreadConnection
+
+
+# Match score as an integer percentage: prefers the quantized match_score_milli
+# written by the job matcher, falling back to legacy match_score values
+_MATCH_SCORE_SQL = "COALESCE(CAST(json_extract(a.stage_outputs, '$.job_matcher.match_score_milli') AS INTEGER) // 10, CAST(json_extract(a.stage_outputs, '$.job_matcher.match_score') AS INTEGER))"
+
+# Application.to_dict() keys in table order, selected by list_raw_with_count; the JSON columns come back as
+# JSON text, which is what to_dict() produces for them
+_APPLICATION_DICT_COLUMNS = (
+    "application_id",
+    "job_id",
+    "status",
+    "current_stage",
+    "completed_stages",
+    "stage_outputs",
+    "error_info",
+    "cv_file_path",
+    "cl_file_path",
+    "submission_method",
+    "submitted_timestamp",
+    "contact_person_name",
+    "created_at",
+    "updated_at",
+)
 
 
 class ApplicationRepository:
@@ -15,7 +39,7 @@ class ApplicationRepository:
 
     def __init__(self):
         """Initialize application repository."""
-        self.conn = get_connection()
+        self.conn = ThreadConnection()
 
     def insert_application(self, application: Application) -> str:
         """
@@ -121,7 +145,7 @@ class ApplicationRepository:
             logger.error(f"Failed to update application status: {e}")
             raise
 
-    def update_application_stage(self, application_id: str, stage_name: str, stage_output: dict) -> None:
+    def update_application_stage(self, application_id: str, stage_name: str, stage_output: dict, status: str | None = None) -> None:
         """
         Update application stage information.
 
@@ -129,6 +153,7 @@ class ApplicationRepository:
             application_id: The application ID to update
             stage_name: Name of the current stage/agent
             stage_output: Output data from the stage
+            status: New status to set in the same UPDATE, or None to leave it unchanged
         """
         # First, get current application to update arrays
         app = self.get_application_by_id(application_id)
@@ -145,13 +170,14 @@ class ApplicationRepository:
             SET current_stage = ?,
                 completed_stages = ?,
                 stage_outputs = ?,
+                status = COALESCE(?, status),
                 updated_at = CURRENT_TIMESTAMP
             WHERE application_id = ?
         """
 
         import json
 
-        params = (stage_name, json.dumps(app.completed_stages), json.dumps(app.stage_outputs), application_id)
+        params = (stage_name, json.dumps(app.completed_stages), json.dumps(app.stage_outputs), status, application_id)
 
         try:
             self.conn.execute(query, params)
@@ -160,6 +186,20 @@ class ApplicationRepository:
             logger.error(f"Failed to update application stage: {e}")
             raise
 
+    def apply_stage_result(self, application_id: str, stage_name: str, stage_output: dict, status: str | None = None) -> None:
+        """
+        Record a finished agent stage, and optionally its status, in one UPDATE.
+
+        Called by BaseAgent._apply_stage_result in place of separate stage and status writes.
+
+        Args:
+            application_id: The application ID to update
+            stage_name: Name of the completed stage/agent
+            stage_output: Output data from the stage
+            status: New status, or None to leave it unchanged
+        """
+        self.update_application_stage(application_id, stage_name, stage_output, status)
+
     def update_application_error(self, application_id: str, stage: str, error_type: str, error_message: str) -> None:
         """
         Record error information for a failed application.
@@ -327,6 +367,75 @@ class ApplicationRepository:
         results = self.conn.execute(query, params).fetchall()
         return [Application.from_db_row(row) for row in results]
 
+    def list_with_count(self, filters: dict | None = None, limit: int = 100, offset: int = 0) -> tuple[list[Application], int]:
+        """
+        List a page of applications together with the total number matching the filters.
+
+        The total comes from a COUNT(*) OVER () window in the same query, so a
+        page costs one round trip instead of a list and a separate count.
+
+        Args:
+            filters: Dictionary of field filters (e.g., {"status": "matched"})
+            limit: Maximum number of applications to return
+            offset: Number of applications to skip (for pagination)
+
+        Returns:
+            Tuple of (list of Application instances, total matching applications)
+        """
+        rows, total = self._fetch_page_with_count("*", filters, limit, offset)
+        return [Application.from_db_row(row) for row in rows], total
+
+    def list_raw_with_count(self, filters: dict | None = None, limit: int = 100, offset: int = 0) -> tuple[list[dict], int]:
+        """
+        List a page of applications as dictionaries, together with the total number matching the filters.
+
+        Each dictionary has the same keys and values as Application.to_dict(),
+        built straight from the row without decoding and re-encoding the JSON
+        columns through an Application.
+
+        Args:
+            filters: Dictionary of field filters (e.g., {"status": "matched"})
+            limit: Maximum number of applications to return
+            offset: Number of applications to skip (for pagination)
+
+        Returns:
+            Tuple of (list of application dictionaries, total matching applications)
+        """
+        rows, total = self._fetch_page_with_count(", ".join(_APPLICATION_DICT_COLUMNS), filters, limit, offset)
+        return [dict(zip(_APPLICATION_DICT_COLUMNS, row, strict=True)) for row in rows], total
+
+    def _fetch_page_with_count(self, columns: str, filters: dict | None, limit: int, offset: int) -> tuple[list[tuple], int]:
+        """
+        Fetch a page of application rows and the total matching the filters in one query.
+
+        Args:
+            columns: SQL select list for the page rows
+            filters: Dictionary of field filters
+            limit: Maximum number of rows to return
+            offset: Number of rows to skip
+
+        Returns:
+            Tuple of (rows without the window total, total matching applications)
+        """
+        query = f"SELECT {columns}, COUNT(*) OVER () AS _total FROM application_tracking"
+        params = []
+
+        if filters:
+            where_clauses = []
+            for field, value in filters.items():
+                where_clauses.append(f"{field} = ?")
+                params.append(value)
+            query += " WHERE " + " AND ".join(where_clauses)
+
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        results = self.conn.execute(query, params).fetchall()
+        if not results:
+            # A page past the end has no rows to carry the window total
+            return [], self.count_applications(filters=filters) if offset else 0
+        return [row[:-1] for row in results], results[0][-1]
+
     def count_applications(self, filters: dict | None = None) -> int:
         """
         Count applications with optional filtering.
@@ -405,10 +514,10 @@ class ApplicationRepository:
 
         # Filter by match score range
         if min_score is not None:
-            where_clauses.append("CAST(json_extract(a.stage_outputs, '$.job_matcher.match_score') AS INTEGER) >= ?")
+            where_clauses.append(f"{_MATCH_SCORE_SQL} >= ?")
             params.append(min_score)
         if max_score is not None:
-            where_clauses.append("CAST(json_extract(a.stage_outputs, '$.job_matcher.match_score') AS INTEGER) <= ?")
+            where_clauses.append(f"{_MATCH_SCORE_SQL} <= ?")
             params.append(max_score)
 
         # Filter by statuses
@@ -446,7 +555,7 @@ class ApplicationRepository:
                 j.company_name,
                 j.platform_source as platform,
                 a.submitted_timestamp as applied_date,
-                CAST(json_extract(a.stage_outputs, '$.job_matcher.match_score') AS INTEGER) as match_score,
+                {_MATCH_SCORE_SQL} as match_score,
                 a.status,
                 a.cv_file_path,
                 a.cl_file_path,
@@ -5,13 +5,19 @@ Provides connection pooling and utilities for the job application database.
 """
 
 import os
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
 import duckdb
 from loguru import logger
 
+# Each thread's (shared connection, cursor) pair. A DuckDB connection must not run queries from several threads at
+# once, so every thread works through its own cursor: a separate connection to the same database instance.
+_thread_cursors = threading.local()
+
 
 class DatabaseConnection:
     """Singleton database connection manager for DuckDB."""
@@ -61,6 +67,24 @@ class DatabaseConnection:
             self._connection = self._create_connection()
         return self._connection
 
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """
+        Get the calling thread's cursor on the shared connection.
+
+        The cursor is created on a thread's first call and replaced if the
+        shared connection has been reopened since.
+
+        Returns:
+            DuckDB connection for use on the calling thread only
+        """
+        connection = self.connection
+        cached: tuple[duckdb.DuckDBPyConnection, duckdb.DuckDBPyConnection] | None = getattr(_thread_cursors, "pair", None)
+        if cached is not None and cached[0] is connection:
+            return cached[1]
+        cursor = connection.cursor()
+        _thread_cursors.pair = (connection, cursor)
+        return cursor
+
     def execute(self, query: str, parameters: tuple | None = None) -> duckdb.DuckDBPyConnection:
         """
         Execute a SQL query.
@@ -74,8 +98,8 @@ class DatabaseConnection:
         """
         try:
             if parameters:
-                return self.connection.execute(query, parameters)
-            return self.connection.execute(query)
+                return self.cursor().execute(query, parameters)
+            return self.cursor().execute(query)
         except Exception as e:
             logger.error(f"Query execution failed: {e}")
             logger.debug(f"Query: {query}")
@@ -127,7 +151,7 @@ def get_db_connection() -> Generator[duckdb.DuckDBPyConnection, None, None]:
     """
     db = DatabaseConnection()
     try:
-        yield db.connection
+        yield db.cursor()
     except Exception as e:
         logger.error(f"Database operation failed: {e}")
         raise
@@ -250,13 +274,26 @@ def initialize_database() -> None:
 
 def get_connection() -> duckdb.DuckDBPyConnection:
     """
-    Get the active database connection.
+    Get the database connection for the calling thread.
 
     Returns:
-        DuckDB connection instance
+        DuckDB connection instance (a per-thread cursor on the shared connection)
     """
     db = DatabaseConnection()
-    return db.connection
+    return db.cursor()
+
+
+class ThreadConnection:
+    """
+    Stand-in for a DuckDB connection that uses the calling thread's connection on every access.
+
+    Long-lived objects shared between threads (repositories, services behind
+    FastAPI's threadpool) hold one of these instead of a connection fixed to
+    the thread that created them.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_connection(), name)
 
 
 def get_database_info() -> dict:
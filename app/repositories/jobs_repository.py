@@ -7,13 +7,18 @@ Handles all database operations for job postings.
 from loguru import logger
 
 from app.models.job import Job
-from app.repositories.database import get_connection
+from app.repositories.database import ThreadConnection
 
 
 # Whitelist of allowed field names for dynamic SQL queries
 # This prevents SQL injection through field names
 ALLOWED_FIELDS = {"job_id", "platform_source", "company_name", "job_title", "job_url", "salary_aud_per_day", "location", "posted_date", "job_description", "requirements", "responsibilities", "discovered_timestamp", "duplicate_group_id"}
 
+# Job.to_dict() keys in table order, selected by list_raw_with_count; the salary is cast in SQL the way
+# to_dict() converts it (float, with a zero rate reported as None)
+_JOB_DICT_COLUMNS = ("job_id", "platform_source", "company_name", "job_title", "job_url", "salary_aud_per_day", "location", "posted_date", "job_description", "requirements", "responsibilities", "discovered_timestamp", "duplicate_group_id")
+_JOB_DICT_SELECT = ", ".join("NULLIF(CAST(salary_aud_per_day AS DOUBLE), 0) AS salary_aud_per_day" if column == "salary_aud_per_day" else column for column in _JOB_DICT_COLUMNS)
+
 # Allowed INTERVAL units for parameterized queries
 ALLOWED_INTERVAL_UNITS = {"DAY", "HOUR", "MINUTE", "SECOND", "MONTH", "YEAR"}
 
@@ -35,7 +40,7 @@ class JobsRepository:
 
     def __init__(self):
         """Initialize jobs repository."""
-        self.conn = get_connection()
+        self.conn = ThreadConnection()
 
     @staticmethod
     def _validate_field_name(field: str) -> None:
@@ -257,6 +262,87 @@ class JobsRepository:
         results = self.conn.execute(query, params).fetchall()
         return [Job.from_db_row(row) for row in results]
 
+    def list_with_count(self, filters: dict | None = None, limit: int = 100, offset: int = 0) -> tuple[list[Job], int]:
+        """
+        List a page of jobs together with the total number matching the filters.
+
+        The total comes from a COUNT(*) OVER () window in the same query, so a
+        page costs one round trip instead of a list and a separate count.
+
+        Args:
+            filters: Dictionary of field filters (e.g., {"platform_source": "linkedin"})
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip (for pagination)
+
+        Returns:
+            Tuple of (list of Job instances, total matching jobs)
+
+        Raises:
+            InvalidFieldError: If any filter field name is not in the allowed whitelist
+        """
+        rows, total = self._fetch_page_with_count("*", filters, limit, offset)
+        return [Job.from_db_row(row) for row in rows], total
+
+    def list_raw_with_count(self, filters: dict | None = None, limit: int = 100, offset: int = 0) -> tuple[list[dict], int]:
+        """
+        List a page of jobs as dictionaries, together with the total number matching the filters.
+
+        Each dictionary has the same keys and values as Job.to_dict(), built
+        straight from the row without constructing a Job.
+
+        Args:
+            filters: Dictionary of field filters (e.g., {"platform_source": "linkedin"})
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip (for pagination)
+
+        Returns:
+            Tuple of (list of job dictionaries, total matching jobs)
+
+        Raises:
+            InvalidFieldError: If any filter field name is not in the allowed whitelist
+        """
+        rows, total = self._fetch_page_with_count(_JOB_DICT_SELECT, filters, limit, offset)
+        return [dict(zip(_JOB_DICT_COLUMNS, row, strict=True)) for row in rows], total
+
+    def _fetch_page_with_count(self, columns: str, filters: dict | None, limit: int, offset: int) -> tuple[list[tuple], int]:
+        """
+        Fetch a page of job rows and the total matching the filters in one query.
+
+        Args:
+            columns: SQL select list for the page rows
+            filters: Dictionary of field filters
+            limit: Maximum number of rows to return
+            offset: Number of rows to skip
+
+        Returns:
+            Tuple of (rows without the window total, total matching jobs)
+
+        Raises:
+            InvalidFieldError: If any filter field name is not in the allowed whitelist
+        """
+        query = f"SELECT {columns}, COUNT(*) OVER () AS _total FROM jobs"
+        params = []
+
+        if filters:
+            # Validate all field names before building query
+            for field in filters.keys():
+                self._validate_field_name(field)
+
+            where_clauses = []
+            for field, value in filters.items():
+                where_clauses.append(f"{field} = ?")
+                params.append(value)
+            query += " WHERE " + " AND ".join(where_clauses)
+
+        query += " ORDER BY discovered_timestamp DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        results = self.conn.execute(query, params).fetchall()
+        if not results:
+            # A page past the end has no rows to carry the window total
+            return [], self.count_jobs(filters=filters) if offset else 0
+        return [row[:-1] for row in results], results[0][-1]
+
     def count_jobs(self, filters: dict | None = None) -> int:
         """
         Count jobs with optional filtering.
@@ -0,0 +1,26 @@
+"""
+JSON encoding and decoding shared across the application.
+
+Uses orjson, a declared dependency, with a stdlib fallback so partial
+installs still run. Both paths accept and produce the same JSON.
+"""
+
+import json
+from typing import Any
+
+# orjson's JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib exception either way
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, matching orjson.dumps output."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+json_loads = orjson.loads if HAS_ORJSON else json.loads
+json_dumps = orjson.dumps if HAS_ORJSON else _stdlib_dumps
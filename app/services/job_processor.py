@@ -6,13 +6,13 @@ the execution of all agents in the pipeline for job processing.
 
 import asyncio
 from typing import Any
-from uuid import UUID
 
 import yaml
 from anthropic import Anthropic
 from loguru import logger
 
 from app.agents import CoverLetterWriterAgent, CVTailorAgent, FormHandlerAgent, JobMatcherAgent, OrchestratorAgent, QAAgent, SalaryValidatorAgent
+from app.config import get_config
 from app.repositories.application_repository import ApplicationRepository
 from app.repositories.jobs_repository import JobsRepository
 
@@ -31,14 +31,14 @@ class JobProcessorService:
         agent_configs: Configuration for all agents
     """
 
-    def __init__(self, jobs_repository: JobsRepository, application_repository: ApplicationRepository, claude_client: Anthropic | None = None, config_path: str = "config/agents.yaml"):
+    def __init__(self, jobs_repository: JobsRepository, application_repository: ApplicationRepository, claude_client: Anthropic | None = None, config_path: str | None = None):
         """Initialize JobProcessorService with dependencies.
 
         Args:
             jobs_repository: JobsRepository for job access
             application_repository: ApplicationRepository for tracking
             claude_client: Optional Anthropic client (creates new if None)
-            config_path: Path to agents configuration file
+            config_path: Optional path to an agents configuration file (uses the shared Config agents.yaml if None)
         """
         self.jobs_repo = jobs_repository
         self.app_repo = application_repository
@@ -54,13 +54,16 @@ class JobProcessorService:
         else:
             self.claude_client = claude_client
 
-        # Load agent configurations
+        # Load agent configurations (the Config singleton parses agents.yaml once per process)
         try:
-            with open(config_path, "r") as f:
-                self.agent_configs = yaml.safe_load(f)
-            logger.info(f"Loaded agent configurations from {config_path}")
+            if config_path is None:
+                self.agent_configs = get_config().agents
+            else:
+                with open(config_path, "r") as f:
+                    self.agent_configs = yaml.safe_load(f)
+            logger.info(f"Loaded agent configurations from {config_path or 'Config.agents'}")
         except Exception as e:
-            logger.error(f"Failed to load agent config from {config_path}: {e}")
+            logger.error(f"Failed to load agent config from {config_path or 'Config.agents'}: {e}")
             self.agent_configs = {}
 
         logger.info("JobProcessorService initialized with full agent pipeline")
@@ -110,7 +113,7 @@ class JobProcessorService:
 
         return agents
 
-    async def _run_agent_pipeline_async(self, job_id: UUID, agents: dict[str, Any]) -> dict[str, Any]:
+    async def _run_agent_pipeline_async(self, job_id: str, agents: dict[str, Any]) -> dict[str, Any]:
         """Run the agent pipeline asynchronously.
 
         Args:
@@ -175,7 +178,16 @@ class JobProcessorService:
             logger.error(f"Pipeline execution exception: {e}")
             return {"status": "failed", "job_id": job_id_str, "stages_completed": stages_completed, "pipeline_results": pipeline_results, "error": str(e), "message": f"Pipeline failed with exception: {str(e)}"}
 
-    def process_job(self, job_id: UUID) -> dict[str, Any]:
+        finally:
+            # Finish background work and release owned resources (browsers, HTTP clients) before the event loop closes;
+            # close() flushes first, agents without one only need the flush
+            for agent in agents.values():
+                if hasattr(agent, "close"):
+                    await agent.close()
+                elif hasattr(agent, "flush"):
+                    await agent.flush()
+
+    def process_job(self, job_id: str) -> dict[str, Any]:
         """Process job through agent pipeline.
 
         This method orchestrates the full agent pipeline:
@@ -227,7 +239,7 @@ class JobProcessorService:
             logger.error(f"Job processing failed: {job_id} - {str(e)}")
             return {"status": "failed", "job_id": str(job_id), "stages_completed": [], "error": str(e), "message": f"Processing failed with exception: {str(e)}"}
 
-    def get_processing_status(self, job_id: UUID) -> dict[str, Any]:
+    def get_processing_status(self, job_id: str) -> dict[str, Any]:
         """Get current processing status for a job.
 
         Args:
@@ -101,6 +101,19 @@ class PlaywrightService:
         except Exception as e:
             logger.error(f"[playwright_service] Error closing browser: {e}")
 
+    async def close_page(self, page: Page) -> None:
+        """
+        Close a page together with its browser context.
+
+        Args:
+            page: Page instance returned by navigate_to_form
+        """
+        try:
+            await page.context.close()
+            logger.debug("[playwright_service] Browser context closed")
+        except Exception as e:
+            logger.error(f"[playwright_service] Error closing browser context: {e}")
+
     async def navigate_to_form(self, browser: Browser, url: str) -> Page:
         """
         Navigate to application form URL.
@@ -115,8 +128,8 @@ class PlaywrightService:
         Raises:
             TimeoutError: If navigation times out
         """
+        context = await browser.new_context()
         try:
-            context = await browser.new_context()
             page = await context.new_page()
 
             logger.info(f"[playwright_service] Navigating to {url}")
@@ -128,9 +141,11 @@ class PlaywrightService:
 
         except TimeoutError as e:
             logger.error(f"[playwright_service] Navigation timeout for {url}: {e}")
+            await context.close()
             raise
         except Exception as e:
             logger.error(f"[playwright_service] Navigation error for {url}: {e}")
+            await context.close()
             raise
 
     async def detect_form_fields(self, page: Page) -> FormFieldMappings:
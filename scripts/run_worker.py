@@ -8,26 +8,45 @@ Usage:
     python scripts/run_worker.py
     python scripts/run_worker.py --name worker-1
     python scripts/run_worker.py --burst  # Exit after processing all jobs
+    python scripts/run_worker.py --simple  # Reuse connections across jobs (no fork per job)
 """
 
 import argparse
+import os
 import sys
 
 from loguru import logger
-from rq import Worker
+from rq import SimpleWorker, Worker
 
 from app.job_queue.redis_client import check_redis_health, get_redis_connection
 
 
+def setup_logging() -> None:
+    """
+    Configure logging for worker processes.
+
+    In production the worker logs with a plain format through a queued
+    sink; development keeps loguru's default colourised output.
+    """
+    if os.getenv("APP_ENV", "development") != "production":
+        return
+
+    logger.remove()  # Remove default handler
+    logger.add(sys.stderr, format="{time} {level} {message}", level=os.getenv("LOG_LEVEL", "INFO"), enqueue=True)
+
+
 def main():
     """Start RQ worker."""
     parser = argparse.ArgumentParser(description="Start RQ worker for job processing")
     parser.add_argument("--name", type=str, default=None, help="Worker name (default: auto-generated)")
     parser.add_argument("--burst", action="store_true", help="Exit after processing all jobs (for testing)")
+    parser.add_argument("--simple", action="store_true", help="Run jobs in the worker process instead of a forked child, reusing connections and the job processor across jobs")
     parser.add_argument("--queue", type=str, default="job_processing_queue", help="Queue name to process (default: job_processing_queue)")
 
     args = parser.parse_args()
 
+    setup_logging()
+
     # Check Redis health
     logger.info("Checking Redis connection...")
     if not check_redis_health():
@@ -40,7 +59,8 @@ def main():
     redis = get_redis_connection()
 
     # Create worker
-    worker = Worker(queues=[args.queue], connection=redis, name=args.name)
+    worker_class = SimpleWorker if args.simple else Worker
+    worker = worker_class(queues=[args.queue], connection=redis, name=args.name)
 
     logger.info(f"Starting worker: {worker.name}")
     logger.info(f"Listening to queue: {args.queue}")
@@ -0,0 +1,51 @@
+"""
+Tests for the health check endpoint.
+
+Tests the response body and its short-lived cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.main import app
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Create test client with an empty health cache."""
+    monkeypatch.setattr(main, "_health_cache", None)
+    return TestClient(app)
+
+
+class TestHealthCheck:
+    """Test /health responses and caching."""
+
+    def test_health_reports_database_status(self, client):
+        """Test the health body includes the database status as JSON."""
+        with patch("app.main.get_database_info", return_value={"exists": True, "table_count": 3}):
+            response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["database"] == {"status": "connected", "tables": 3}
+
+    def test_health_reuses_body_within_ttl(self, client):
+        """Test repeated probes within the TTL query the database once."""
+        with patch("app.main.get_database_info", return_value={"exists": True, "table_count": 3}) as mock_info:
+            first = client.get("/health")
+            second = client.get("/health")
+
+        assert mock_info.call_count == 1
+        assert first.content == second.content
+
+    def test_health_refreshes_after_ttl(self, client, monkeypatch):
+        """Test the database is queried again once the cached body expires."""
+        monkeypatch.setattr(main, "HEALTH_CACHE_TTL_SECONDS", 0.0)
+        with patch("app.main.get_database_info", side_effect=[{"exists": True, "table_count": 3}, RuntimeError("db down")]):
+            client.get("/health")
+            response = client.get("/health")
+
+        assert response.json()["database"] == {"status": "error", "tables": 0}
@@ -0,0 +1,89 @@
+"""
+Tests for job and application listing API endpoints.
+
+Tests repository injection, pagination responses, job discovery and CORS origin checks.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app, get_application_repository, get_jobs_repository
+from app.models.job import Job
+
+
+@pytest.fixture
+def client():
+    """Create test client and clear dependency overrides afterwards."""
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+class TestRepositoryDependencies:
+    """Test repositories are injected as shared dependencies."""
+
+    def test_repository_dependencies_are_shared(self):
+        """Test each dependency returns the same repository on every call."""
+        assert get_jobs_repository() is get_jobs_repository()
+        assert get_application_repository() is get_application_repository()
+
+    def test_list_jobs_uses_injected_repository(self, client):
+        """Test list_jobs reads from the injected repository."""
+        repo = MagicMock()
+        repo.list_raw_with_count.return_value = ([Job(company_name="Acme Corp", job_title="Data Engineer", job_url="https://seek.com.au/jobs/1", platform_source="seek").to_dict()], 1)
+        app.dependency_overrides[get_jobs_repository] = lambda: repo
+
+        response = client.get("/api/jobs", params={"platform": "seek", "limit": 500})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["pagination"] == {"limit": 100, "offset": 0, "total": 1, "has_more": False}
+        repo.list_raw_with_count.assert_called_once_with(filters={"platform_source": "seek"}, limit=100, offset=0)
+
+    def test_get_application_not_found(self, client):
+        """Test get_application returns 404 when the repository has no match."""
+        repo = MagicMock()
+        repo.get_application_by_id.return_value = None
+        app.dependency_overrides[get_application_repository] = lambda: repo
+
+        response = client.get("/api/applications/missing")
+
+        assert response.status_code == 404
+
+
+class TestCORS:
+    """Test CORS origin checks against the configured origins."""
+
+    def test_allowed_origin_is_echoed(self, client):
+        """Test a configured origin is allowed."""
+        response = client.options("/health", headers={"Origin": "http://localhost:5173", "Access-Control-Request-Method": "GET"})
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+
+    def test_unknown_origin_is_rejected(self, client):
+        """Test an origin outside the configured set is not allowed."""
+        response = client.options("/health", headers={"Origin": "http://evil.example.com", "Access-Control-Request-Method": "GET"})
+
+        assert response.status_code == 400
+        assert "access-control-allow-origin" not in response.headers
+
+
+class TestDiscoverJobs:
+    """Test job discovery runs the enabled pollers."""
+
+    def test_discover_runs_enabled_pollers_and_isolates_failures(self, client):
+        """Test each enabled poller reports its own metrics or error."""
+        config = MagicMock()
+        config.search = {"seek": {"enabled": True}, "indeed": {"enabled": True}}
+        config.platforms = {}
+
+        with patch("app.main.get_config", return_value=config), patch("app.pollers.seek_poller.SEEKPoller") as mock_seek, patch("app.pollers.indeed_poller.IndeedPoller") as mock_indeed:
+            mock_seek.return_value.run_once.return_value = {"jobs_found": 3}
+            mock_indeed.return_value.run_once.side_effect = RuntimeError("rate limited")
+
+            response = client.post("/api/discover")
+
+        assert response.status_code == 200
+        assert response.json()["pollers"] == {"seek": {"jobs_found": 3}, "indeed": {"error": "rate limited"}}
@@ -0,0 +1,58 @@
+"""
+Tests for pending job and pipeline API endpoints.
+
+Tests service injection and error responses.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app, get_approval_mode_service, get_pending_jobs_service, get_pipeline_metrics_service
+
+
+@pytest.fixture
+def client():
+    """Create test client and clear dependency overrides afterwards."""
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+class TestServiceDependencies:
+    """Test services are injected as shared dependencies."""
+
+    def test_list_pending_jobs_uses_injected_service(self, client):
+        """Test list_pending_jobs reads from the injected service."""
+        service = MagicMock()
+        service.get_pending_jobs.return_value = [{"job_id": "job-1"}]
+        app.dependency_overrides[get_pending_jobs_service] = lambda: service
+
+        response = client.get("/api/pending", params={"limit": 5})
+
+        assert response.status_code == 200
+        assert response.json() == {"pending_jobs": [{"job_id": "job-1"}], "count": 1}
+        service.get_pending_jobs.assert_called_once_with(limit=5)
+
+    def test_approve_rejected_by_service_returns_400(self, client):
+        """Test a ValueError from the approval service becomes a 400."""
+        service = MagicMock()
+        service.approve_job.side_effect = ValueError("Job is not pending")
+        app.dependency_overrides[get_approval_mode_service] = lambda: service
+
+        response = client.post("/api/pending/550e8400-e29b-41d4-a716-446655440000/approve")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Job is not pending"
+
+    def test_pipeline_status_uses_injected_service(self, client):
+        """Test get_pipeline_status reads metrics from the injected service."""
+        service = MagicMock()
+        service.get_active_jobs_in_pipeline.return_value = []
+        service.get_pipeline_stage_counts.return_value = {"job_matcher": 2}
+        app.dependency_overrides[get_pipeline_metrics_service] = lambda: service
+
+        response = client.get("/api/pipeline")
+
+        assert response.status_code == 200
+        assert response.json()["stage_counts"] == {"job_matcher": 2}
@@ -0,0 +1,59 @@
+"""
+Tests for application startup.
+
+Tests database initialization, config warm-up and the task factory in the lifespan handler.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+class TestLifespan:
+    """Test the lifespan startup tasks."""
+
+    def test_startup_initializes_database_and_warms_config(self, monkeypatch):
+        """Test both startup tasks run by default."""
+        monkeypatch.delenv("INIT_DB_ON_STARTUP", raising=False)
+        with patch("app.main.initialize_database") as mock_init_db, patch("app.main._warm_config") as mock_warm_config:
+            with TestClient(app):
+                pass
+
+        mock_init_db.assert_called_once_with()
+        mock_warm_config.assert_called_once_with()
+
+    def test_startup_skips_database_when_disabled(self, monkeypatch):
+        """Test INIT_DB_ON_STARTUP=false skips database initialization."""
+        monkeypatch.setenv("INIT_DB_ON_STARTUP", "false")
+        with patch("app.main.initialize_database") as mock_init_db, patch("app.main._warm_config") as mock_warm_config:
+            with TestClient(app):
+                pass
+
+        mock_init_db.assert_not_called()
+        mock_warm_config.assert_called_once_with()
+
+    def test_startup_survives_task_failures(self, monkeypatch):
+        """Test a failing startup task is logged rather than aborting startup."""
+        monkeypatch.delenv("INIT_DB_ON_STARTUP", raising=False)
+        with patch("app.main.initialize_database", side_effect=RuntimeError("db locked")), patch("app.main._warm_config", side_effect=FileNotFoundError("search.yaml")):
+            with TestClient(app) as client:
+                assert client.get("/").status_code == 200
+
+    def test_startup_installs_eager_task_factory(self, monkeypatch):
+        """Test the lifespan installs the task factory on the serving loop."""
+        calls = []
+
+        def factory(loop, coro, **kwargs):
+            calls.append(coro)
+            return asyncio.Task(coro, loop=loop, **kwargs)
+
+        monkeypatch.setenv("INIT_DB_ON_STARTUP", "false")
+        monkeypatch.setattr("app.main._EAGER_TASK_FACTORY", factory)
+        with patch("app.main._warm_config"):
+            with TestClient(app):
+                pass
+
+        assert calls
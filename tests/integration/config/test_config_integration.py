@@ -24,10 +24,11 @@ class TestConfigIntegration:
         assert hasattr(config, "similarity")
 
     def test_config_singleton_across_modules(self) -> None:
-        """Test Config singleton works across module imports."""
-        from app.config import Config, get_config
+        """Test the shared Config instance works across module imports."""
+        from app.config import get_config
+        from app.config.loader import get_config as loader_get_config
 
-        config1 = Config()
+        config1 = loader_get_config()
         config2 = get_config()
         assert config1 is config2
 
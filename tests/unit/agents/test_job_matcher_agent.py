@@ -41,23 +41,22 @@ class TestJobMatcherAgentStructure:
 
         assert agent.model == "claude-sonnet-4"
 
-    def test_model_property_defaults_to_sonnet(self):
-        """Verify model defaults to claude-sonnet-4 if not in config."""
+    def test_model_property_defaults_to_haiku(self):
+        """Verify model defaults to claude-haiku-4-5 if not in config."""
         config = {}
         agent = JobMatcherAgent(config, Mock(), Mock())
 
-        assert agent.model == "claude-sonnet-4"
+        assert agent.model == "claude-haiku-4-5"
 
 
 @pytest.mark.asyncio
 class TestConfigurationLoading:
     """Test configuration loading from YAML files."""
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_load_search_criteria(self, mock_yaml_load, mock_open):
+    @patch("app.agents.job_matcher_agent.get_config")
+    async def test_load_search_criteria(self, mock_get_config):
         """Test loading search criteria from search.yaml."""
-        mock_yaml_load.return_value = {
+        mock_get_config.return_value.search = {
             "technologies": {"must_have": ["Python", "SQL", "Azure"], "strong_preference": ["PySpark", "Databricks"], "nice_to_have": ["Docker", "Kafka"]},
             "locations": {"primary": "Remote (Australia-wide)", "acceptable": "Hybrid with >70% remote"},
         }
@@ -150,6 +149,12 @@ class TestScoreCalculation:
 
         assert score == 0.0
 
+    async def test_to_milli_quantizes_score(self):
+        """Test scores are quantized to integer thousandths."""
+        assert JobMatcherAgent._to_milli(0.6667) == 667
+        assert JobMatcherAgent._to_milli(0.0) == 0
+        assert JobMatcherAgent._to_milli(1.0) == 1000
+
     async def test_calculate_final_score_perfect_match(self):
         """Test final weighted score calculation for perfect match."""
         config = {"model": "claude-sonnet-4", "scoring_weights": {"must_have_present": 0.50, "strong_preference_present": 0.30, "nice_to_have_present": 0.10, "location_match": 0.10}}
@@ -304,6 +309,94 @@ class TestProcessMethod:
         assert result.output["approved"] is True
         assert result.output["match_score"] >= 0.70
         assert "Python" in result.output["must_have_found"]
+        mock_app_repo.apply_stage_result.assert_awaited_once_with("job-123", "job_matcher", result.output, "matched")
+        mock_app_repo.update_current_stage.assert_not_awaited()
+        mock_app_repo.update_status.assert_not_awaited()
+
+    async def test_process_uses_structured_tool_output(self):
+        """Test process scores directly from score_job tool output."""
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        tool_input = {"must_have_found": ["Python", "SQL", "Azure"], "must_have_missing": [], "strong_pref_found": ["PySpark"], "nice_to_have_found": ["Docker"], "location_assessment": "primary", "reasoning": "Strong match"}
+        mock_response.content = [Mock(type="tool_use", input=tool_input)]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-321", "title": "Data Engineer", "description": "Python, SQL, Azure, PySpark, Docker", "location": "Remote"})
+
+        with patch.object(JobMatcherAgent, "_load_search_criteria") as mock_load:
+            mock_load.return_value = {"must_have": ["Python", "SQL", "Azure"], "strong_preference": ["PySpark"], "nice_to_have": ["Docker"], "primary_location": "Remote"}
+
+            agent = JobMatcherAgent({"model": "claude-sonnet-4"}, mock_claude, mock_app_repo)
+            result = await agent.process("job-321")
+
+        assert result.success is True
+        assert result.output["match_score"] == 1.0
+        assert result.output["match_score_milli"] == 1000
+        assert result.output["scoring_breakdown"]["location_score_milli"] == 1000
+        assert result.output["reasoning"] == "Strong match"
+        call_kwargs = mock_claude.messages.create.call_args.kwargs
+        assert call_kwargs["max_tokens"] == 256 + 32
+        assert call_kwargs["tool_choice"] == {"type": "tool", "name": "score_job"}
+
+    async def test_process_fills_partial_tool_output(self):
+        """Test a tool input missing required fields is scored with empty-match defaults."""
+        mock_claude = AsyncMock()
+        mock_claude.messages.create = AsyncMock(return_value=Mock(content=[Mock(type="tool_use", input={"must_have_found": ["Python"]})]))
+
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-322", "title": "Data Engineer", "description": "Python", "location": "Sydney"})
+
+        with patch.object(JobMatcherAgent, "_load_search_criteria") as mock_load:
+            mock_load.return_value = {"must_have": ["Python"], "strong_preference": [], "nice_to_have": [], "primary_location": "Remote"}
+
+            agent = JobMatcherAgent({"model": "claude-sonnet-4", "escalation_model": "claude-sonnet-4"}, mock_claude, mock_app_repo)
+            result = await agent.process("job-322")
+
+        assert result.success is True
+        assert result.output["location_matched"] == "no_match"
+        assert result.output["must_have_found"] == ["Python"]
+        assert result.output["strong_pref_found"] == []
+
+    async def test_process_treats_truncated_tool_output_as_parse_failure(self):
+        """Test a response stopped at max_tokens is discarded rather than scored."""
+        truncated = Mock(stop_reason="max_tokens", content=[Mock(type="tool_use", input={"must_have_found": ["Python", "SQL"]})])
+        mock_claude = AsyncMock()
+        mock_claude.messages.create = AsyncMock(return_value=truncated)
+
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-323", "title": "Data Engineer", "description": "Kotlin", "location": "Sydney"})
+
+        with patch.object(JobMatcherAgent, "_load_search_criteria") as mock_load:
+            mock_load.return_value = {"must_have": ["Python", "SQL"], "strong_preference": [], "nice_to_have": [], "primary_location": "Remote"}
+
+            agent = JobMatcherAgent({"model": "claude-sonnet-4"}, mock_claude, mock_app_repo)
+            result = await agent.process("job-323")
+
+        assert result.success is True
+        assert result.output["must_have_found"] == []
+        assert result.output["approved"] is False
+        assert result.output["reasoning"] == "Failed to parse matching results"
+
+    async def test_process_escalates_ambiguous_location(self):
+        """Test no_match location is re-checked with the escalation model when the description names the primary location."""
+        first = Mock(content=[Mock(type="tool_use", input={"must_have_found": ["Python"], "must_have_missing": [], "strong_pref_found": [], "nice_to_have_found": [], "location_assessment": "no_match", "reasoning": "Unsure"})])
+        second = Mock(content=[Mock(type="tool_use", input={"must_have_found": ["Python"], "must_have_missing": [], "strong_pref_found": [], "nice_to_have_found": [], "location_assessment": "primary", "reasoning": "Remote role"})])
+        mock_claude = AsyncMock()
+        mock_claude.messages.create = AsyncMock(side_effect=[first, second])
+
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-654", "title": "Data Engineer", "description": "Python role, fully remote", "location": "Australia"})
+
+        with patch.object(JobMatcherAgent, "_load_search_criteria") as mock_load:
+            mock_load.return_value = {"must_have": ["Python"], "strong_preference": [], "nice_to_have": [], "primary_location": "Remote"}
+
+            agent = JobMatcherAgent({"model": "claude-haiku-4-5", "escalation_model": "claude-sonnet-4"}, mock_claude, mock_app_repo)
+            result = await agent.process("job-654")
+
+        assert result.output["location_matched"] == "primary"
+        models = [call.kwargs["model"] for call in mock_claude.messages.create.call_args_list]
+        assert models == ["claude-haiku-4-5", "claude-sonnet-4"]
 
     async def test_process_rejected_job(self):
         """Test processing a job that gets rejected."""
@@ -386,3 +479,37 @@ class TestErrorHandling:
 
         assert result.success is False
         assert "API" in result.error_message or "rate limit" in result.error_message.lower()
+
+
+@pytest.mark.asyncio
+class TestLocalPrematch:
+    """Test the local verbatim technology scan."""
+
+    async def test_scan_technologies_word_boundaries(self):
+        """Test scan matches whole technology names only."""
+        from app.agents.job_matcher_agent import scan_technologies
+
+        text = "we use pyspark, azure data factory and ci/cd daily"
+
+        assert scan_technologies(text, ["Spark", "PySpark", "Azure Data Factory", "CI/CD", "Kafka"]) == ["PySpark", "Azure Data Factory", "CI/CD"]
+
+    async def test_prematch_technologies(self):
+        """Test prematch scans title and description for each category."""
+        agent = JobMatcherAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+        criteria = {"must_have": ["Python", "SQL", "Azure"], "strong_preference": ["PySpark"], "nice_to_have": ["Docker"]}
+
+        matches = agent._prematch_technologies("python data engineer\nsql and docker required", criteria)
+
+        assert matches == {"must_have_found": ["Python", "SQL"], "strong_pref_found": [], "nice_to_have_found": ["Docker"]}
+
+    async def test_merge_local_matches_adds_missed_technologies(self):
+        """Test local matches are added to Claude's findings without duplicates."""
+        agent = JobMatcherAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+        parsed = {"must_have_found": ["python"], "must_have_missing": ["SQL"], "strong_pref_found": [], "nice_to_have_found": []}
+        local = {"must_have_found": ["Python", "SQL"], "strong_pref_found": ["PySpark"], "nice_to_have_found": []}
+
+        merged = agent._merge_local_matches(parsed, local)
+
+        assert merged["must_have_found"] == ["python", "SQL"]
+        assert merged["must_have_missing"] == []
+        assert merged["strong_pref_found"] == ["PySpark"]
@@ -1,5 +1,6 @@
 """Unit tests for OrchestratorAgent."""
 
+import time
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -8,6 +9,16 @@ from app.agents.base_agent import BaseAgent
 from app.agents.orchestrator_agent import OrchestratorAgent
 
 
+@pytest.fixture(autouse=True)
+def _clear_recommendation_cache():
+    """The recommendation cache is shared across instances; isolate each test."""
+    OrchestratorAgent._recommendation_cache.clear()
+    OrchestratorAgent._cache_stats.clear()
+    yield
+    OrchestratorAgent._recommendation_cache.clear()
+    OrchestratorAgent._cache_stats.clear()
+
+
 class TestStructure:
     """Test agent structure."""
 
@@ -22,6 +33,23 @@ class TestStructure:
         agent = OrchestratorAgent(config, Mock(), Mock())
         assert agent.model == "claude-sonnet-4"
 
+    @pytest.mark.asyncio
+    async def test_owned_client_closed_on_close(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, None, Mock())
+
+        assert agent._claude.is_closed() is False
+        await agent.close()
+        assert agent._claude.is_closed() is True
+
+    @pytest.mark.asyncio
+    async def test_injected_client_left_open_on_close(self):
+        mock_claude = AsyncMock()
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, Mock())
+
+        await agent.close()
+        mock_claude.close.assert_not_called()
+
 
 @pytest.mark.asyncio
 class TestStageVerification:
@@ -50,6 +78,14 @@ class TestStageVerification:
         result = agent._verify_required_stages(stage_outputs)
         assert result is False
 
+    async def test_verify_empty_stage(self):
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+
+        stage_outputs = {"job_matcher": {"match_score": 85.5}, "salary_validator": {"passed": True}, "cv_tailor": {}, "cover_letter_writer": {"cl_file_path": "path/to/cl.docx"}, "qa": {"pass": True}}
+
+        result = agent._verify_required_stages(stage_outputs)
+        assert result is False
+
     async def test_extract_metrics_from_stages(self):
         agent = OrchestratorAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
 
@@ -181,6 +217,30 @@ class TestAutoRejectDecision:
         decision = agent._apply_decision_rules(metrics)
         assert decision == "auto_reject"
 
+    async def test_decision_table_matches_rules_exhaustively(self):
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+
+        for match_score in (30.0, 60.0, 84.9, 85.0, 99.0):
+            for salary_passed in (True, False):
+                for qa_passed in (True, False):
+                    for has_warnings in (True, False):
+                        metrics = {"match_score": match_score, "salary_passed": salary_passed, "qa_passed": qa_passed, "qa_has_warnings": has_warnings}
+                        if match_score < 60 or not salary_passed or not qa_passed:
+                            expected = "auto_reject"
+                        elif match_score >= 85 and not has_warnings:
+                            expected = "auto_approve"
+                        else:
+                            expected = "needs_human_approval"
+                        assert agent._apply_decision_rules(metrics) == expected
+
+    async def test_evaluate_returns_metrics_and_decision(self):
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+        stage_outputs = _complete_stage_outputs(90.0)
+        stage_outputs["qa"] = {"pass": True, "issues": [{"severity": "warning"}]}
+
+        assert agent._evaluate(stage_outputs) == (True, {"match_score": 90.0, "salary_passed": True, "qa_passed": True, "qa_has_warnings": True}, "needs_human_approval")
+        assert agent._evaluate({"job_matcher": {"match_score": 90.0}}) == (False, {}, "")
+
 
 @pytest.mark.asyncio
 class TestClaudeDecisionSupport:
@@ -203,6 +263,112 @@ class TestClaudeDecisionSupport:
         assert result["recommended_decision"] == "auto_approve"
         assert result["confidence"] == 0.92
 
+    async def test_static_prompt_prefix_marked_for_caching(self):
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"recommended_decision": "auto_approve", "reasoning": "Strong match", "confidence": 0.92, "flagged_concerns": []}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, Mock())
+        await agent._get_claude_recommendation({"title": "Senior Data Engineer"}, {"job_matcher": {"match_score": 90.0}})
+
+        kwargs = mock_claude.messages.create.call_args.kwargs
+        static_block, job_block = kwargs["messages"][0]["content"]
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert static_block["cache_control"] == {"type": "ephemeral"}
+        assert "DECISION CRITERIA" in static_block["text"]
+        assert "cache_control" not in job_block
+        assert "Senior Data Engineer" in job_block["text"]
+
+    async def test_prompt_omits_placeholder_fields(self):
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"recommended_decision": "auto_approve", "reasoning": "Strong match", "confidence": 0.92, "flagged_concerns": []}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, Mock())
+        await agent._get_claude_recommendation({"title": "Senior Data Engineer"}, {"job_matcher": {"match_score": 90.0}, "salary_validator": {"passed": True}, "qa": {"pass": True}})
+
+        prompt = mock_claude.messages.create.call_args.kwargs["messages"][0]["content"][-1]["text"]
+        assert "Title: Senior Data Engineer" in prompt
+        assert "Unknown" not in prompt
+        assert "Not specified" not in prompt
+        assert "No reasoning provided" not in prompt
+
+    async def test_claude_recommendation_cached_by_content(self):
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"recommended_decision": "auto_approve", "reasoning": "Strong match", "confidence": 0.92, "flagged_concerns": []}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, Mock())
+
+        job_data = {"title": "Senior Data Engineer"}
+        stage_outputs = {"job_matcher": {"match_score": 90.0}, "salary_validator": {"passed": True}, "qa": {"pass": True, "issues": []}}
+
+        first = await agent._get_claude_recommendation(job_data, stage_outputs)
+        second = await agent._get_claude_recommendation(job_data, stage_outputs)
+        await agent._get_claude_recommendation({"title": "Other Role"}, stage_outputs)
+
+        assert first == second
+        assert mock_claude.messages.create.call_count == 2
+
+    async def test_recommendation_cache_shared_across_instances(self):
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"recommended_decision": "auto_approve", "reasoning": "Strong match", "confidence": 0.92, "flagged_concerns": []}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        job_data = {"title": "Senior Data Engineer"}
+        stage_outputs = {"job_matcher": {"match_score": 90.0}, "salary_validator": {"passed": True}, "qa": {"pass": True, "issues": []}}
+
+        first = await OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, Mock())._get_claude_recommendation(job_data, stage_outputs)
+        second = await OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, Mock())._get_claude_recommendation(job_data, stage_outputs)
+
+        assert first == second
+        assert mock_claude.messages.create.call_count == 1
+        assert OrchestratorAgent._cache_stats == {"hits": 1, "misses": 1}
+
+    async def test_low_confidence_recommendation_not_cached(self):
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"recommended_decision": "needs_human_approval", "reasoning": "Unsure", "confidence": 0.40, "flagged_concerns": []}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, Mock())
+
+        job_data = {"title": "Senior Data Engineer"}
+        stage_outputs = {"job_matcher": {"match_score": 70.0}, "salary_validator": {"passed": True}, "qa": {"pass": True, "issues": []}}
+
+        result = await agent._get_claude_recommendation(job_data, stage_outputs)
+        await agent._get_claude_recommendation(job_data, stage_outputs)
+
+        assert mock_claude.messages.create.call_count == 2
+        assert result == {"recommended_decision": "needs_human_approval", "confidence": 0.40, "reasoning": "Unsure", "flagged_concerns": ()}
+
+    async def test_claude_recommendation_normalized(self):
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"recommended_decision": "maybe", "confidence": 0.9, "flagged_concerns": ["remote only"]}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, Mock())
+        result = await agent._get_claude_recommendation({"title": "Data Engineer"}, {"job_matcher": {"match_score": 90}})
+
+        assert result == {"recommended_decision": "needs_human_approval", "reasoning": "", "confidence": 0.9, "flagged_concerns": ("remote only",)}
+
+    async def test_claude_non_object_response_fallback(self):
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='["auto_approve"]')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, Mock())
+        result = await agent._get_claude_recommendation({"title": "Data Engineer"}, {"job_matcher": {"match_score": 90}})
+
+        assert result["recommended_decision"] == "needs_human_approval"
+        assert result["flagged_concerns"] == ("AI recommendation unavailable",)
+
     async def test_claude_api_failure_fallback(self):
         mock_claude = AsyncMock()
         mock_claude.messages.create = AsyncMock(side_effect=Exception("API error"))
@@ -325,6 +491,11 @@ class TestProcessMethod:
         assert "decision" in result.output
         assert result.output["decision"] == "auto_approve"
 
+        await agent.flush()
+        mock_app_repo.update_current_stage.assert_awaited_once_with("job-123", "orchestrator")
+        mock_app_repo.update_status.assert_awaited_once_with("job-123", "approved")
+        mock_app_repo.add_completed_stage.assert_awaited_once()
+
     async def test_process_needs_approval_success(self):
         mock_claude = AsyncMock()
         mock_response = Mock()
@@ -348,6 +519,141 @@ class TestProcessMethod:
 
         assert result.success is True
         assert result.output["decision"] == "needs_human_approval"
+        assert result.output["flagged_concerns"] == ("salary slightly low",)
+
+    async def test_process_auto_reject_skips_claude(self):
+        mock_claude = AsyncMock()
+        mock_claude.messages.create = AsyncMock()
+
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123", "title": "Data Engineer"})
+        mock_app_repo.get_stage_outputs = AsyncMock(
+            return_value={
+                "job_matcher": {"match_score": 40.0, "reasoning": "Poor match"},
+                "salary_validator": {"passed": True, "analysis": "Within range"},
+                "cv_tailor": {"cv_file_path": "path/to/cv.docx"},
+                "cover_letter_writer": {"cl_file_path": "path/to/cl.docx"},
+                "qa": {"pass": True, "issues": []},
+            }
+        )
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, mock_app_repo)
+        result = await agent.process("job-123")
+
+        assert result.success is True
+        assert result.output["decision"] == "auto_reject"
+        mock_claude.messages.create.assert_not_called()
+
+    async def test_process_certain_approve_skips_claude(self):
+        mock_claude = AsyncMock()
+        mock_claude.messages.create = AsyncMock()
+
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123", "title": "Data Engineer"})
+        mock_app_repo.get_stage_outputs = AsyncMock(return_value=_complete_stage_outputs(97.0))
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, mock_app_repo)
+        result = await agent.process("job-123")
+
+        assert result.output["decision"] == "auto_approve"
+        assert result.output["confidence"] == 0.99
+        mock_claude.messages.create.assert_not_called()
+
+    async def test_certain_reject_applies_without_hard_reject_skip(self, monkeypatch):
+        monkeypatch.setattr("app.agents.orchestrator_agent.SKIP_CLAUDE_ON_HARD_REJECT", False)
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+
+        assert agent._rule_based_recommendation("auto_reject", {"match_score": 20.0})["recommended_decision"] == "auto_reject"
+        assert agent._rule_based_recommendation("auto_reject", {"match_score": 50.0}) is None
+        assert agent._rule_based_recommendation("auto_approve", {"match_score": 90.0}) is None
+
+
+def _complete_stage_outputs(match_score: float) -> dict:
+    return {
+        "job_matcher": {"match_score": match_score, "reasoning": "Match"},
+        "salary_validator": {"passed": True, "analysis": "Within range"},
+        "cv_tailor": {"cv_file_path": "path/to/cv.docx"},
+        "cover_letter_writer": {"cl_file_path": "path/to/cl.docx"},
+        "qa": {"pass": True, "issues": []},
+    }
+
+
+@pytest.mark.asyncio
+class TestBatchProcessing:
+    """Test batched orchestration."""
+
+    async def test_process_batch_single_claude_call(self):
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [
+            Mock(
+                text='[{"job": 1, "recommended_decision": "auto_approve", "reasoning": "Great", "confidence": 0.95, "flagged_concerns": []}, '
+                '{"job": 2, "recommended_decision": "needs_human_approval", "reasoning": "Moderate", "confidence": 0.80, "flagged_concerns": []}]'
+            )
+        ]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        scores = {"job-1": 90.0, "job-2": 70.0, "job-3": 40.0}
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(side_effect=lambda job_id: {"id": job_id, "title": f"Role {job_id}"})
+        mock_app_repo.get_stage_outputs = AsyncMock(side_effect=lambda job_id: _complete_stage_outputs(scores[job_id]))
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, mock_app_repo)
+        results = await agent.process_batch(["job-1", "job-2", "job-3"])
+        await agent.flush()
+
+        assert [r.output["decision"] for r in results] == ["auto_approve", "needs_human_approval", "auto_reject"]
+        mock_claude.messages.create.assert_called_once()
+        assert "JOB 2:" in mock_claude.messages.create.call_args.kwargs["messages"][0]["content"][-1]["text"]
+
+    async def test_process_batch_falls_back_to_per_job_calls(self):
+        batch_response = Mock(content=[Mock(text='{"not": "a list"}')])
+        single_response = Mock(content=[Mock(text='{"recommended_decision": "auto_approve", "reasoning": "Great", "confidence": 0.95, "flagged_concerns": []}')])
+        mock_claude = AsyncMock()
+        mock_claude.messages.create = AsyncMock(side_effect=[batch_response, single_response, single_response])
+
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(side_effect=lambda job_id: {"id": job_id, "title": f"Role {job_id}"})
+        mock_app_repo.get_stage_outputs = AsyncMock(return_value=_complete_stage_outputs(90.0))
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, mock_claude, mock_app_repo)
+        results = await agent.process_batch(["job-1", "job-2"])
+        await agent.flush()
+
+        assert [r.output["decision"] for r in results] == ["auto_approve", "auto_approve"]
+        assert mock_claude.messages.create.call_count == 3
+
+    async def test_process_batch_times_each_job_separately(self, monkeypatch):
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(side_effect=lambda job_id: {"id": job_id, "title": f"Role {job_id}"})
+        mock_app_repo.get_stage_outputs = AsyncMock(return_value=_complete_stage_outputs(97.0))
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, Mock(), mock_app_repo)
+        evaluate = agent._evaluate
+        calls = []
+
+        def slow_first_evaluate(stage_outputs):
+            calls.append(stage_outputs)
+            if len(calls) == 1:
+                time.sleep(0.05)
+            return evaluate(stage_outputs)
+
+        monkeypatch.setattr(agent, "_evaluate", slow_first_evaluate)
+        results = await agent.process_batch(["job-1", "job-2"])
+        await agent.flush()
+
+        assert results[0].execution_time_ms >= 50
+        assert results[1].execution_time_ms < 50
+
+    async def test_process_batch_reports_missing_jobs(self):
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(return_value=None)
+
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, Mock(), mock_app_repo)
+        results = await agent.process_batch(["missing-job"])
+
+        assert results[0].success is False
+        assert "not found" in results[0].error_message.lower()
 
 
 @pytest.mark.asyncio
@@ -404,3 +710,11 @@ class TestReasoningGeneration:
         reasoning = agent._generate_reasoning(decision, metrics)
         assert "45" in reasoning or "low" in reasoning.lower()
         assert "reject" in reasoning.lower()
+
+    async def test_generate_reasoning_needs_approval_with_warnings(self):
+        agent = OrchestratorAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+
+        metrics = {"match_score": 72.0, "salary_passed": True, "qa_passed": True, "salary_has_warnings": True, "qa_has_warnings": True}
+
+        reasoning = agent._generate_reasoning("needs_human_approval", metrics, {"reasoning": "Check visa requirements"})
+        assert reasoning == "Human review required: Match score 72.0% (moderate fit), salary has warnings, QA has warnings. AI analysis: Check visa requirements"
@@ -1,12 +1,32 @@
 """Unit tests for QAAgent."""
 
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from app.agents.base_agent import BaseAgent
-from app.agents.qa_agent import QAAgent
+from app.agents.qa_agent import QAAgent, QAIssue
+
+
+@pytest.fixture(autouse=True)
+def _clear_qa_caches():
+    """Class-level QA caches are shared across instances; isolate each test."""
+    QAAgent._qa_cache.clear()
+    QAAgent._analysis_cache.clear()
+    yield
+    QAAgent._qa_cache.clear()
+    QAAgent._analysis_cache.clear()
+
+
+def _write_docx(path: Path, *paragraphs: str) -> Path:
+    from docx import Document
+
+    doc = Document()
+    for paragraph in paragraphs:
+        doc.add_paragraph(paragraph)
+    doc.save(path)
+    return path
 
 
 class TestStructure:
@@ -28,32 +48,44 @@ class TestStructure:
 class TestDocumentLoading:
     """Test document loading from stage outputs and templates."""
 
-    @patch("app.agents.qa_agent.Document")
-    async def test_load_document_success(self, mock_doc):
-        mock_doc.return_value = MagicMock()
+    async def test_template_text_cached_until_mtime_changes(self, tmp_path):
+        import os
+
+        template = _write_docx(tmp_path / "template.docx", "Original template")
+
         agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+        assert agent._get_template(template)[0] == "Original template"
 
-        with patch.object(Path, "exists", return_value=True):
-            doc = agent._load_document(Path("test.docx"))
-            assert doc is not None
+        with patch.object(agent, "_extract_text_fast", wraps=agent._extract_text_fast) as load:
+            assert agent._get_template(template)[0] == "Original template"
+            load.assert_not_called()
 
-    @patch("app.agents.qa_agent.Document")
-    async def test_load_document_missing(self, mock_doc):
+            _write_docx(template, "Updated template")
+            os.utime(template, (template.stat().st_atime, template.stat().st_mtime + 10))
+
+            assert agent._get_template(template)[0] == "Updated template"
+            load.assert_called_once()
+
+    async def test_template_text_missing_file(self, tmp_path):
         agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
 
-        with patch.object(Path, "exists", return_value=False):
-            with pytest.raises(FileNotFoundError):
-                agent._load_document(Path("missing.docx"))
+        with pytest.raises(FileNotFoundError):
+            agent._get_template(tmp_path / "missing.docx")
 
-    async def test_extract_text_from_document(self):
+    async def test_extract_text_fast_matches_python_docx(self, tmp_path):
         agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+        path = _write_docx(tmp_path / "doc.docx", "Paragraph 1", "", "Paragraph 2")
+
+        from docx import Document
 
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = [MagicMock(text="Paragraph 1"), MagicMock(text="Paragraph 2")]
+        expected = "\n".join(paragraph.text for paragraph in Document(path).paragraphs if paragraph.text.strip())
+        assert agent._extract_text_fast(path) == expected == "Paragraph 1\nParagraph 2"
 
-        text = agent._extract_text_from_document(mock_doc)
-        assert "Paragraph 1" in text
-        assert "Paragraph 2" in text
+    async def test_extract_text_fast_missing_file(self, tmp_path):
+        agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+
+        with pytest.raises(FileNotFoundError):
+            agent._extract_text_fast(tmp_path / "missing.docx")
 
 
 @pytest.mark.asyncio
@@ -67,9 +99,9 @@ class TestAustralianEnglishChecks:
         issues = agent._check_australian_english(text)
 
         assert len(issues) > 0
-        assert any("color" in issue["description"].lower() for issue in issues)
-        assert any("specialize" in issue["description"].lower() for issue in issues)
-        assert any("recognize" in issue["description"].lower() for issue in issues)
+        assert any("color" in issue.description.lower() for issue in issues)
+        assert any("specialize" in issue.description.lower() for issue in issues)
+        assert any("recognize" in issue.description.lower() for issue in issues)
 
     async def test_australian_spelling_correct(self):
         agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
@@ -78,7 +110,7 @@ class TestAustralianEnglishChecks:
         issues = agent._check_australian_english(text)
 
         # Should have no spelling issues
-        spelling_issues = [i for i in issues if i["type"] == "spelling"]
+        spelling_issues = [i for i in issues if i.type == "spelling"]
         assert len(spelling_issues) == 0
 
     async def test_case_insensitive_spelling_check(self):
@@ -89,6 +121,21 @@ class TestAustralianEnglishChecks:
 
         assert len(issues) >= 2  # Both instances should be caught
 
+    async def test_spelling_check_with_length_changing_lowercase(self):
+        agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+
+        # "İ".lower() is two code points, so offsets into the lowered text shift
+        issues = agent._check_australian_english("İstanbul COLOR")
+
+        assert [i.description for i in issues] == ["American spelling 'COLOR' should be 'colour'"]
+
+    async def test_longer_spelling_not_shadowed_by_prefix(self):
+        agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+
+        issues = agent._check_australian_english("Specialized and specialize")
+
+        assert [i.description for i in issues] == ["American spelling 'Specialized' should be 'specialised'", "American spelling 'specialize' should be 'specialise'"]
+
 
 @pytest.mark.asyncio
 class TestFabricationDetection:
@@ -114,9 +161,24 @@ class TestFabricationDetection:
         issues = agent._check_fabrication(original_text, generated_text, "CV")
 
         # Should have no fabrication issues (generated is subset of original)
-        fabrication_issues = [i for i in issues if i["type"] == "fabrication"]
+        fabrication_issues = [i for i in issues if i.type == "fabrication"]
         assert len(fabrication_issues) == 0
 
+    async def test_precomputed_original_words(self):
+        agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+
+        generated_text = "Python, SQL, AWS, Kubernetes, Docker, Terraform, Ansible, Jenkins, GitLab, Prometheus, Grafana, ELK, Kafka, RabbitMQ"
+        original_words = frozenset(generated_text.lower().replace(",", "").split())
+
+        assert agent._check_fabrication("", generated_text, "CV", original_words=original_words) == []
+        assert len(agent._check_fabrication("", generated_text, "CV")) == 1
+
+    @pytest.mark.parametrize("text", ["Led data_pipelines (2019-2023), e.g. ETL/ELT in Azure & AWS; 10x faster!", "Café résumé with naïve coöperation and Zürich offices"])
+    def test_content_words_matches_word_regex(self, text):
+        from app.agents.qa_agent import _WORD_RE, COMMON_WORDS, _content_words
+
+        assert _content_words(text) == frozenset(_WORD_RE.findall(text.lower())) - COMMON_WORDS
+
 
 @pytest.mark.asyncio
 class TestContactInfoValidation:
@@ -142,7 +204,28 @@ class TestContactInfoValidation:
         issues = agent._check_contact_info(original, generated)
 
         assert len(issues) > 0
-        assert any("email" in issue["description"].lower() for issue in issues)
+        assert any("email" in issue.description.lower() for issue in issues)
+
+    async def test_extract_contacts_single_pass(self):
+        agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+
+        emails, phones = agent._extract_contacts("linus@example.com | 0499 338 884 | (03) 6212 3456 | not|an@email.c|om")
+
+        assert emails == {"linus@example.com"}
+        assert phones == {"0499 338 884", "(03) 6212 3456"}
+
+    @pytest.mark.parametrize("text, expected", [("No contact details here", (set(), set())), ("Email linus@example.com only", ({"linus@example.com"}, set())), ("Call 0499 338 884", (set(), {"0499 338 884"}))])
+    async def test_extract_contacts_prefilter(self, text, expected):
+        agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+
+        assert agent._extract_contacts(text) == expected
+
+    async def test_detect_phone_mismatch(self):
+        agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+
+        issues = agent._check_contact_info("linus@example.com\n0499 338 884", "linus@example.com\n0400 000 000")
+
+        assert [i.description for i in issues] == ["Phone number mismatch"]
 
 
 @pytest.mark.asyncio
@@ -168,6 +251,43 @@ class TestClaudeQAAnalysis:
         assert len(result["issues"]) > 0
         assert result["issues"][0]["type"] == "spelling"
 
+    async def test_analysis_reused_when_excerpts_unchanged(self):
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"issues": [], "recommendations": ["Good structure"]}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        agent = QAAgent({"model": "claude-sonnet-4"}, mock_claude, Mock())
+        generated_cv = "Generated CV content " * 100
+
+        first = await agent._analyze_with_claude("Original CV", generated_cv, "Original CL", "Generated CL")
+        second = await agent._analyze_with_claude("Original CV", generated_cv + "beyond the excerpt", "Original CL", "Generated CL")
+        await agent._analyze_with_claude("Original CV", generated_cv, "Original CL", "Changed CL")
+
+        assert first == second == {"issues": [], "recommendations": ["Good structure"]}
+        assert mock_claude.messages.create.call_count == 2
+
+    async def test_identical_excerpt_sent_once(self):
+        agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
+        agent._call_claude = AsyncMock(return_value='{"issues": [], "recommendations": []}')
+
+        await agent._analyze_with_claude("Unchanged CV text", "Unchanged CV text", "Original CL", "Rewritten CL")
+
+        prompt = agent._call_claude.call_args.args[0]
+        assert prompt.count("Unchanged CV text") == 1
+        assert "GENERATED CV CONTENT: identical to the ORIGINAL CV CONTENT above" in prompt
+        assert "Rewritten CL" in prompt
+
+    async def test_analysis_failure_not_cached(self):
+        mock_claude = AsyncMock()
+        mock_claude.messages.create = AsyncMock(side_effect=Exception("API down"))
+
+        agent = QAAgent({"model": "claude-sonnet-4"}, mock_claude, Mock())
+        await agent._analyze_with_claude("Original CV", "Generated CV", "Original CL", "Generated CL")
+        await agent._analyze_with_claude("Original CV", "Generated CV", "Original CL", "Generated CL")
+
+        assert mock_claude.messages.create.call_count == 2
+
 
 @pytest.mark.asyncio
 class TestPassFailDecision:
@@ -176,7 +296,7 @@ class TestPassFailDecision:
     async def test_passes_with_no_critical_issues(self):
         agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
 
-        issues = [{"type": "formatting", "description": "Minor spacing issue", "severity": "warning", "location": "CV"}]
+        issues = [QAIssue("formatting", "Minor spacing issue", "warning", "CV")]
 
         passed = agent._should_pass(issues)
         assert passed is True
@@ -184,7 +304,7 @@ class TestPassFailDecision:
     async def test_fails_with_critical_issues(self):
         agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
 
-        issues = [{"type": "spelling", "description": "American spelling", "severity": "critical", "location": "CV"}]
+        issues = [QAIssue("spelling", "American spelling", "critical", "CV")]
 
         passed = agent._should_pass(issues)
         assert passed is False
@@ -192,7 +312,7 @@ class TestPassFailDecision:
     async def test_passes_with_info_issues(self):
         agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
 
-        issues = [{"type": "formatting", "description": "Could bold key achievements", "severity": "info", "location": "CV"}]
+        issues = [QAIssue("formatting", "Could bold key achievements", "info", "CV")]
 
         passed = agent._should_pass(issues)
         assert passed is True
@@ -202,12 +322,9 @@ class TestPassFailDecision:
 class TestProcessMethod:
     """Test main process method."""
 
-    @patch("app.agents.qa_agent.Document")
-    @patch("pathlib.Path.exists")
-    async def test_process_success(self, mock_exists, mock_doc):
-        mock_doc.return_value = MagicMock()
-        mock_doc.return_value.paragraphs = [MagicMock(text="Test content with colour and centre")]
-        mock_exists.return_value = True
+    @patch.object(QAAgent, "_get_template", return_value=("Test content with colour and centre", frozenset()))
+    async def test_process_success(self, mock_template, tmp_path):
+        cv_path, cl_path = _write_docx(tmp_path / "cv.docx", "Test content with colour and centre"), _write_docx(tmp_path / "cl.docx", "Test content with colour and centre")
 
         mock_claude = AsyncMock()
         mock_response = Mock()
@@ -216,12 +333,7 @@ class TestProcessMethod:
 
         mock_app_repo = AsyncMock()
         mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123", "title": "Engineer"})
-        mock_app_repo.get_stage_outputs = AsyncMock(
-            return_value={
-                "cv_tailor": {"cv_file_path": "export_cv_cover_letter/2025-10-28_acme_engineer/Linus_McManamey_CV.docx"},
-                "cover_letter_writer": {"cl_file_path": "export_cv_cover_letter/2025-10-28_acme_engineer/Linus_McManamey_CL.docx"},
-            }
-        )
+        mock_app_repo.get_stage_outputs = AsyncMock(return_value={"cv_tailor": {"cv_file_path": str(cv_path)}, "cover_letter_writer": {"cl_file_path": str(cl_path)}})
 
         agent = QAAgent({"model": "claude-sonnet-4"}, mock_claude, mock_app_repo)
         result = await agent.process("job-123")
@@ -231,6 +343,65 @@ class TestProcessMethod:
         assert "pass" in result.output
         assert result.output["pass"] is True
 
+    @patch.object(QAAgent, "_get_template", return_value=("Cached content with colour", frozenset()))
+    async def test_process_reuses_results_for_identical_documents(self, mock_template, tmp_path):
+        cv_path, cl_path = _write_docx(tmp_path / "cv.docx", "Cached content with colour"), _write_docx(tmp_path / "cl.docx", "Cached content with colour")
+
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"issues": [], "recommendations": ["Looks good"]}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123", "title": "Engineer"})
+        mock_app_repo.get_stage_outputs = AsyncMock(return_value={"cv_tailor": {"cv_file_path": str(cv_path)}, "cover_letter_writer": {"cl_file_path": str(cl_path)}})
+
+        first = await QAAgent({"model": "claude-sonnet-4"}, mock_claude, mock_app_repo).process("job-123")
+        second = await QAAgent({"model": "claude-sonnet-4"}, mock_claude, mock_app_repo).process("job-123")
+
+        assert first.output == second.output
+        assert second.output["recommendations"] == ["Looks good"]
+        mock_claude.messages.create.assert_called_once()
+
+    @patch.object(QAAgent, "_extract_text_fast")
+    @patch.object(QAAgent, "_get_template", return_value=("Upstream content with colour", frozenset()))
+    async def test_process_uses_upstream_document_text(self, mock_template, mock_extract):
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"issues": [], "recommendations": []}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123", "title": "Engineer"})
+        mock_app_repo.get_stage_outputs = AsyncMock(
+            return_value={"cv_tailor": {"cv_file_path": "cv.docx", "cv_text": "Upstream content with colour"}, "cover_letter_writer": {"cl_file_path": "cl.docx", "cl_text": "Upstream content with colour"}}
+        )
+
+        result = await QAAgent({"model": "claude-sonnet-4"}, mock_claude, mock_app_repo).process("job-123")
+
+        assert result.success is True
+        mock_extract.assert_not_called()
+
+    @pytest.mark.parametrize("config, expected_calls", [({"model": "claude-sonnet-4"}, 0), ({"model": "claude-sonnet-4", "qa_skip_claude_on_critical": False}, 1)])
+    @patch.object(QAAgent, "_get_template", return_value=("Original content with colour", frozenset()))
+    async def test_process_skips_claude_on_critical_issue(self, mock_template, tmp_path, config, expected_calls):
+        cv_path, cl_path = _write_docx(tmp_path / "cv.docx", "Content with color"), _write_docx(tmp_path / "cl.docx", "Original content with colour")
+
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"issues": [], "recommendations": []}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123", "title": "Engineer"})
+        mock_app_repo.get_stage_outputs = AsyncMock(return_value={"cv_tailor": {"cv_file_path": str(cv_path)}, "cover_letter_writer": {"cl_file_path": str(cl_path)}})
+
+        result = await QAAgent(config, mock_claude, mock_app_repo).process("job-123")
+
+        assert result.success is False
+        assert any(i["type"] == "spelling" for i in result.output["issues"])
+        assert mock_claude.messages.create.call_count == expected_calls
+
 
 @pytest.mark.asyncio
 class TestErrorHandling:
@@ -250,6 +421,17 @@ class TestErrorHandling:
         assert result.success is False
         assert "not found" in result.error_message.lower()
 
+    @patch.object(QAAgent, "_get_template", return_value=("Template", frozenset()))
+    async def test_generated_document_missing(self, mock_template, tmp_path):
+        mock_repo = AsyncMock()
+        mock_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123"})
+        mock_repo.get_stage_outputs = AsyncMock(return_value={"cv_tailor": {"cv_file_path": str(tmp_path / "cv.docx")}, "cover_letter_writer": {"cl_file_path": str(_write_docx(tmp_path / "cl.docx", "Letter"))}})
+
+        agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), mock_repo)
+        result = await agent.process("job-123")
+        assert result.success is False
+        assert "document not found" in result.error_message.lower()
+
     async def test_missing_cv_file(self):
         mock_repo = AsyncMock()
         mock_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123"})
@@ -268,13 +450,20 @@ class TestIssueAggregation:
     async def test_aggregate_all_issues(self):
         agent = QAAgent({"model": "claude-sonnet-4"}, Mock(), Mock())
 
-        spelling_issues = [{"type": "spelling", "description": "color -> colour", "severity": "critical", "location": "CV"}]
-        fabrication_issues = [{"type": "fabrication", "description": "New skill added", "severity": "critical", "location": "CV"}]
-        contact_issues = [{"type": "contact_info", "description": "Email mismatch", "severity": "critical", "location": "CV"}]
+        spelling_issues = [QAIssue("spelling", "color -> colour", "critical", "CV")]
+        fabrication_issues = [QAIssue("fabrication", "New skill added", "critical", "CV")]
+        contact_issues = [QAIssue("contact_info", "Email mismatch", "critical", "CV")]
 
         all_issues = agent._aggregate_issues(spelling_issues, fabrication_issues, contact_issues)
 
         assert len(all_issues) == 3
-        assert any(i["type"] == "spelling" for i in all_issues)
-        assert any(i["type"] == "fabrication" for i in all_issues)
-        assert any(i["type"] == "contact_info" for i in all_issues)
+        assert any(i.type == "spelling" for i in all_issues)
+        assert any(i.type == "fabrication" for i in all_issues)
+        assert any(i.type == "contact_info" for i in all_issues)
+
+    async def test_issue_round_trips_through_dict(self):
+        issue = QAIssue.from_dict({"type": "grammar", "description": "Run-on sentence", "severity": "warning", "location": "CL"})
+
+        assert issue == QAIssue("grammar", "Run-on sentence", "warning", "CL")
+        assert issue.as_dict() == {"type": "grammar", "description": "Run-on sentence", "severity": "warning", "location": "CL"}
+        assert QAIssue.from_dict({"type": "formatting"}).severity == ""
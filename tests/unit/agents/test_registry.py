@@ -40,6 +40,30 @@ class TestAgentRegistry:
         # Should not raise
         assert "test_agent" in registry._agents
 
+    def test_registry_rejects_duplicate_registration(self):
+        """Test that a name cannot be re-registered to a different class"""
+        from app.agents.base_agent import AgentResult, BaseAgent
+        from app.agents.registry import AgentRegistry
+
+        class FirstAgent(BaseAgent):
+            @property
+            def agent_name(self) -> str:
+                return "duplicate_agent"
+
+            async def process(self, job_id: str) -> AgentResult:
+                return AgentResult(success=True, agent_name=self.agent_name, output={}, error_message=None, execution_time_ms=0)
+
+        class SecondAgent(FirstAgent):
+            pass
+
+        registry = AgentRegistry()
+        registry.register("duplicate_agent", FirstAgent)
+        registry.register("duplicate_agent", FirstAgent)  # Same class is a no-op
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register("duplicate_agent", SecondAgent)
+        assert registry.get_agent_class("duplicate_agent") is FirstAgent
+
     def test_registry_get_pipeline_order(self):
         """Test getting the pipeline execution order"""
         from app.agents.registry import AgentRegistry
@@ -48,7 +72,7 @@ class TestAgentRegistry:
         pipeline = registry.get_pipeline_order()
 
         # Expected 7 agents in specific order
-        assert isinstance(pipeline, list)
+        assert isinstance(pipeline, tuple)
         assert len(pipeline) == 7
         assert pipeline[0] == "job_matcher"
         assert pipeline[1] == "salary_validator"
@@ -121,7 +145,8 @@ class TestAgentRegistry:
         registry = AgentRegistry.get_instance()
 
         pipeline1 = registry.get_pipeline_order()
-        pipeline1.append("hacker_agent")  # Try to modify
+        with pytest.raises(AttributeError):
+            pipeline1.append("hacker_agent")  # Try to modify
 
         pipeline2 = registry.get_pipeline_order()
 
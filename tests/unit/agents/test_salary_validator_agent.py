@@ -4,12 +4,15 @@ Unit tests for SalaryValidatorAgent.
 Tests salary extraction, threshold validation, and non-blocking behavior.
 """
 
+import asyncio
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from app.agents.base_agent import BaseAgent
-from app.agents.salary_validator_agent import SalaryValidatorAgent
+from app.agents.salary_validator_agent import SalaryExpectations, SalaryValidatorAgent
 
 
 class TestSalaryValidatorAgentStructure:
@@ -81,6 +84,31 @@ class TestStructuredFieldExtraction:
 
         assert result == 1200.0
 
+    async def test_extract_from_structured_field_with_k_suffix(self):
+        """Test extraction with a thousands suffix in either case."""
+        config = {"model": "claude-haiku-3.5"}
+        agent = SalaryValidatorAgent(config, Mock(), Mock())
+
+        assert agent._extract_from_structured_field("$1.2k") == 1200.0
+        assert agent._extract_from_structured_field("150K") == 150000.0
+
+    async def test_extract_from_structured_field_numeric_column_value(self):
+        """Test extraction from numeric values as read from the DECIMAL column."""
+        config = {"model": "claude-haiku-3.5"}
+        agent = SalaryValidatorAgent(config, Mock(), Mock())
+
+        assert agent._extract_from_structured_field(Decimal("950.00")) == 950.0
+        assert agent._extract_from_structured_field(1100) == 1100.0
+        assert agent._extract_from_structured_field(875.5) == 875.5
+
+    async def test_extract_from_structured_field_unparseable_values(self):
+        """Test non-ASCII digits and unsupported types return None instead of raising."""
+        config = {"model": "claude-haiku-3.5"}
+        agent = SalaryValidatorAgent(config, Mock(), Mock())
+
+        assert agent._extract_from_structured_field("²") is None
+        assert agent._extract_from_structured_field(["800"]) is None
+
     async def test_extract_from_structured_field_none(self):
         """Test extraction when field is None."""
         config = {"model": "claude-haiku-3.5"}
@@ -175,6 +203,60 @@ class TestTextExtraction:
 
         assert result["salary_found"] is False
 
+    async def test_extract_from_description_reads_tool_input(self):
+        """Test that the record_salary tool input is used directly."""
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(type="tool_use", input={"salary_found": True, "amount": 120000.0, "time_period": "annual", "currency": "AUD"})]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, mock_claude, Mock())
+        result = await agent._extract_from_description("Attractive package for the right candidate")
+
+        assert result == {"salary_found": True, "amount": 120000.0, "time_period": "annual", "currency": "AUD"}
+        assert mock_claude.messages.create.call_args.kwargs["tool_choice"] == {"type": "tool", "name": "record_salary"}
+
+    async def test_extract_from_description_marks_static_prefix_cacheable(self):
+        """Test that the system prompt and instructions are cacheable and only the description varies."""
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"salary_found": false}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, mock_claude, Mock())
+        await agent._extract_from_description("Daily rate negotiable")
+
+        kwargs = mock_claude.messages.create.call_args.kwargs
+        instructions, description = kwargs["messages"][0]["content"]
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert instructions["cache_control"] == {"type": "ephemeral"}
+        assert "Daily rate negotiable" not in instructions["text"]
+        assert description == {"type": "text", "text": "JOB DESCRIPTION:\nDaily rate negotiable"}
+
+    @pytest.mark.parametrize("description, amount, time_period", [("$950 per day", 950.0, "daily"), ("Rate: $800 - $1,000/day", 900.0, "daily"), ("$120-140k p.a. + super", 130000.0, "annual"), ("$150,000 per annum", 150000.0, "annual")])
+    async def test_extract_from_description_matches_canonical_formats_locally(self, description, amount, time_period):
+        """Test that canonical salary formats are read without calling Claude."""
+        mock_claude = AsyncMock()
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, mock_claude, Mock())
+
+        result = await agent._extract_from_description(description)
+
+        assert (result["salary_found"], result["amount"], result["time_period"]) == (True, amount, time_period)
+        mock_claude.messages.create.assert_not_called()
+
+    @pytest.mark.parametrize("description", ["$95/hour", "Budget of $2 per day", "$120k base"])
+    async def test_extract_from_description_leaves_ambiguous_formats_to_claude(self, description):
+        """Test that hourly, implausible or period-less amounts still go to Claude."""
+        mock_claude = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"salary_found": false}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, mock_claude, Mock())
+
+        await agent._extract_from_description(description)
+
+        mock_claude.messages.create.assert_called_once()
+
     async def test_extract_from_description_claude_failure(self):
         """Test handling of Claude API failure."""
         mock_claude = AsyncMock()
@@ -183,20 +265,33 @@ class TestTextExtraction:
         config = {"model": "claude-haiku-3.5"}
         agent = SalaryValidatorAgent(config, mock_claude, Mock())
 
-        result = await agent._extract_from_description("$950 per day")
+        result = await agent._extract_from_description("Competitive daily rate")
 
         assert result["salary_found"] is False
 
+    @pytest.mark.parametrize("response", ['```json\n{"salary_found": true, "amount": 900.0}\n```', 'Here you go:\n```\n{"salary_found": true, "amount": 900.0}\n```', '{"salary_found": true, "amount": 900.0}'])
+    async def test_parse_response_strips_markdown_fences(self, response):
+        """Test parsing JSON with and without markdown fences."""
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, Mock(), Mock())
+
+        assert agent._parse_salary_extraction_response(response) == {"salary_found": True, "amount": 900.0}
+
+    @pytest.mark.parametrize("response", ['{"salary_found": true}', '{"salary_found": true, "amount": "lots"}', "[1, 2]", "not json"])
+    async def test_parse_response_rejects_unusable_shapes(self, response):
+        """Test that malformed or incomplete extractions are treated as not found."""
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, Mock(), Mock())
+
+        assert agent._parse_salary_extraction_response(response) == {"salary_found": False}
+
 
 @pytest.mark.asyncio
 class TestThresholdValidation:
     """Test salary threshold validation logic."""
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_salary_meets_threshold(self, mock_yaml_load, mock_open):
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_salary_meets_threshold(self, mock_get_config):
         """Test validation when salary meets threshold."""
-        mock_yaml_load.return_value = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
 
         config = {"model": "claude-haiku-3.5"}
         agent = SalaryValidatorAgent(config, Mock(), Mock())
@@ -206,11 +301,10 @@ class TestThresholdValidation:
         assert meets is True
         assert missing is False
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_salary_below_threshold(self, mock_yaml_load, mock_open):
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_salary_below_threshold(self, mock_get_config):
         """Test validation when salary below threshold."""
-        mock_yaml_load.return_value = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
 
         config = {"model": "claude-haiku-3.5"}
         agent = SalaryValidatorAgent(config, Mock(), Mock())
@@ -220,11 +314,10 @@ class TestThresholdValidation:
         assert meets is False
         assert missing is False
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_salary_exactly_at_threshold(self, mock_yaml_load, mock_open):
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_salary_exactly_at_threshold(self, mock_get_config):
         """Test validation when salary exactly at threshold."""
-        mock_yaml_load.return_value = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
 
         config = {"model": "claude-haiku-3.5"}
         agent = SalaryValidatorAgent(config, Mock(), Mock())
@@ -234,11 +327,10 @@ class TestThresholdValidation:
         assert meets is True
         assert missing is False
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_missing_salary_handling(self, mock_yaml_load, mock_open):
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_missing_salary_handling(self, mock_get_config):
         """Test validation when salary is missing."""
-        mock_yaml_load.return_value = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
 
         config = {"model": "claude-haiku-3.5"}
         agent = SalaryValidatorAgent(config, Mock(), Mock())
@@ -248,16 +340,38 @@ class TestThresholdValidation:
         assert meets is False
         assert missing is True
 
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_expectations_loaded_once_as_frozen_thresholds(self, mock_get_config):
+        """Test thresholds are parsed once, default missing keys and cannot be mutated."""
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": "900"}}
+
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, Mock(), Mock())
+        expectations = agent._load_salary_expectations()
+
+        assert expectations == SalaryExpectations(minimum=900.0, maximum=1500.0)
+        assert agent._load_salary_expectations() is expectations
+        with pytest.raises(FrozenInstanceError):
+            expectations.minimum = 0.0
+
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_inverted_expectations_rejected_at_load(self, mock_get_config):
+        """Test a minimum above the maximum is reported when config is loaded."""
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 1500.0, "maximum": 800.0}}
+
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, Mock(), Mock())
+
+        with pytest.raises(ValueError, match="exceeds maximum"):
+            agent._load_salary_expectations()
+
 
 @pytest.mark.asyncio
 class TestNonBlockingValidation:
     """Test non-blocking validation behavior."""
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_low_salary_does_not_reject(self, mock_yaml_load, mock_open):
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_low_salary_does_not_reject(self, mock_get_config):
         """Test that low salary doesn't change job status to rejected."""
-        mock_yaml_load.return_value = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
 
         mock_app_repo = AsyncMock()
         mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123", "title": "Test Job", "description": "Test description", "salary_aud_per_day": "600"})
@@ -273,11 +387,10 @@ class TestNonBlockingValidation:
         # Verify status was NOT changed to rejected
         mock_app_repo.update_application_status.assert_not_called()
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_missing_salary_does_not_reject(self, mock_yaml_load, mock_open):
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_missing_salary_does_not_reject(self, mock_get_config):
         """Test that missing salary doesn't change job status."""
-        mock_yaml_load.return_value = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
 
         mock_claude = AsyncMock()
         mock_response = Mock()
@@ -303,11 +416,10 @@ class TestNonBlockingValidation:
 class TestDatabaseUpdates:
     """Test database update operations."""
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_database_updates_stage_tracking(self, mock_yaml_load, mock_open):
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_database_updates_stage_tracking(self, mock_get_config):
         """Test that database is updated with stage information."""
-        mock_yaml_load.return_value = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
 
         mock_app_repo = AsyncMock()
         mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123", "title": "Test Job", "description": "Test", "salary_aud_per_day": "950"})
@@ -317,21 +429,20 @@ class TestDatabaseUpdates:
 
         await agent.process("job-123")
 
-        # Verify current stage was updated
-        mock_app_repo.update_current_stage.assert_called_once_with("job-123", "salary_validator")
-
-        # Verify completed stage was added
-        mock_app_repo.add_completed_stage.assert_called_once()
-        call_args = mock_app_repo.add_completed_stage.call_args
+        # Verify stage completion was written once, status untouched
+        mock_app_repo.apply_stage_result.assert_called_once()
+        call_args = mock_app_repo.apply_stage_result.call_args
         assert call_args[0][0] == "job-123"
         assert call_args[0][1] == "salary_validator"
         assert "salary_aud_per_day" in call_args[0][2]
+        assert call_args[0][3] is None
+        mock_app_repo.update_current_stage.assert_not_called()
+        mock_app_repo.add_completed_stage.assert_not_called()
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_update_jobs_table_with_extracted_salary(self, mock_yaml_load, mock_open):
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_update_jobs_table_with_extracted_salary(self, mock_get_config):
         """Test updating jobs table when salary extracted from description."""
-        mock_yaml_load.return_value = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
 
         mock_claude = AsyncMock()
         mock_response = Mock()
@@ -349,16 +460,32 @@ class TestDatabaseUpdates:
         # Verify jobs table was updated with extracted salary
         mock_app_repo.update_job_salary.assert_called_once_with("job-123", 950.0)
 
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_structured_salary_skips_description_and_jobs_table(self, mock_get_config):
+        """Test a structured salary never reaches Claude or rewrites the jobs table."""
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+
+        mock_claude = AsyncMock()
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123", "title": "Test Job", "description": "Rate negotiable, circa 1100 a day", "salary_aud_per_day": "950"})
+
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, mock_claude, mock_app_repo)
+        result = await agent.process("job-123")
+
+        assert result.output["salary_aud_per_day"] == 950.0
+        assert result.output["extracted_from"] == "structured_field"
+        mock_claude.messages.create.assert_not_called()
+        mock_app_repo.update_job_salary.assert_not_called()
+
 
 @pytest.mark.asyncio
 class TestAgentResultConstruction:
     """Test AgentResult object construction."""
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_agent_result_success_structure(self, mock_yaml_load, mock_open):
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_agent_result_success_structure(self, mock_get_config):
         """Test AgentResult structure for successful validation."""
-        mock_yaml_load.return_value = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
 
         mock_app_repo = AsyncMock()
         mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123", "title": "Test Job", "description": "Test", "salary_aud_per_day": "950"})
@@ -378,11 +505,10 @@ class TestAgentResultConstruction:
         assert "missing_salary" in result.output
         assert "extracted_from" in result.output
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_agent_result_output_values(self, mock_yaml_load, mock_open):
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_agent_result_output_values(self, mock_get_config):
         """Test AgentResult output values are correct."""
-        mock_yaml_load.return_value = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
 
         mock_app_repo = AsyncMock()
         mock_app_repo.get_job_by_id = AsyncMock(return_value={"id": "job-123", "title": "Test Job", "description": "Test", "salary_aud_per_day": "950.50"})
@@ -399,6 +525,96 @@ class TestAgentResultConstruction:
         assert result.output["extracted_from"] == "structured_field"
 
 
+class _AsyncResults:
+    """Async iterator standing in for the Message Batches results stream."""
+
+    def __init__(self, entries):
+        self._entries = iter(entries)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._entries)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+def _batch_entry(custom_id, text):
+    return Mock(custom_id=custom_id, result=Mock(type="succeeded", message=Mock(content=[Mock(text=text)])))
+
+
+@pytest.mark.asyncio
+class TestBatchProcessing:
+    """Test batched salary extraction through the Message Batches API."""
+
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_process_batch_uses_one_message_batch(self, mock_get_config):
+        """Test that description extractions share one batch and structured or canonical salaries skip Claude."""
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        jobs = {
+            "job-1": {"id": "job-1", "description": "Rate of nine hundred and fifty a day"},
+            "job-2": {"id": "job-2", "description": "Competitive package"},
+            "job-3": {"id": "job-3", "description": "Rate", "salary_aud_per_day": "1000"},
+            "job-4": {"id": "job-4", "description": "$1,100 per day"},
+        }
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(side_effect=jobs.get)
+
+        mock_claude = AsyncMock()
+        mock_claude.messages.batches.create = AsyncMock(return_value=Mock(id="batch-1", processing_status="ended"))
+        mock_claude.messages.batches.results = AsyncMock(return_value=_AsyncResults([_batch_entry("job-1", '{"salary_found": false}'), _batch_entry("job-0", '{"salary_found": true, "amount": 950.0, "time_period": "daily"}')]))
+
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, mock_claude, mock_app_repo)
+        results = await agent.process_batch(["job-1", "job-2", "job-3", "job-4"])
+
+        assert [r.output["salary_aud_per_day"] for r in results] == [950.0, None, 1000.0, 1100.0]
+        assert len(mock_claude.messages.batches.create.call_args.kwargs["requests"]) == 2
+        mock_claude.messages.create.assert_not_called()
+
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_process_batch_falls_back_to_individual_calls(self, mock_get_config):
+        """Test that a failed batch submission falls back to one call per description."""
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(side_effect=lambda job_id: {"id": job_id, "description": "Daily rate negotiable"})
+
+        mock_claude = AsyncMock()
+        mock_claude.messages.batches.create = AsyncMock(side_effect=Exception("batches unavailable"))
+        mock_response = Mock()
+        mock_response.content = [Mock(text='{"salary_found": true, "amount": 900.0, "time_period": "daily"}')]
+        mock_claude.messages.create = AsyncMock(return_value=mock_response)
+
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, mock_claude, mock_app_repo)
+        results = await agent.process_batch(["job-1", "job-2", None])
+
+        assert [r.success for r in results] == [True, True, False]
+        assert [r.output.get("salary_aud_per_day") for r in results[:2]] == [900.0, 900.0]
+        assert mock_claude.messages.create.call_count == 2
+
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_process_batch_times_each_job_separately(self, mock_get_config, monkeypatch):
+        """Test that a job's execution time does not include earlier jobs in the batch."""
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_app_repo = AsyncMock()
+        mock_app_repo.get_job_by_id = AsyncMock(side_effect=lambda job_id: {"id": job_id, "description": "Rate", "salary_aud_per_day": "1000"})
+
+        agent = SalaryValidatorAgent({"model": "claude-haiku-3.5"}, Mock(), mock_app_repo)
+        validate_job = agent._validate_job
+
+        async def slow_first_validate(job_id, *args):
+            if job_id == "job-1":
+                await asyncio.sleep(0.05)
+            return await validate_job(job_id, *args)
+
+        monkeypatch.setattr(agent, "_validate_job", slow_first_validate)
+        results = await agent.process_batch(["job-1", "job-2"])
+
+        assert results[0].execution_time_ms >= 50
+        assert results[1].execution_time_ms < 50
+
+
 @pytest.mark.asyncio
 class TestErrorHandling:
     """Test error handling scenarios."""
@@ -427,11 +643,10 @@ class TestErrorHandling:
         assert result.success is False
         assert "not found" in result.error_message.lower()
 
-    @patch("builtins.open")
-    @patch("yaml.safe_load")
-    async def test_error_handling_unparseable_format(self, mock_yaml_load, mock_open):
+    @patch("app.agents.salary_validator_agent.get_config")
+    async def test_error_handling_unparseable_format(self, mock_get_config):
         """Test handling of unparseable salary format."""
-        mock_yaml_load.return_value = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
+        mock_get_config.return_value.search = {"salary_expectations": {"minimum": 800.0, "maximum": 1500.0}}
 
         mock_claude = AsyncMock()
         mock_response = Mock()
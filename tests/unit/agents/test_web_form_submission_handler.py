@@ -4,6 +4,9 @@ Unit tests for WebFormSubmissionHandler agent.
 Tests web form submission automation with Playwright.
 """
 
+import asyncio
+from pathlib import Path
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -78,7 +81,7 @@ class TestWebFormSubmissionProcess:
         assert "Job not found" in result.error_message
 
     @pytest.mark.asyncio
-    async def test_process_successful_submission(self, handler, mock_app_repository, tmp_path):
+    async def test_process_successful_submission(self, handler, mock_app_repository, tmp_path, monkeypatch):
         """Test successful form submission."""
         # Setup mock data
         job_data = {"job_id": "test-123", "application_url": "https://example.com/apply", "job_title": "Test Job", "company_name": "Test Company"}
@@ -89,6 +92,7 @@ class TestWebFormSubmissionProcess:
         job_dir.mkdir(parents=True)
         (job_dir / "CV_test.docx").write_text("CV")
         (job_dir / "CL_test.docx").write_text("CL")
+        monkeypatch.chdir(tmp_path)
 
         # Mock Playwright service
         with patch.object(handler._playwright_service, "initialize_browser") as mock_init:
@@ -113,18 +117,17 @@ class TestWebFormSubmissionProcess:
                                 mock_screenshot.return_value = str(job_dir / "confirmation.png")
 
                                 with patch.object(handler._playwright_service, "close_browser"):
-                                    with patch("pathlib.Path.exists", return_value=True):
-                                        with patch("pathlib.Path.glob") as mock_glob:
-                                            mock_glob.side_effect = lambda pattern: [job_dir / "CV_test.docx"] if "CV" in pattern else [job_dir / "CL_test.docx"]
-
-                                            result = await handler.process("test-123")
+                                    result = await handler.process("test-123")
+                                    await handler.flush()
 
         assert result.success is True
         assert result.agent_name == "web_form_submission_handler"
+        assert result.output["screenshot_path"] == str(Path("export_cv_cover_letter") / "test-123" / "confirmation.png")
+        mock_screenshot.assert_awaited_once_with(mock_page, result.output["screenshot_path"])
         mock_app_repository.update_status.assert_any_call("test-123", "completed")
 
     @pytest.mark.asyncio
-    async def test_process_navigation_failure(self, handler, mock_app_repository, tmp_path):
+    async def test_process_navigation_failure(self, handler, mock_app_repository, tmp_path, monkeypatch):
         """Test process handles navigation failure."""
         job_data = {"job_id": "test-123", "application_url": "https://example.com/apply"}
         mock_app_repository.get_job_by_id.return_value = job_data
@@ -134,6 +137,7 @@ class TestWebFormSubmissionProcess:
         job_dir.mkdir(parents=True)
         (job_dir / "CV_test.docx").write_text("CV")
         (job_dir / "CL_test.docx").write_text("CL")
+        monkeypatch.chdir(tmp_path)
 
         with patch.object(handler._playwright_service, "initialize_browser") as mock_init:
             mock_browser = AsyncMock()
@@ -143,36 +147,32 @@ class TestWebFormSubmissionProcess:
                 mock_nav.side_effect = TimeoutError("Navigation timeout")
 
                 with patch.object(handler._playwright_service, "close_browser"):
-                    with patch("pathlib.Path.exists", return_value=True):
-                        with patch("pathlib.Path.glob") as mock_glob:
-                            mock_glob.side_effect = lambda pattern: [job_dir / "CV_test.docx"] if "CV" in pattern else [job_dir / "CL_test.docx"]
-
-                            result = await handler.process("test-123")
+                    result = await handler.process("test-123")
 
         assert result.success is False
         assert "Navigation timeout" in result.error_message
         mock_app_repository.update_status.assert_called_with("test-123", "failed")
 
     @pytest.mark.asyncio
-    async def test_process_missing_cv_cl_files(self, handler, mock_app_repository):
+    async def test_process_missing_cv_cl_files(self, handler, mock_app_repository, tmp_path, monkeypatch):
         """Test process handles missing CV/CL files."""
         job_data = {"job_id": "test-123", "application_url": "https://example.com/apply"}
         mock_app_repository.get_job_by_id.return_value = job_data
+        monkeypatch.chdir(tmp_path)
 
         with patch.object(handler._playwright_service, "initialize_browser") as mock_init:
             mock_browser = AsyncMock()
             mock_init.return_value = mock_browser
 
             with patch.object(handler._playwright_service, "close_browser"):
-                with patch("pathlib.Path.exists", return_value=False):
-                    result = await handler.process("test-123")
+                result = await handler.process("test-123")
 
         assert result.success is False
         assert "CV/CL" in result.error_message
         mock_app_repository.update_status.assert_called_with("test-123", "failed")
 
     @pytest.mark.asyncio
-    async def test_process_form_fields_not_detected(self, handler, mock_app_repository, tmp_path):
+    async def test_process_form_fields_not_detected(self, handler, mock_app_repository, tmp_path, monkeypatch):
         """Test process handles form field detection failure."""
         job_data = {"job_id": "test-123", "application_url": "https://example.com/apply"}
         mock_app_repository.get_job_by_id.return_value = job_data
@@ -182,6 +182,7 @@ class TestWebFormSubmissionProcess:
         job_dir.mkdir(parents=True)
         (job_dir / "CV_test.docx").write_text("CV")
         (job_dir / "CL_test.docx").write_text("CL")
+        monkeypatch.chdir(tmp_path)
 
         with patch.object(handler._playwright_service, "initialize_browser") as mock_init:
             mock_browser = AsyncMock()
@@ -197,18 +198,14 @@ class TestWebFormSubmissionProcess:
                     mock_detect.return_value = mappings
 
                     with patch.object(handler._playwright_service, "close_browser"):
-                        with patch("pathlib.Path.exists", return_value=True):
-                            with patch("pathlib.Path.glob") as mock_glob:
-                                mock_glob.side_effect = lambda pattern: [job_dir / "CV_test.docx"] if "CV" in pattern else [job_dir / "CL_test.docx"]
-
-                                result = await handler.process("test-123")
+                        result = await handler.process("test-123")
 
         assert result.success is False
         assert "form fields" in result.error_message.lower()
         mock_app_repository.update_status.assert_called_with("test-123", "pending")
 
     @pytest.mark.asyncio
-    async def test_process_form_submission_failure(self, handler, mock_app_repository, tmp_path):
+    async def test_process_form_submission_failure(self, handler, mock_app_repository, tmp_path, monkeypatch):
         """Test process handles form submission failure."""
         job_data = {"job_id": "test-123", "application_url": "https://example.com/apply"}
         mock_app_repository.get_job_by_id.return_value = job_data
@@ -218,6 +215,7 @@ class TestWebFormSubmissionProcess:
         job_dir.mkdir(parents=True)
         (job_dir / "CV_test.docx").write_text("CV")
         (job_dir / "CL_test.docx").write_text("CL")
+        monkeypatch.chdir(tmp_path)
 
         with patch.object(handler._playwright_service, "initialize_browser") as mock_init:
             mock_browser = AsyncMock()
@@ -241,58 +239,237 @@ class TestWebFormSubmissionProcess:
                                 mock_screenshot.return_value = str(job_dir / "error.png")
 
                                 with patch.object(handler._playwright_service, "close_browser"):
-                                    with patch("pathlib.Path.exists", return_value=True):
-                                        with patch("pathlib.Path.glob") as mock_glob:
-                                            mock_glob.side_effect = lambda pattern: [job_dir / "CV_test.docx"] if "CV" in pattern else [job_dir / "CL_test.docx"]
-
-                                            result = await handler.process("test-123")
+                                    result = await handler.process("test-123")
 
         assert result.success is False
         mock_app_repository.update_status.assert_called_with("test-123", "failed")
 
 
+class TestBrowserReuse:
+    """Test the shared browser lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_browser_launched_once_across_jobs(self, handler, mock_app_repository, tmp_path, monkeypatch):
+        """Test consecutive jobs reuse one browser and close only their own context."""
+        for job_id in ("job-1", "job-2"):
+            job_dir = tmp_path / "export_cv_cover_letter" / job_id
+            job_dir.mkdir(parents=True)
+            (job_dir / "CV_test.docx").write_text("CV")
+            (job_dir / "CL_test.docx").write_text("CL")
+        monkeypatch.chdir(tmp_path)
+
+        mock_browser = MagicMock()
+        mock_browser.is_connected.return_value = True
+        mappings = FormFieldMappings(name_field=AsyncMock(), email_field=AsyncMock(), phone_field=AsyncMock(), cv_upload_field=AsyncMock(), cl_upload_field=AsyncMock(), submit_button=AsyncMock())
+        service = handler._playwright_service
+
+        with (
+            patch.object(service, "initialize_browser", AsyncMock(return_value=mock_browser)) as mock_init,
+            patch.object(service, "navigate_to_form", AsyncMock(return_value=AsyncMock())),
+            patch.object(service, "detect_form_fields", AsyncMock(return_value=mappings)),
+            patch.object(service, "fill_form", AsyncMock(return_value=True)),
+            patch.object(service, "submit_form", AsyncMock(return_value=True)),
+            patch.object(service, "take_screenshot", AsyncMock(return_value="confirmation.png")),
+            patch.object(service, "close_page", AsyncMock()) as mock_close_page,
+            patch.object(service, "close_browser", AsyncMock()) as mock_close_browser,
+        ):
+            first = await handler.process("job-1")
+            second = await handler.process("job-2")
+            await handler.flush()
+
+            assert first.success is True
+            assert second.success is True
+            mock_init.assert_called_once()
+            assert mock_close_page.call_count == 2
+            mock_close_browser.assert_not_called()
+
+            await handler.close()
+
+            mock_close_browser.assert_called_once_with(mock_browser)
+            assert handler._browser is None
+
+    @pytest.mark.asyncio
+    async def test_success_screenshot_does_not_block_result(self, handler, mock_app_repository, tmp_path, monkeypatch):
+        """Test a successful submission returns before its audit screenshot finishes."""
+        job_dir = tmp_path / "export_cv_cover_letter" / "test-123"
+        job_dir.mkdir(parents=True)
+        (job_dir / "CV_test.docx").write_text("CV")
+        (job_dir / "CL_test.docx").write_text("CL")
+        monkeypatch.chdir(tmp_path)
+
+        release = asyncio.Event()
+
+        async def slow_screenshot(page, path):
+            await release.wait()
+            return path
+
+        mappings = FormFieldMappings(name_field=AsyncMock(), email_field=AsyncMock(), phone_field=AsyncMock(), cv_upload_field=AsyncMock(), cl_upload_field=AsyncMock(), submit_button=AsyncMock())
+        service = handler._playwright_service
+
+        with (
+            patch.object(service, "initialize_browser", AsyncMock(return_value=MagicMock())),
+            patch.object(service, "navigate_to_form", AsyncMock(return_value=AsyncMock())),
+            patch.object(service, "detect_form_fields", AsyncMock(return_value=mappings)),
+            patch.object(service, "fill_form", AsyncMock(return_value=True)),
+            patch.object(service, "submit_form", AsyncMock(return_value=True)),
+            patch.object(service, "take_screenshot", side_effect=slow_screenshot),
+            patch.object(service, "close_page", AsyncMock()) as mock_close_page,
+        ):
+            result = await handler.process("test-123")
+
+            assert result.success is True
+            assert len(handler._pending_screenshots) == 1
+            mock_close_page.assert_not_called()
+
+            release.set()
+            await handler.flush()
+
+            assert not handler._pending_screenshots
+            mock_close_page.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_screenshot_clears_stored_path(self, handler, mock_app_repository, tmp_path, monkeypatch):
+        """Test a failed audit screenshot is flagged instead of recording a missing file."""
+        job_dir = tmp_path / "export_cv_cover_letter" / "test-123"
+        job_dir.mkdir(parents=True)
+        (job_dir / "CV_test.docx").write_text("CV")
+        (job_dir / "CL_test.docx").write_text("CL")
+        monkeypatch.chdir(tmp_path)
+
+        mappings = FormFieldMappings(name_field=AsyncMock(), email_field=AsyncMock(), phone_field=AsyncMock(), cv_upload_field=AsyncMock(), cl_upload_field=AsyncMock(), submit_button=AsyncMock())
+        service = handler._playwright_service
+
+        with (
+            patch.object(service, "initialize_browser", AsyncMock(return_value=MagicMock())),
+            patch.object(service, "navigate_to_form", AsyncMock(return_value=AsyncMock())),
+            patch.object(service, "detect_form_fields", AsyncMock(return_value=mappings)),
+            patch.object(service, "fill_form", AsyncMock(return_value=True)),
+            patch.object(service, "submit_form", AsyncMock(return_value=True)),
+            patch.object(service, "take_screenshot", AsyncMock(return_value=None)),
+            patch.object(service, "close_page", AsyncMock()) as mock_close_page,
+        ):
+            result = await handler.process("test-123")
+            await handler.flush()
+
+        assert result.success is True
+        assert result.output["screenshot_path"] is None
+        assert result.output["screenshot_failed"] is True
+        mock_app_repository.store_stage_output.assert_awaited_with("test-123", "web_form_submission_handler", result.output)
+        mock_close_page.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_browser(self, handler):
+        """Test leaving the async with block closes the shared browser."""
+        mock_browser = MagicMock()
+        service = handler._playwright_service
+
+        with patch.object(service, "initialize_browser", AsyncMock(return_value=mock_browser)), patch.object(service, "close_browser", AsyncMock()) as mock_close_browser:
+            async with handler as entered:
+                assert entered is handler
+                await handler._get_browser()
+
+        mock_close_browser.assert_awaited_once_with(mock_browser)
+        assert handler._browser is None
+
+    @pytest.mark.asyncio
+    async def test_disconnected_browser_is_relaunched(self, handler):
+        """Test a crashed browser is replaced on next use."""
+        dead_browser = MagicMock()
+        dead_browser.is_connected.return_value = False
+        fresh_browser = MagicMock()
+        handler._browser = dead_browser
+
+        with patch.object(handler._playwright_service, "initialize_browser", AsyncMock(return_value=fresh_browser)):
+            assert await handler._get_browser() is fresh_browser
+
+    @pytest.mark.asyncio
+    async def test_concurrent_jobs_launch_one_browser(self, handler):
+        """Test concurrent first use launches the browser only once."""
+        mock_browser = MagicMock()
+        mock_browser.is_connected.return_value = True
+
+        async def slow_launch():
+            await asyncio.sleep(0)
+            return mock_browser
+
+        with patch.object(handler._playwright_service, "initialize_browser", side_effect=slow_launch) as mock_init:
+            browsers = await asyncio.gather(*(handler._get_browser() for _ in range(4)))
+
+        assert all(browser is mock_browser for browser in browsers)
+        mock_init.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_process_many_caps_concurrency_at_max_contexts(self, config, mock_claude_client, mock_app_repository):
+        """Test process_many never opens more contexts than configured."""
+        config["web_form"]["browser"]["max_contexts"] = 2
+        handler = WebFormSubmissionHandler(config, mock_claude_client, mock_app_repository)
+        in_flight = 0
+        peak = 0
+
+        async def fake_process(job_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return job_id
+
+        with patch.object(handler, "process", side_effect=fake_process):
+            results = await handler.process_many([f"job-{i}" for i in range(6)], concurrency=8)
+
+        assert results == [f"job-{i}" for i in range(6)]
+        assert peak == 2
+
+
 class TestFileFinding:
     """Test CV/CL file finding logic."""
 
-    def test_find_cv_cl_files_success(self, handler, tmp_path):
+    def test_find_cv_cl_files_success(self, handler, tmp_path, monkeypatch):
         """Test finding CV and CL files."""
         job_dir = tmp_path / "export_cv_cover_letter" / "test-123"
         job_dir.mkdir(parents=True)
 
-        cv_file = job_dir / "CV_test.docx"
-        cl_file = job_dir / "CL_test.docx"
-        cv_file.write_text("CV content")
-        cl_file.write_text("CL content")
+        (job_dir / "CV_test.docx").write_text("CV content")
+        (job_dir / "CL_test.docx").write_text("CL content")
+        (job_dir / "CV_notes.txt").write_text("not a docx")
+        monkeypatch.chdir(tmp_path)
 
-        with patch("pathlib.Path.exists", return_value=True):
-            with patch("pathlib.Path.glob") as mock_glob:
-                mock_glob.side_effect = lambda pattern: [cv_file] if "CV" in pattern else [cl_file]
+        cv_path, cl_path = handler._find_cv_cl_files("test-123")
 
-                cv_path, cl_path = handler._find_cv_cl_files("test-123")
+        assert cv_path == str(Path("export_cv_cover_letter") / "test-123" / "CV_test.docx")
+        assert cl_path == str(Path("export_cv_cover_letter") / "test-123" / "CL_test.docx")
 
-                assert str(cv_path) == str(cv_file)
-                assert str(cl_path) == str(cl_file)
-
-    def test_find_cv_cl_files_directory_not_found(self, handler):
+    def test_find_cv_cl_files_directory_not_found(self, handler, tmp_path, monkeypatch):
         """Test finding files when directory doesn't exist."""
-        with patch("pathlib.Path.exists", return_value=False):
-            with pytest.raises(FileNotFoundError, match="CV/CL directory not found"):
-                handler._find_cv_cl_files("test-123")
+        monkeypatch.chdir(tmp_path)
+
+        with pytest.raises(FileNotFoundError, match="CV/CL directory not found"):
+            handler._find_cv_cl_files("test-123")
+
+    def test_find_cv_cl_files_missing_cover_letter(self, handler, tmp_path, monkeypatch):
+        """Test finding files when only the CV exists."""
+        job_dir = tmp_path / "export_cv_cover_letter" / "test-123"
+        job_dir.mkdir(parents=True)
+        (job_dir / "CV_test.docx").write_text("CV content")
+        monkeypatch.chdir(tmp_path)
+
+        with pytest.raises(FileNotFoundError, match="Cover letter file not found"):
+            handler._find_cv_cl_files("test-123")
 
 
 class TestLogging:
     """Test logging during submission."""
 
     @pytest.mark.asyncio
-    async def test_logging_during_submission(self, handler, mock_app_repository, tmp_path, caplog):
+    async def test_logging_during_submission(self, handler, mock_app_repository, tmp_path, monkeypatch, caplog):
         """Test logging messages are generated."""
         job_data = {"job_id": "test-123", "application_url": "https://example.com/apply"}
         mock_app_repository.get_job_by_id.return_value = job_data
+        monkeypatch.chdir(tmp_path)
 
         with patch.object(handler._playwright_service, "initialize_browser"):
             with patch.object(handler._playwright_service, "close_browser"):
-                with patch("pathlib.Path.exists", return_value=False):
-                    result = await handler.process("test-123")
+                result = await handler.process("test-123")
 
         # Should have logged errors
         assert result.success is False
@@ -1,27 +1,40 @@
 """
 Unit tests for configuration loader module.
 
-Tests YAML loading, singleton pattern, error handling, and environment
+Tests YAML loading, the shared instance, error handling, and environment
 variable overrides.
 """
 
+import shutil
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 import yaml
 
-from app.config.loader import Config, get_config
+from app.config import loader
+from app.config.loader import Config, get_config, reload_config
 
 
 class TestConfigLoader:
     """Test configuration loading functionality."""
 
-    def test_config_singleton_pattern(self) -> None:
-        """Test that Config uses singleton pattern."""
-        config1 = Config()
-        config2 = Config()
-        assert config1 is config2, "Config should return same instance"
+    def test_get_config_returns_shared_instance(self) -> None:
+        """Test that get_config() loads once and returns the same instance."""
+        config1 = get_config()
+        config2 = get_config()
+        assert config1 is config2, "get_config() should return same instance"
+
+    def test_get_config_loads_once_under_concurrency(self) -> None:
+        """Test that concurrent first calls to get_config() create one Config."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with patch.object(loader, "_CONFIG", None), patch("app.config.loader.Config", wraps=Config) as mock_config:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                configs = list(pool.map(lambda _: get_config(), range(8)))
+
+        assert mock_config.call_count == 1
+        assert all(config is configs[0] for config in configs)
 
     def test_load_search_yaml(self) -> None:
         """Test loading search.yaml configuration."""
@@ -112,22 +125,13 @@ class TestConfigLoader:
 
     def test_missing_yaml_file_error(self, tmp_path: Path) -> None:
         """Test error handling for missing YAML files."""
-        # Reset singleton for this test
-        Config._instance = None
-
         with patch("app.config.loader.Config._get_config_path") as mock_path:
             mock_path.return_value = tmp_path / "nonexistent"
             with pytest.raises((FileNotFoundError, Exception)):
-                Config()
-
-        # Reset singleton after test
-        Config._instance = None
+                Config().search
 
     def test_invalid_yaml_syntax_error(self, tmp_path: Path) -> None:
         """Test error handling for invalid YAML syntax."""
-        # Reset singleton for this test
-        Config._instance = None
-
         # Create a file with invalid YAML
         invalid_yaml = tmp_path / "search.yaml"
         invalid_yaml.write_text("invalid: yaml: content: [unclosed")
@@ -135,10 +139,81 @@ class TestConfigLoader:
         with patch("app.config.loader.Config._get_config_path") as mock_path:
             mock_path.return_value = tmp_path
             with pytest.raises(yaml.YAMLError):
-                Config()
+                Config().search
+
+    def test_sections_load_on_first_access(self) -> None:
+        """Test that each YAML file is parsed only when its section is first used."""
+        with patch.object(Config, "load_yaml", return_value={"job_type": "contract"}) as mock_load:
+            config = Config()
+            mock_load.assert_not_called()
+
+            assert config.search == {"job_type": "contract"}
+            assert config.search is config.search
+            mock_load.assert_called_once_with("search.yaml")
+
+    def test_save_yaml_round_trips_and_updates_config(self, tmp_path: Path) -> None:
+        """Test that save_yaml writes YAML that loads back identically."""
+        config = get_config()
+        data = {"name": "Café Data Engineer", "weights": {"python": 0.5, "sql": 0.3}, "keywords": ["azure", "spark"]}
+
+        with patch.object(config, "_config_path", tmp_path), patch.object(config, "similarity", None):
+            config.save_yaml("similarity.yaml", data)
+
+            assert config.similarity == data
+            assert config.load_yaml("similarity.yaml") == data
+            assert "Café" in (tmp_path / "similarity.yaml").read_text()
+
+    def test_search_model_tracks_saved_search_config(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test search_model gives attribute access and is rebuilt after save_yaml."""
+        shutil.copy("config/search.yaml", tmp_path / "search.yaml")
+        monkeypatch.setenv("CONFIG_PATH", str(tmp_path))
+        config = Config()
+
+        assert config.search_model.job_type == config.search["job_type"]
+        assert config.search_model is config.search_model
+
+        config.save_yaml("search.yaml", {**config.search, "job_type": "permanent"})
+
+        assert config.search_model.job_type == "permanent"
+
+    def test_yaml_parse_cached_until_file_changes(self, tmp_path: Path) -> None:
+        """Test that YAML is re-parsed only when the file signature changes."""
+        from app.config.loader import _read_yaml_cached
+
+        config_file = tmp_path / "cached.yaml"
+        config_file.write_text("value: 1\n")
+
+        with patch("app.config.loader.yaml.load", wraps=yaml.load) as mock_load:
+            first = _read_yaml_cached(config_file)
+            first["value"] = 99  # Mutating a result must not leak into the cache
+            assert _read_yaml_cached(config_file) == {"value": 1}
+            assert mock_load.call_count == 1
 
-        # Reset singleton after test
-        Config._instance = None
+            config_file.write_text("value: 22\n")
+            assert _read_yaml_cached(config_file) == {"value": 22}
+            assert mock_load.call_count == 2
+
+    def test_yaml_parse_reused_from_disk_cache_in_new_process(self, tmp_path: Path) -> None:
+        """Test that a cold in-memory cache reads the sidecar instead of re-parsing."""
+        from app.config import loader
+
+        config_file = tmp_path / "cached.yaml"
+        config_file.write_text("value: 1\nitems: [a, b]\n")
+        loader._read_yaml_cached(config_file)
+        assert (tmp_path / "cached.yaml.cache").exists()
+
+        with patch.dict(loader._YAML_CACHE, clear=True), patch("app.config.loader.yaml.load", wraps=yaml.load) as mock_load:
+            assert loader._read_yaml_cached(config_file) == {"value": 1, "items": ["a", "b"]}
+            mock_load.assert_not_called()
+
+        # A cache written by another Python version is ignored
+        cache_file = tmp_path / "cached.yaml.cache"
+        blob = bytearray(cache_file.read_bytes())
+        blob[loader._DISK_CACHE_HEADER.size - 1] ^= 0xFF
+        cache_file.write_bytes(bytes(blob))
+        with patch.dict(loader._YAML_CACHE, clear=True), patch("app.config.loader.yaml.load", wraps=yaml.load) as mock_load:
+            assert loader._read_yaml_cached(config_file) == {"value": 1, "items": ["a", "b"]}
+            assert mock_load.call_count == 1
 
     def test_environment_variable_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test environment variable override capability."""
@@ -148,13 +223,24 @@ class TestConfigLoader:
         assert config is not None
         # Environment variable support will be tested in integration tests
 
+    def test_reload_config_replaces_shared_instance(self) -> None:
+        """Test that reload_config() installs a fresh instance for later get_config() calls."""
+        with patch.object(loader, "_CONFIG", None):
+            before = get_config()
+            reloaded = reload_config()
+
+            assert reloaded is not before
+            assert get_config() is reloaded
+
     def test_config_reload_not_allowed(self) -> None:
-        """Test that config cannot be reloaded (singleton enforcement)."""
-        config1 = Config()
-        config2 = Config()
+        """Test that repeated get_config() calls never reload configuration."""
+        config1 = get_config()
+        with patch.object(Config, "load_yaml") as mock_load:
+            config2 = get_config()
 
-        # Modifying one should affect the other (same instance)
+        # Same instance, nothing re-read
         assert config1 is config2
+        mock_load.assert_not_called()
 
 
 class TestConfigYAMLFiles:
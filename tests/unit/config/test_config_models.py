@@ -0,0 +1,37 @@
+"""
+Unit tests for configuration validation models.
+
+Tests deferred schema building and validation rules.
+"""
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from app.config.models import SalaryExpectationsConfig, SearchConfig
+
+
+class TestConfigModels:
+    """Test configuration model validation."""
+
+    def test_search_yaml_validates(self) -> None:
+        """Test search.yaml validates against SearchConfig."""
+        with open("config/search.yaml") as f:
+            data = yaml.safe_load(f)
+
+        search = SearchConfig.model_validate(data)
+
+        assert search.salary_expectations.minimum <= search.salary_expectations.maximum
+        assert SearchConfig.__pydantic_complete__
+
+    def test_salary_target_below_minimum_rejected(self) -> None:
+        """Test field validators still run with deferred schema building."""
+        with pytest.raises(ValidationError, match="target must be >= minimum"):
+            SalaryExpectationsConfig(minimum=900, target=800, maximum=1500)
+
+    def test_config_models_are_frozen(self) -> None:
+        """Test validated config models cannot be modified."""
+        salary = SalaryExpectationsConfig(minimum=800, target=1000, maximum=1500)
+
+        with pytest.raises(ValidationError, match="frozen"):
+            salary.minimum = 900
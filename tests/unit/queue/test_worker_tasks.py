@@ -5,7 +5,7 @@ from uuid import uuid4
 
 import pytest
 
-from app.job_queue.worker_tasks import process_job
+from app.job_queue.worker_tasks import get_application_repository, get_job_processor, process_job
 
 
 class TestProcessJob:
@@ -115,3 +115,52 @@ class TestProcessJob:
                         assert "status" in result
                         assert "job_id" in result
                         assert result["job_id"] == job_id
+
+    @pytest.mark.parametrize("job_id", ["550e8400e29b41d4a716446655440000", "{550e8400-e29b-41d4-a716-446655440000}", "550e8400-e29b-41d4-a716-44665544000g", ""])
+    def test_process_job_rejects_non_canonical_job_id(self, job_id):
+        """Test process_job only accepts the hyphenated UUID form the queue sends."""
+        with pytest.raises(ValueError, match="Invalid UUID format"):
+            process_job(job_id)
+
+    def test_process_job_passes_job_id_string_through(self):
+        """Test process_job hands the validated job_id string to the processor and repository."""
+        job_id = str(uuid4())
+
+        with patch("app.job_queue.worker_tasks.get_application_repository") as mock_get_app_repo, patch("app.job_queue.worker_tasks.get_job_processor") as mock_get_processor:
+            mock_get_processor.return_value.process_job.return_value = {"status": "success"}
+
+            process_job(job_id)
+
+            mock_get_processor.return_value.process_job.assert_called_once_with(job_id)
+            mock_get_app_repo.return_value.update_status.assert_called_with(job_id, "completed")
+
+    def test_process_job_normalizes_job_id_to_lowercase(self):
+        """Test an uppercase job_id is passed on in the lowercase form job IDs are stored in."""
+        job_id = str(uuid4())
+
+        with patch("app.job_queue.worker_tasks.get_application_repository"), patch("app.job_queue.worker_tasks.get_job_processor") as mock_get_processor:
+            mock_get_processor.return_value.process_job.return_value = {"status": "success"}
+
+            process_job(job_id.upper())
+
+            mock_get_processor.return_value.process_job.assert_called_once_with(job_id)
+
+    def test_job_processor_built_once_per_process(self):
+        """Test repositories and the job processor are shared across tasks."""
+        get_application_repository.cache_clear()
+        get_job_processor.cache_clear()
+        try:
+            with patch("app.job_queue.worker_tasks.JobsRepository") as mock_jobs_repo_class, patch("app.job_queue.worker_tasks.ApplicationRepository") as mock_app_repo_class:
+                with patch("app.job_queue.worker_tasks.JobProcessorService") as mock_processor_class:
+                    mock_processor_class.return_value.process_job.return_value = {"status": "success"}
+
+                    process_job(str(uuid4()))
+                    process_job(str(uuid4()))
+
+                    mock_jobs_repo_class.assert_called_once_with()
+                    mock_app_repo_class.assert_called_once_with()
+                    mock_processor_class.assert_called_once_with(jobs_repository=mock_jobs_repo_class.return_value, application_repository=mock_app_repo_class.return_value)
+                    assert mock_processor_class.return_value.process_job.call_count == 2
+        finally:
+            get_application_repository.cache_clear()
+            get_job_processor.cache_clear()
@@ -121,6 +121,53 @@ class TestApplicationRepositoryUpdate:
         assert "job_matcher_agent" in updated_app.completed_stages
         assert updated_app.stage_outputs["job_matcher_agent"] == stage_output
 
+    def test_update_application_stage_sets_status_in_same_update(self, repos, sample_application):
+        """Test that update_application_stage can also set status."""
+        app_id = repos["applications"].insert_application(sample_application)
+
+        repos["applications"].update_application_stage(app_id, "job_matcher_agent", {"match_score": 0.85}, status="matched")
+        updated_app = repos["applications"].get_application_by_id(app_id)
+        assert updated_app.status == "matched"
+        assert "job_matcher_agent" in updated_app.completed_stages
+
+        repos["applications"].update_application_stage(app_id, "salary_validator", {"salary_aud_per_day": 950})
+        updated_app = repos["applications"].get_application_by_id(app_id)
+        assert updated_app.status == "matched"
+        assert updated_app.current_stage == "salary_validator"
+
+    def test_apply_stage_result_records_stage_and_status(self, repos, sample_application):
+        """Test that apply_stage_result writes the stage and status together."""
+        app_id = repos["applications"].insert_application(sample_application)
+
+        repos["applications"].apply_stage_result(app_id, "job_matcher", {"match_score": 0.85}, "matched")
+
+        updated_app = repos["applications"].get_application_by_id(app_id)
+        assert updated_app.status == "matched"
+        assert updated_app.current_stage == "job_matcher"
+        assert updated_app.stage_outputs["job_matcher"] == {"match_score": 0.85}
+
+    @pytest.mark.asyncio
+    async def test_agent_apply_stage_result_writes_through_repository(self, repos, sample_application):
+        """Test that BaseAgent._apply_stage_result records the stage with the real repository."""
+        from app.agents.base_agent import AgentResult, BaseAgent
+
+        class StageAgent(BaseAgent):
+            @property
+            def agent_name(self) -> str:
+                return "stage_agent"
+
+            async def process(self, job_id: str) -> AgentResult:
+                return AgentResult(success=True, agent_name=self.agent_name, output={}, error_message=None, execution_time_ms=0)
+
+        app_id = repos["applications"].insert_application(sample_application)
+        agent = StageAgent(config={}, claude_client=None, app_repository=repos["applications"])
+
+        await agent._apply_stage_result(app_id, "stage_agent", {"checked": True}, status="rejected")
+
+        updated_app = repos["applications"].get_application_by_id(app_id)
+        assert updated_app.status == "rejected"
+        assert "stage_agent" in updated_app.completed_stages
+
     def test_update_application_error_sets_error_info(self, repos, sample_application):
         """Test that update_application_error sets error information."""
         app_id = repos["applications"].insert_application(sample_application)
@@ -175,6 +222,31 @@ class TestApplicationRepositoryList:
         assert len(second_page) == 2
         assert first_page[0].application_id != second_page[0].application_id
 
+    def test_list_with_count_returns_page_and_total(self, repos, sample_job):
+        """Test listing a page of applications with the filtered total in one call."""
+        for status in ["discovered", "matched", "matched", "matched"]:
+            repos["applications"].insert_application(Application(job_id=sample_job.job_id, status=status))
+
+        applications, total = repos["applications"].list_with_count(filters={"status": "matched"}, limit=2)
+        _, beyond_total = repos["applications"].list_with_count(filters={"status": "matched"}, offset=10)
+
+        assert len(applications) == 2
+        assert all(app.status == "matched" for app in applications)
+        assert total == 3
+        assert beyond_total == 3
+
+    def test_list_raw_with_count_matches_to_dict(self, repos, sample_job):
+        """Test raw application dictionaries match Application.to_dict() for the same page."""
+        application = Application(job_id=sample_job.job_id, status="matched", completed_stages=["job_matcher"], stage_outputs={"job_matcher": {"match_score": 0.9}})
+        repos["applications"].insert_application(application)
+        repos["applications"].update_application_error(application.application_id, "salary_validator", "ValueError", "bad salary")
+
+        raw_applications, total = repos["applications"].list_raw_with_count()
+        applications, _ = repos["applications"].list_with_count()
+
+        assert total == 1
+        assert raw_applications == [app.to_dict() for app in applications]
+
 
 class TestApplicationCascadeDelete:
     """Test cascade delete behavior."""
@@ -4,10 +4,12 @@ Unit tests for database module.
 Tests database connection, initialization, and schema creation.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import duckdb
 import pytest
 
-from app.repositories.database import create_indexes, create_tables, get_connection, get_database_info, initialize_database
+from app.repositories.database import ThreadConnection, create_indexes, create_tables, get_connection, get_database_info, initialize_database
 
 
 class TestDatabaseConnection:
@@ -32,6 +34,28 @@ class TestDatabaseConnection:
         # Should return same connection (thread-safe singleton-like behavior)
         assert conn1 is conn2
 
+    def test_each_thread_gets_its_own_connection(self) -> None:
+        """Test that other threads get separate connections to the same database."""
+        initialize_database()
+        get_connection().execute("INSERT INTO jobs (job_id, platform_source, company_name, job_title, job_url) VALUES ('job-1', 'seek', 'Acme', 'Engineer', 'https://seek.com.au/1')")
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other_conn, other_count = pool.submit(lambda: (get_connection(), get_connection().execute("SELECT COUNT(*) FROM jobs").fetchone()[0])).result()
+
+        assert other_conn is not get_connection()
+        assert other_count == 1
+
+    def test_thread_connection_queries_safely_from_many_threads(self) -> None:
+        """Test that a shared ThreadConnection can run concurrent queries."""
+        initialize_database()
+        conn = ThreadConnection()
+
+        def count_tables(_: int) -> int:
+            return conn.execute("SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?", ["jobs"]).fetchone()[0]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert set(pool.map(count_tables, range(200))) == {1}
+
 
 class TestDatabaseInitialization:
     """Test database initialization functionality."""
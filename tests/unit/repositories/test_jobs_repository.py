@@ -190,6 +190,36 @@ class TestJobsRepositoryList:
         assert len(linkedin_jobs) == 1
         assert linkedin_jobs[0].platform_source == "linkedin"
 
+    def test_list_with_count_returns_page_and_total(self, jobs_repo):
+        """Test listing a page of jobs with the filtered total in one call."""
+        for i in range(5):
+            jobs_repo.insert_job(Job(company_name=f"Company {i}", job_title=f"Engineer {i}", job_url=f"https://linkedin.com/jobs/test-{i}", platform_source="linkedin"))
+        jobs_repo.insert_job(Job(company_name="SEEK Company", job_title="Engineer", job_url="https://seek.com/jobs/test-seek", platform_source="seek"))
+
+        jobs, total = jobs_repo.list_with_count(filters={"platform_source": "linkedin"}, limit=2, offset=2)
+
+        assert total == 5
+        assert [j.job_url for j in jobs] == [j.job_url for j in jobs_repo.list_jobs(filters={"platform_source": "linkedin"}, limit=2, offset=2)]
+
+    def test_list_with_count_past_last_page(self, jobs_repo, sample_job):
+        """Test the total is still reported for a page beyond the last job."""
+        jobs_repo.insert_job(sample_job)
+
+        assert jobs_repo.list_with_count(offset=10) == ([], 1)
+        assert jobs_repo.list_with_count(filters={"platform_source": "seek"}) == ([], 0)
+
+    def test_list_raw_with_count_matches_to_dict(self, jobs_repo, sample_job):
+        """Test raw job dictionaries match Job.to_dict() for the same page."""
+        sample_job.salary_aud_per_day = Decimal("950.50")
+        jobs_repo.insert_job(sample_job)
+        jobs_repo.insert_job(Job(company_name="Company 2", job_title="Data Analyst", job_url="https://linkedin.com/jobs/test-job-456", platform_source="linkedin"))
+
+        raw_jobs, total = jobs_repo.list_raw_with_count(limit=10)
+        jobs, _ = jobs_repo.list_with_count(limit=10)
+
+        assert total == 2
+        assert raw_jobs == [job.to_dict() for job in jobs]
+
 
 class TestSQLInjectionSecurityValidation:
     """Test security validation for SQL injection vulnerabilities."""
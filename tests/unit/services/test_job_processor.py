@@ -0,0 +1,44 @@
+"""
+Unit tests for JobProcessorService.
+
+Tests agent shutdown at the end of the pipeline.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.agents.base_agent import AgentResult
+from app.services.job_processor import JobProcessorService
+
+
+@pytest.fixture
+def processor():
+    """Provide JobProcessorService with mock repositories and Claude client."""
+    return JobProcessorService(MagicMock(), MagicMock(), claude_client=MagicMock())
+
+
+@pytest.mark.asyncio
+class TestPipelineShutdown:
+    """Test agents are shut down when the pipeline ends."""
+
+    async def test_pipeline_closes_or_flushes_each_agent(self, processor):
+        """Test agents with close() are closed and the rest are flushed."""
+        result = AgentResult(success=True, agent_name="job_matcher", output={}, error_message=None, execution_time_ms=0)
+        closable = MagicMock(spec=["process", "flush", "close"], process=AsyncMock(return_value=result), flush=AsyncMock(), close=AsyncMock())
+        flushable = MagicMock(spec=["process", "flush"], process=AsyncMock(return_value=result), flush=AsyncMock())
+
+        await processor._run_agent_pipeline_async("job-123", {"job_matcher": flushable, "form_handler": closable})
+
+        closable.close.assert_awaited_once_with()
+        closable.flush.assert_not_awaited()
+        flushable.flush.assert_awaited_once_with()
+
+    async def test_pipeline_closes_agents_after_failure(self, processor):
+        """Test agents are still closed when an agent raises."""
+        closable = MagicMock(spec=["process", "close"], process=AsyncMock(side_effect=RuntimeError("boom")), close=AsyncMock())
+
+        outcome = await processor._run_agent_pipeline_async("job-123", {"job_matcher": closable})
+
+        assert outcome["status"] == "failed"
+        closable.close.assert_awaited_once_with()
@@ -5,7 +5,7 @@ Tests browser automation functionality for web form submission.
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.playwright_service import PlaywrightService, FormFieldMappings
 
@@ -99,6 +99,16 @@ class TestBrowserManagement:
 
         mock_browser.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_close_page_closes_context(self, playwright_service):
+        """Test closing a page closes its browser context."""
+        mock_page = MagicMock()
+        mock_page.context.close = AsyncMock()
+
+        await playwright_service.close_page(mock_page)
+
+        mock_page.context.close.assert_called_once()
+
 
 class TestPageNavigation:
     """Test page navigation functionality."""
@@ -138,6 +148,8 @@ class TestPageNavigation:
         with pytest.raises(TimeoutError):
             await playwright_service.navigate_to_form(mock_browser, url)
 
+        mock_context.close.assert_called_once()
+
 
 class TestFormFieldDetection:
     """Test form field detection logic."""
@@ -0,0 +1,30 @@
+"""
+Unit tests for shared JSON serialization helpers.
+
+Tests compact encoding and decoding with or without orjson.
+"""
+
+import json
+
+import pytest
+
+from app.serialization import json_dumps, json_loads
+
+
+class TestSerialization:
+    """Test json_dumps and json_loads."""
+
+    def test_dumps_writes_compact_utf8_bytes(self):
+        """Test output is compact UTF-8 JSON bytes."""
+        assert json_dumps({"status": "ok", "city": "Sydney – CBD"}) == '{"status":"ok","city":"Sydney – CBD"}'.encode()
+
+    def test_round_trip(self):
+        """Test decoding returns what was encoded."""
+        data = {"must_have_found": ["Python", "SQL"], "score": 0.85, "remote": True, "notes": None}
+
+        assert json_loads(json_dumps(data)) == data
+
+    def test_invalid_json_raises_stdlib_error(self):
+        """Test invalid input raises json.JSONDecodeError whichever backend is used."""
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("{not json")